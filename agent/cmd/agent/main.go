@@ -21,6 +21,7 @@ func main() {
 	var cfgPath string
 	var listenAddrOverride string
 	var panelPathOverride string
+	var sdkPathOverride string
 	var panelTokenOverride string
 	var sdkTokenOverride string
 	var redisAddrOverride string
@@ -36,6 +37,7 @@ func main() {
 	flag.StringVar(&cfgPath, "config", "", "agent config file path (json)")
 	flag.StringVar(&listenAddrOverride, "listen-addr", "", "agent ws server listen address, e.g. :8080")
 	flag.StringVar(&panelPathOverride, "panel-path", "", "panel ws path, e.g. /ws/panel")
+	flag.StringVar(&sdkPathOverride, "sdk-path", "", "sdk reverse-connect ws path, e.g. /ws/sdk")
 	flag.StringVar(&panelTokenOverride, "panel-token", "", "panel auth token")
 	flag.StringVar(&sdkTokenOverride, "sdk-token", "", "default sdk auth token for upstream dials")
 	flag.StringVar(&redisAddrOverride, "redis-addr", "", "redis address")
@@ -62,6 +64,9 @@ func main() {
 	if panelPathOverride != "" {
 		cfg.Server.PanelPath = panelPathOverride
 	}
+	if sdkPathOverride != "" {
+		cfg.Server.SDKPath = sdkPathOverride
+	}
 	if panelTokenOverride != "" {
 		cfg.Server.PanelAuthToken = panelTokenOverride
 	}
@@ -131,6 +136,9 @@ func main() {
 	if cfg.Server.PanelPath == "" {
 		cfg.Server.PanelPath = "/ws/panel"
 	}
+	if cfg.Server.SDKPath == "" {
+		cfg.Server.SDKPath = "/ws/sdk"
+	}
 	if cfg.Server.ListenAddr == "" {
 		cfg.Server.ListenAddr = ":8080"
 	}
@@ -199,6 +207,7 @@ func main() {
 	if cfg.Server.Enabled {
 		mux := http.NewServeMux()
 		mux.HandleFunc(cfg.Server.PanelPath, hub.HandlePanel)
+		mux.HandleFunc(cfg.Server.SDKPath, hub.HandleSDK)
 		mux.HandleFunc("/healthz", func(w http.ResponseWriter, _ *http.Request) {
 			w.WriteHeader(http.StatusOK)
 			_, _ = w.Write([]byte("ok"))
@@ -210,7 +219,7 @@ func main() {
 		}
 
 		go func() {
-			log.Printf("agent ws server listening on %s%s", cfg.Server.ListenAddr, cfg.Server.PanelPath)
+			log.Printf("agent ws server listening on %s%s (sdk: %s)", cfg.Server.ListenAddr, cfg.Server.PanelPath, cfg.Server.SDKPath)
 			if serveErr := server.ListenAndServe(); serveErr != nil && serveErr != http.ErrServerClosed {
 				errCh <- serveErr
 			}
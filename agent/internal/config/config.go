@@ -21,6 +21,7 @@ type ServerConfig struct {
 	Host                string `json:"host"`
 	Port                int    `json:"port"`
 	PanelPath           string `json:"panel_path"`
+	SDKPath             string `json:"sdk_path"`
 	PanelAuthToken      string `json:"panel_auth_token"`
 	DefaultSDKAuthToken string `json:"default_sdk_auth_token"`
 }
@@ -53,6 +54,7 @@ func Default() Config {
 			Enabled:             true,
 			ListenAddr:          ":8080",
 			PanelPath:           "/ws/panel",
+			SDKPath:             "/ws/sdk",
 			PanelAuthToken:      os.Getenv("PANEL_AUTH_TOKEN"),
 			DefaultSDKAuthToken: os.Getenv("SDK_AUTH_TOKEN"),
 		},
@@ -91,6 +93,9 @@ func Load(path string) (Config, error) {
 	if cfg.Server.PanelPath == "" {
 		cfg.Server.PanelPath = "/ws/panel"
 	}
+	if cfg.Server.SDKPath == "" {
+		cfg.Server.SDKPath = "/ws/sdk"
+	}
 	if cfg.Server.ListenAddr == "" {
 		if cfg.Server.Host != "" && cfg.Server.Port > 0 {
 			cfg.Server.ListenAddr = fmt.Sprintf("%s:%d", cfg.Server.Host, cfg.Server.Port)
@@ -15,8 +15,9 @@ import (
 )
 
 type clientConn struct {
-	conn *websocket.Conn
-	mu   sync.Mutex
+	conn    *websocket.Conn
+	mu      sync.Mutex
+	reverse bool
 }
 
 func (c *clientConn) WriteJSON(v any) error {
@@ -131,6 +132,53 @@ func (h *Hub) HandlePanel(w http.ResponseWriter, r *http.Request) {
 	h.readPanel(client)
 }
 
+func (h *Hub) HandleSDK(w http.ResponseWriter, r *http.Request) {
+	if h.sdkToken != "" && r.Header.Get("Authorization") != "Bearer "+h.sdkToken {
+		log.Printf("sdk unauthorized: remote=%s", r.RemoteAddr)
+		http.Error(w, "unauthorized", http.StatusUnauthorized)
+		return
+	}
+
+	conn, err := h.upgrader.Upgrade(w, r, nil)
+	if err != nil {
+		log.Printf("upgrade sdk ws failed: %v", err)
+		return
+	}
+	client := &clientConn{conn: conn, reverse: true}
+
+	var env protocol.Envelope
+	if err := conn.ReadJSON(&env); err != nil {
+		log.Printf("recv sdk register failed: remote=%s err=%v", r.RemoteAddr, err)
+		_ = conn.Close()
+		return
+	}
+	var p protocol.RegisterPayload
+	if env.Type == "register" {
+		_ = json.Unmarshal(env.Payload, &p)
+	}
+	if p.TargetID == "" {
+		log.Printf("sdk must register first: remote=%s type=%s", r.RemoteAddr, env.Type)
+		_ = conn.Close()
+		return
+	}
+	h.logEvent("recv sdk->agent", env)
+
+	h.sdkMu.Lock()
+	prev := h.sdks[p.TargetID]
+	h.sdks[p.TargetID] = client
+	h.sdkMu.Unlock()
+	if prev != nil {
+		_ = prev.conn.Close()
+	}
+	if p.SDKURL != "" {
+		_ = h.store.SetRoute(r.Context(), p.TargetID, p.SDKURL)
+	}
+	log.Printf("sdk connected(reverse): target_id=%s remote=%s metadata=%v", p.TargetID, r.RemoteAddr, p.Metadata)
+
+	h.broadcast(env)
+	h.readSDK(p.TargetID, client)
+}
+
 func (h *Hub) readPanel(client *clientConn) {
 	defer func() {
 		h.panelMu.Lock()
@@ -200,22 +248,25 @@ func (h *Hub) handleAction(ctx context.Context, env protocol.Envelope) error {
 		return err
 	}
 
-	targetURL := payload.TargetURL
-	if targetURL == "" && env.TargetID != "" {
-		targetURL, err = h.store.GetRoute(ctx, env.TargetID)
+	sdkConn := h.connectedSDK(env.TargetID)
+	if sdkConn == nil {
+		targetURL := payload.TargetURL
+		if targetURL == "" && env.TargetID != "" {
+			targetURL, err = h.store.GetRoute(ctx, env.TargetID)
+			if err != nil {
+				return err
+			}
+		}
+		if targetURL == "" {
+			return errors.New("missing target url")
+		}
+		log.Printf("resolve route: target_id=%s target_url=%s msg_id=%s", env.TargetID, targetURL, env.MsgID)
+
+		sdkConn, err = h.ensureSDKConn(ctx, env.TargetID, targetURL, h.getRouteAuthToken(env.TargetID))
 		if err != nil {
 			return err
 		}
 	}
-	if targetURL == "" {
-		return errors.New("missing target url")
-	}
-	log.Printf("resolve route: target_id=%s target_url=%s msg_id=%s", env.TargetID, targetURL, env.MsgID)
-
-	sdkConn, err := h.ensureSDKConn(ctx, env.TargetID, targetURL, h.getRouteAuthToken(env.TargetID))
-	if err != nil {
-		return err
-	}
 
 	if err := sdkConn.WriteJSON(env); err != nil {
 		return err
@@ -227,6 +278,15 @@ func (h *Hub) handleAction(ctx context.Context, env protocol.Envelope) error {
 	return nil
 }
 
+func (h *Hub) connectedSDK(targetID string) *clientConn {
+	if targetID == "" {
+		return nil
+	}
+	h.sdkMu.RLock()
+	defer h.sdkMu.RUnlock()
+	return h.sdks[targetID]
+}
+
 func (h *Hub) ensureSDKConn(ctx context.Context, targetID, targetURL, authToken string) (*clientConn, error) {
 	h.sdkMu.RLock()
 	if conn, ok := h.sdks[targetID]; ok {
@@ -268,7 +328,13 @@ func (h *Hub) ensureSDKConn(ctx context.Context, targetID, targetURL, authToken
 func (h *Hub) readSDK(targetID string, client *clientConn) {
 	defer func() {
 		h.sdkMu.Lock()
-		if cur, ok := h.sdks[targetID]; ok && cur == client {
+		if client.reverse {
+			for id, cur := range h.sdks {
+				if cur == client {
+					delete(h.sdks, id)
+				}
+			}
+		} else if cur, ok := h.sdks[targetID]; ok && cur == client {
 			delete(h.sdks, targetID)
 		}
 		h.sdkMu.Unlock()
@@ -285,9 +351,17 @@ func (h *Hub) readSDK(targetID string, client *clientConn) {
 		h.logEvent("recv sdk->agent", env)
 		if env.Type == "register" {
 			var p protocol.RegisterPayload
-			if err := json.Unmarshal(env.Payload, &p); err == nil && p.TargetID != "" && p.SDKURL != "" {
-				_ = h.store.SetRoute(context.Background(), p.TargetID, p.SDKURL)
-				log.Printf("register route from sdk: target_id=%s sdk_url=%s", p.TargetID, p.SDKURL)
+			if err := json.Unmarshal(env.Payload, &p); err == nil && p.TargetID != "" {
+				if p.SDKURL != "" {
+					_ = h.store.SetRoute(context.Background(), p.TargetID, p.SDKURL)
+					log.Printf("register route from sdk: target_id=%s sdk_url=%s", p.TargetID, p.SDKURL)
+				}
+				if client.reverse {
+					h.sdkMu.Lock()
+					h.sdks[p.TargetID] = client
+					h.sdkMu.Unlock()
+					log.Printf("register target on reverse sdk conn: target_id=%s", p.TargetID)
+				}
 			}
 		}
 		if env.Type == "action_ack" {
@@ -0,0 +1,363 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import heapq
+import itertools
+import json
+import math
+import multiprocessing
+import queue
+import random
+import signal
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from amonitor_sdk.server import SDKServer
+
+LatencySampler = Callable[[random.Random], float]
+
+STAT_KEYS = (
+    "servers",
+    "targets",
+    "connections",
+    "heartbeats",
+    "events",
+    "events_dropped",
+    "actions",
+    "action_failures",
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Simulate a fleet of SDK targets from a gen_scale_config.py config"
+    )
+    parser.add_argument("--config", required=True, help="Path to demo config json")
+    parser.add_argument("--workers", type=int, default=1, help="worker processes (shards)")
+    parser.add_argument(
+        "--heartbeat-interval",
+        type=float,
+        help="override heartbeat_interval from the config",
+    )
+    parser.add_argument(
+        "--event-rate",
+        type=float,
+        default=0.0,
+        help="events/s per target (Poisson arrivals), unless the instance sets event_rate",
+    )
+    parser.add_argument("--event-bytes", type=int, default=0, help="padding added to each event")
+    parser.add_argument(
+        "--action-latency",
+        default="fixed:0",
+        help="action handler latency in ms: fixed:MS, uniform:LO:HI, exp:MEAN, "
+        "lognormal:MEDIAN:SIGMA (unless the instance sets action_latency)",
+    )
+    parser.add_argument(
+        "--action-failure-rate",
+        type=float,
+        default=0.0,
+        help="fraction of actions answered with ok=false",
+    )
+    parser.add_argument("--report-interval", type=float, default=5.0)
+    parser.add_argument("--seed", type=int, help="seed per-target random streams")
+    return parser
+
+
+def parse_latency(spec: str) -> LatencySampler:
+    kind, _, rest = spec.partition(":")
+    try:
+        values = [float(value) for value in rest.split(":")] if rest else []
+    except ValueError:
+        raise ValueError(f"invalid latency spec: {spec}") from None
+    if kind == "fixed" and len(values) == 1:
+        (fixed,) = values
+        return lambda rng: fixed
+    if kind == "uniform" and len(values) == 2:
+        low, high = values
+        return lambda rng: rng.uniform(low, high)
+    if kind == "exp" and len(values) == 1 and values[0] > 0:
+        (mean,) = values
+        return lambda rng: rng.expovariate(1 / mean)
+    if kind == "lognormal" and len(values) == 2 and values[0] > 0:
+        median, sigma = values
+        mu = math.log(median)
+        return lambda rng: rng.lognormvariate(mu, sigma)
+    raise ValueError(f"invalid latency spec: {spec}")
+
+
+@dataclass(slots=True)
+class SimTarget:
+    target_id: str
+    path: str | None
+    event_rate: float
+    action_latency: str
+    action_failure_rate: float
+    rng: random.Random
+
+
+@dataclass(slots=True)
+class ServerGroup:
+    host: str
+    port: int
+    heartbeat_interval: float
+    targets: list[SimTarget]
+
+
+def build_groups(config: dict[str, Any], args: argparse.Namespace) -> list[ServerGroup]:
+    shared = config.get("sdk_hosting") == "shared"
+    groups: dict[tuple[str, int], ServerGroup] = {}
+    for index, sdk in enumerate(config["sdk_instances"]):
+        seed = None if args.seed is None else args.seed * 1_000_003 + index
+        target = SimTarget(
+            target_id=sdk["target_id"],
+            path=sdk.get("path") if shared else None,
+            event_rate=float(sdk.get("event_rate", args.event_rate)),
+            action_latency=sdk.get("action_latency", args.action_latency),
+            action_failure_rate=float(sdk.get("action_failure_rate", args.action_failure_rate)),
+            rng=random.Random(seed),
+        )
+        parse_latency(target.action_latency)
+        key = (sdk["host"], int(sdk["port"]))
+        group = groups.get(key)
+        if group is None:
+            interval = args.heartbeat_interval or float(sdk.get("heartbeat_interval", 5))
+            group = groups[key] = ServerGroup(key[0], key[1], interval, [])
+        elif not shared:
+            raise ValueError(f"port {key[1]} is used by more than one sdk instance")
+        group.targets.append(target)
+    return list(groups.values())
+
+
+def make_handler(target: SimTarget) -> Any:
+    sample = parse_latency(target.action_latency)
+    rng = target.rng
+
+    async def on_action(action: str, params: dict[str, Any]) -> dict[str, Any]:
+        delay = sample(rng)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if rng.random() < target.action_failure_rate:
+            return {"ok": False, "message": f"simulated failure action={action}"}
+        return {"ok": True, "message": f"simulated action={action}"}
+
+    return on_action
+
+
+def build_server(group: ServerGroup) -> SDKServer:
+    first, *rest = group.targets
+    server = SDKServer(
+        host=group.host,
+        port=group.port,
+        target_id=first.target_id,
+        action_handler=make_handler(first),
+        heartbeat_interval=group.heartbeat_interval,
+        dispatch_mode="concurrent",
+        target_path=first.path,
+    )
+    for target in rest:
+        server.add_target(target.target_id, make_handler(target), path=target.path)
+    return server
+
+
+async def drive_events(
+    members: list[tuple[SDKServer, SimTarget]],
+    padding: str,
+) -> None:
+    loop = asyncio.get_running_loop()
+    now = loop.time()
+    seq = itertools.count()
+    heap = [
+        (now + target.rng.expovariate(target.event_rate), next(seq), server, target)
+        for server, target in members
+        if target.event_rate > 0
+    ]
+    heapq.heapify(heap)
+    counters: dict[str, int] = {}
+    while heap:
+        delay = heap[0][0] - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        now = loop.time()
+        while heap and heap[0][0] <= now:
+            due, _, server, target = heapq.heappop(heap)
+            count = counters[target.target_id] = counters.get(target.target_id, 0) + 1
+            data: dict[str, Any] = {"seq": count, "value": target.rng.random()}
+            if padding:
+                data["padding"] = padding
+            server.try_emit("simulated", data, target_id=target.target_id)
+            heapq.heappush(
+                heap,
+                (
+                    max(due, now - 1) + target.rng.expovariate(target.event_rate),
+                    next(seq),
+                    server,
+                    target,
+                ),
+            )
+
+
+def collect_stats(servers: list[SDKServer]) -> dict[str, int]:
+    totals = dict.fromkeys(STAT_KEYS, 0)
+    totals["servers"] = len(servers)
+    for server in servers:
+        stats = server.stats()
+        totals["targets"] += stats["targets"]
+        totals["connections"] += stats["connections"]
+        totals["heartbeats"] += stats["heartbeat"]["heartbeats"]
+        outbound = stats["outbound"]
+        totals["events_dropped"] += outbound.get("dropped_oldest", 0) + outbound.get(
+            "dropped_new", 0
+        )
+        for target in server.targets.values():
+            totals["events"] += target.counters["events"]
+            totals["actions"] += target.counters["actions"]
+            totals["action_failures"] += target.counters["action_failures"]
+    return totals
+
+
+async def wait_started(servers: list[SDKServer], tasks: list[asyncio.Task[None]]) -> None:
+    # A server that fails to bind never sets `started`; surface its error instead of hanging.
+    waiters = {asyncio.ensure_future(server.started.wait()) for server in servers}
+    try:
+        while waiters:
+            done, _ = await asyncio.wait(waiters | set(tasks), return_when=asyncio.FIRST_COMPLETED)
+            for task in tasks:
+                if task in done:
+                    raise task.exception() or RuntimeError("server stopped before starting")
+            waiters -= done
+    finally:
+        for waiter in waiters:
+            waiter.cancel()
+
+
+async def run_shard(
+    groups: list[ServerGroup],
+    args: argparse.Namespace,
+    report: Callable[[dict[str, int]], None],
+) -> None:
+    servers = [build_server(group) for group in groups]
+    tasks = [asyncio.create_task(server.run()) for server in servers]
+    try:
+        await wait_started(servers, tasks)
+        members = [
+            (server, target)
+            for server, group in zip(servers, groups, strict=True)
+            for target in group.targets
+        ]
+        tasks.append(asyncio.create_task(drive_events(members, "x" * args.event_bytes)))
+        while True:
+            await asyncio.sleep(args.report_interval)
+            report(collect_stats(servers))
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def format_stats(totals: dict[str, int], previous: dict[str, int], interval: float) -> str:
+    rates = {
+        name: (totals[name] - previous.get(name, 0)) / interval
+        for name in ("heartbeats", "events", "actions")
+    }
+    return (
+        f"[fleet] servers={totals['servers']} targets={totals['targets']} "
+        f"connections={totals['connections']} "
+        f"heartbeats/s={rates['heartbeats']:.0f} events/s={rates['events']:.0f} "
+        f"actions/s={rates['actions']:.1f} action_failures={totals['action_failures']} "
+        f"events_dropped={totals['events_dropped']}"
+    )
+
+
+def run_worker(
+    shard: int,
+    groups: list[ServerGroup],
+    args: argparse.Namespace,
+    reports: Any,
+) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    try:
+        asyncio.run(run_shard(groups, args, lambda totals: reports.put((shard, totals))))
+    except OSError as exc:
+        reports.put((shard, {"error": str(exc)}))
+
+
+def run_single(groups: list[ServerGroup], args: argparse.Namespace) -> None:
+    previous: dict[str, int] = {}
+
+    def report(totals: dict[str, int]) -> None:
+        nonlocal previous
+        print(format_stats(totals, previous, args.report_interval), flush=True)
+        previous = totals
+
+    asyncio.run(run_shard(groups, args, report))
+
+
+def run_sharded(groups: list[ServerGroup], args: argparse.Namespace) -> None:
+    reports: Any = multiprocessing.Queue()
+    workers = [
+        multiprocessing.Process(
+            target=run_worker,
+            args=(shard, groups[shard :: args.workers], args, reports),
+            daemon=True,
+        )
+        for shard in range(args.workers)
+    ]
+    for worker in workers:
+        worker.start()
+    latest: dict[int, dict[str, int]] = {}
+    previous: dict[str, int] = {}
+    try:
+        while True:
+            deadline = time.monotonic() + args.report_interval
+            while (remaining := deadline - time.monotonic()) > 0:
+                try:
+                    shard, totals = reports.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if "error" in totals:
+                    raise RuntimeError(f"shard {shard} failed: {totals['error']}")
+                latest[shard] = totals
+            if any(not worker.is_alive() for worker in workers):
+                raise RuntimeError("a fleet worker exited early")
+            if len(latest) < len(workers):
+                continue
+            combined = {name: sum(totals[name] for totals in latest.values()) for name in STAT_KEYS}
+            print(format_stats(combined, previous, args.report_interval), flush=True)
+            previous = combined
+    finally:
+        for worker in workers:
+            if worker.is_alive():
+                worker.terminate()
+        for worker in workers:
+            worker.join(timeout=5)
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if args.workers < 1:
+        raise ValueError("workers must be >= 1")
+    config = json.loads(Path(args.config).read_text(encoding="utf-8"))
+    groups = build_groups(config, args)
+    args.workers = min(args.workers, len(groups))
+    print(
+        f"[fleet] simulating {len(config['sdk_instances'])} targets on {len(groups)} servers "
+        f"across {args.workers} worker(s)",
+        flush=True,
+    )
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        if args.workers == 1:
+            run_single(groups, args)
+        else:
+            run_sharded(groups, args)
+    except KeyboardInterrupt:
+        print("\n[fleet] stopping by user", flush=True)
+
+
+if __name__ == "__main__":
+    main()
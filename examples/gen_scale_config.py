@@ -14,6 +14,11 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--action-name", default="restart")
     parser.add_argument("--agent-listen-addr", default="127.0.0.1:8080")
     parser.add_argument("--panel-ws", default="ws://127.0.0.1:8080/ws/panel")
+    parser.add_argument(
+        "--shared-process",
+        action="store_true",
+        help="host all targets in one SDK process on --start-port, routed by URL path",
+    )
     return parser
 
 
@@ -24,17 +29,20 @@ def main() -> None:
 
     sdk_instances = []
     for index in range(1, args.count + 1):
-        sdk_instances.append(
-            {
-                "name": f"sdk-{index:02d}",
-                "target_id": f"demo-target-{index:02d}",
-                "host": "127.0.0.1",
-                "port": args.start_port + index - 1,
-                "heartbeat_interval": args.heartbeat_interval,
-            }
-        )
+        target_id = f"demo-target-{index:02d}"
+        instance = {
+            "name": f"sdk-{index:02d}",
+            "target_id": target_id,
+            "host": "127.0.0.1",
+            "port": args.start_port if args.shared_process else args.start_port + index - 1,
+            "heartbeat_interval": args.heartbeat_interval,
+        }
+        if args.shared_process:
+            instance["path"] = f"/{target_id}"
+        sdk_instances.append(instance)
 
     config = {
+        "sdk_hosting": "shared" if args.shared_process else "per_process",
         "agent": {
             "listen_addr": args.agent_listen_addr,
             "panel_ws": args.panel_ws,
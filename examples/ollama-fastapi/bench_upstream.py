@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any
+
+import httpx
+
+from ollama_monitor_app import RuntimeState, UpstreamConfig, iter_ollama_stream
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Compare per-call and pooled upstream clients against a fake Ollama backend"
+    )
+    parser.add_argument("--requests", type=int, default=2000, help="requests per mode")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--tokens", type=int, default=8, help="NDJSON lines per response")
+    parser.add_argument("--token-delay-ms", type=float, default=0.0, help="delay between lines")
+    parser.add_argument("--max-connections", type=int, default=8)
+    parser.add_argument("--port", type=int, default=18434)
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    return parser
+
+
+class FakeOllama:
+    def __init__(self, tokens: int, token_delay: float = 0.0) -> None:
+        lines = [{"response": f"tok{i} ", "done": False} for i in range(tokens)]
+        lines.append(
+            {
+                "response": "",
+                "done": True,
+                "eval_count": tokens,
+                "eval_duration": int(max(token_delay, 0.001) * tokens * 1e9),
+            }
+        )
+        self.chunks = [
+            f"{len(line):x}\r\n".encode() + line + b"\r\n"
+            for line in (json.dumps(item).encode() + b"\n" for item in lines)
+        ]
+        self.chunks.append(b"0\r\n\r\n")
+        self.head = (
+            b"HTTP/1.1 200 OK\r\n"
+            b"Content-Type: application/x-ndjson\r\n"
+            b"Transfer-Encoding: chunked\r\n\r\n"
+        )
+        self.token_delay = token_delay
+        self.connections = 0
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    name, _, value = line.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        length = int(value)
+                await reader.readexactly(length)
+                if not self.token_delay:
+                    writer.write(self.head + b"".join(self.chunks))
+                    await writer.drain()
+                    continue
+                writer.write(self.head)
+                for chunk in self.chunks:
+                    writer.write(chunk)
+                    await writer.drain()
+                    await asyncio.sleep(self.token_delay)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def per_call_stream(state: RuntimeState, prompt: str) -> tuple[str, int]:
+    payload = {"model": state.model, "prompt": prompt, "stream": True}
+    full_text: list[str] = []
+    token_chars = 0
+    async with httpx.AsyncClient(timeout=None) as client:
+        url = f"{state.ollama_base_url.rstrip('/')}/api/generate"
+        async with client.stream("POST", url, json=payload) as response:
+            async for line in response.aiter_lines():
+                if not line:
+                    continue
+                token = json.loads(line).get("response", "")
+                if token:
+                    full_text.append(token)
+                    token_chars += len(token)
+    return "".join(full_text), token_chars
+
+
+async def pooled_stream(state: RuntimeState, prompt: str) -> tuple[str, int]:
+    full_text: list[str] = []
+    async for _, item in iter_ollama_stream(state, prompt, None, None):
+        full_text.append(item.get("response", ""))
+    text = "".join(full_text)
+    return text, len(text)
+
+
+async def run_mode(name: str, args: argparse.Namespace) -> dict[str, Any]:
+    backend = FakeOllama(args.tokens, args.token_delay_ms / 1000)
+    server = await asyncio.start_server(backend.handle, "127.0.0.1", args.port)
+    state = RuntimeState(
+        service_name="bench",
+        model="fake",
+        ollama_base_url=f"http://127.0.0.1:{args.port}",
+        upstream=UpstreamConfig(
+            max_connections=args.max_connections,
+            max_keepalive_connections=args.max_connections,
+        ),
+    )
+    state.http = state.upstream.build_client(state.ollama_base_url)
+    call = per_call_stream if name == "per_call" else pooled_stream
+    latencies: list[float] = []
+    peak_connections = 0
+    remaining = args.requests
+
+    async def worker() -> None:
+        nonlocal remaining, peak_connections
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            await call(state, "bench")
+            latencies.append((time.perf_counter() - started) * 1000)
+            peak_connections = max(peak_connections, state.snapshot()["upstream_connections"])
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - started
+    await state.http.aclose()
+    server.close()
+    await server.wait_closed()
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "requests_per_s": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "backend_connections": backend.connections,
+        "peak_pool_connections": peak_connections,
+    }
+
+
+async def run(args: argparse.Namespace) -> dict[str, dict[str, Any]]:
+    return {name: await run_mode(name, args) for name in ("per_call", "pooled")}
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    results = asyncio.run(run(args))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'mode':<10}{'requests':>10}{'req/s':>10}{'p50_ms':>9}{'p99_ms':>9}{'conns':>8}")
+    for name, row in results.items():
+        print(
+            f"{name:<10}{row['requests']:>10}{row['requests_per_s']:>10.0f}"
+            f"{row['p50_ms']:>9.2f}{row['p99_ms']:>9.2f}{row['backend_connections']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,16 @@ import json
 import os
 import subprocess
 import time
+from bisect import bisect_left
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import aclosing, asynccontextmanager
 from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 
@@ -18,6 +22,7 @@ class GenerateRequest(BaseModel):
     prompt: str = Field(min_length=1)
     system: str | None = None
     options: dict[str, Any] | None = None
+    stream: bool = False
 
 
 class ActionRequest(BaseModel):
@@ -25,6 +30,124 @@ class ActionRequest(BaseModel):
     value: Any | None = None
 
 
+LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000, 120000)
+TOKEN_RATE_BUCKETS = (1, 5, 10, 20, 50, 100, 200, 500, 1000)
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 30000)
+
+
+class Histogram:
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.bounds = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                return self.bounds[index] if index < len(self.bounds) else float("inf")
+        return float("inf")
+
+    def reset(self) -> None:
+        self.counts = [0] * len(self.counts)
+        self.sum = 0.0
+        self.count = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        # inf is not valid JSON; report the top bucket bound for the overflow bucket.
+        return {
+            "buckets": list(self.bounds),
+            "counts": list(self.counts),
+            "sum": self.sum,
+            "count": self.count,
+            "p50": min(self.quantile(0.5), self.bounds[-1]),
+            "p95": min(self.quantile(0.95), self.bounds[-1]),
+        }
+
+
+def env_timeout(name: str, default: str) -> float | None:
+    value = float(os.getenv(name, default))
+    return value if value > 0 else None
+
+
+@dataclass
+class UpstreamTiming:
+    requested: float = 0.0
+    acquired: float | None = None
+    sent: float | None = None
+    connects: int = 0
+
+    async def trace(self, event_name: str, info: dict[str, Any]) -> None:
+        # httpcore only starts writing headers once it holds a pooled (or new) connection.
+        if event_name == "connection.connect_tcp.complete":
+            self.connects += 1
+        elif event_name.endswith(".send_request_headers.started"):
+            self.acquired = time.perf_counter()
+        elif event_name.endswith(".send_request_body.complete"):
+            self.sent = time.perf_counter()
+
+
+@dataclass
+class UpstreamConfig:
+    max_connections: int = 10
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    connect_timeout: float | None = 5.0
+    read_timeout: float | None = 300.0
+    pool_timeout: float | None = 30.0
+
+    @classmethod
+    def from_env(cls) -> UpstreamConfig:
+        max_connections = max(1, int(os.getenv("OLLAMA_MAX_CONNECTIONS", "10")))
+        return cls(
+            max_connections=max_connections,
+            max_keepalive_connections=max(
+                0, int(os.getenv("OLLAMA_MAX_KEEPALIVE", str(max_connections)))
+            ),
+            keepalive_expiry=float(os.getenv("OLLAMA_KEEPALIVE_EXPIRY_S", "30")),
+            connect_timeout=env_timeout("OLLAMA_CONNECT_TIMEOUT_S", "5"),
+            read_timeout=env_timeout("OLLAMA_READ_TIMEOUT_S", "300"),
+            pool_timeout=env_timeout("OLLAMA_POOL_TIMEOUT_S", "30"),
+        )
+
+    def build_client(self, base_url: str) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=base_url.rstrip("/"),
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                connect=self.connect_timeout,
+                read=self.read_timeout,
+                write=self.connect_timeout,
+                pool=self.pool_timeout,
+            ),
+        )
+
+
+def pool_usage(client: httpx.AsyncClient | None, active: int) -> tuple[int, int]:
+    # httpx does not expose pool state. Read the httpcore pool behind the transport when the
+    # private layout is still there; otherwise report the connections this app knows are busy.
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if not isinstance(connections, list):
+        return active, 0
+    idle = sum(1 for connection in connections if getattr(connection, "is_idle", bool)())
+    return len(connections), idle
+
+
 @dataclass
 class RuntimeState:
     service_name: str
@@ -36,18 +159,65 @@ class RuntimeState:
     in_progress_requests: int = 0
     total_requests: int = 0
     failed_requests: int = 0
+    cancelled_requests: int = 0
 
     total_token_chars: int = 0
     last_request_token_chars: int = 0
+    total_tokens: int = 0
+    last_request_tokens: int = 0
+
+    ttft_ms: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS_MS))
+    tokens_per_s: Histogram = field(default_factory=lambda: Histogram(TOKEN_RATE_BUCKETS))
+    duration_ms: Histogram = field(default_factory=lambda: Histogram(LATENCY_BUCKETS_MS))
+    upstream_wait_ms: Histogram = field(default_factory=lambda: Histogram(WAIT_BUCKETS_MS))
 
     gpu_utilization: int = -1
     updated_at_ms: int = 0
 
+    upstream: UpstreamConfig = field(default_factory=UpstreamConfig)
+    http: httpx.AsyncClient | None = None
+    upstream_requests: int = 0
+    upstream_in_flight: int = 0
+    upstream_active: int = 0
+    upstream_connects: int = 0
+
     clients: set[WebSocket] = field(default_factory=set)
-    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
     semaphore: asyncio.Semaphore = field(default_factory=lambda: asyncio.Semaphore(1))
+    dirty: asyncio.Event = field(default_factory=asyncio.Event)
+
+    def touch(self) -> None:
+        self.updated_at_ms = int(time.time() * 1000)
+        self.dirty.set()
+
+    def record_generation(
+        self,
+        duration: float,
+        first_token: float | None,
+        token_chars: int,
+        final: dict[str, Any],
+        sent: float = 0.0,
+    ) -> None:
+        self.total_requests += 1
+        self.total_token_chars += token_chars
+        self.last_request_token_chars = token_chars
+        self.duration_ms.observe(duration * 1000)
+        if first_token is not None:
+            self.ttft_ms.observe((first_token - sent) * 1000)
+        eval_count = final.get("eval_count")
+        if isinstance(eval_count, int):
+            self.total_tokens += eval_count
+            self.last_request_tokens = eval_count
+            eval_duration = final.get("eval_duration")
+            if isinstance(eval_duration, int) and eval_duration > 0:
+                seconds = eval_duration / 1e9
+            else:
+                seconds = duration - (first_token or 0)
+            if eval_count and seconds > 0:
+                self.tokens_per_s.observe(eval_count / seconds)
+        self.touch()
 
     def snapshot(self) -> dict[str, Any]:
+        connections, idle = pool_usage(self.http, self.upstream_active)
         return {
             "service_name": self.service_name,
             "model": self.model,
@@ -55,10 +225,24 @@ class RuntimeState:
             "in_progress_requests": self.in_progress_requests,
             "total_requests": self.total_requests,
             "failed_requests": self.failed_requests,
+            "cancelled_requests": self.cancelled_requests,
             "total_token_chars": self.total_token_chars,
             "last_request_token_chars": self.last_request_token_chars,
+            "total_tokens": self.total_tokens,
+            "last_request_tokens": self.last_request_tokens,
+            "ttft_ms": self.ttft_ms.snapshot(),
+            "tokens_per_s": self.tokens_per_s.snapshot(),
+            "duration_ms": self.duration_ms.snapshot(),
+            "upstream_wait_ms": self.upstream_wait_ms.snapshot(),
             "gpu_utilization": self.gpu_utilization,
             "max_concurrency": self.max_concurrency,
+            "upstream_requests": self.upstream_requests,
+            "upstream_in_flight": self.upstream_in_flight,
+            "upstream_active": self.upstream_active,
+            "upstream_connects": self.upstream_connects,
+            "upstream_connections": connections,
+            "upstream_idle_connections": idle,
+            "upstream_max_connections": self.upstream.max_connections,
             "updated_at_ms": self.updated_at_ms,
         }
 
@@ -97,8 +281,46 @@ async def safe_broadcast(state: RuntimeState, message: dict[str, Any]) -> None:
         state.clients.discard(client)
 
 
-async def broadcast_metrics(state: RuntimeState) -> None:
-    await safe_broadcast(state, {"type": "metrics", "payload": state.snapshot()})
+class MetricsPublisher:
+    def __init__(self, state: RuntimeState, interval: float, delta: bool = False) -> None:
+        self.state = state
+        self.interval = interval
+        self.delta = delta
+        self.published = 0
+        self._last_sent: dict[str, Any] = {}
+
+    async def run(self, stop_event: asyncio.Event) -> None:
+        while not stop_event.is_set():
+            dirty_wait = asyncio.create_task(self.state.dirty.wait())
+            stop_wait = asyncio.create_task(stop_event.wait())
+            await asyncio.wait({dirty_wait, stop_wait}, return_when=asyncio.FIRST_COMPLETED)
+            dirty_wait.cancel()
+            stop_wait.cancel()
+            if stop_event.is_set():
+                break
+            await self.publish()
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+        if self.state.dirty.is_set():
+            await self.publish()
+
+    async def publish(self) -> None:
+        self.state.dirty.clear()
+        snapshot = self.state.snapshot()
+        payload = snapshot
+        if self.delta:
+            payload = {
+                key: value
+                for key, value in snapshot.items()
+                if key == "service_name" or self._last_sent.get(key) != value
+            }
+            if len(payload) == 1:
+                return
+        self._last_sent = snapshot
+        self.published += 1
+        await safe_broadcast(self.state, {"type": "metrics", "payload": payload})
 
 
 async def broadcast_heartbeat(state: RuntimeState) -> None:
@@ -118,41 +340,51 @@ async def broadcast_heartbeat(state: RuntimeState) -> None:
 
 
 async def apply_action(state: RuntimeState, action: str, value: Any) -> dict[str, Any]:
-    async with state.lock:
-        if action == "reset_metrics":
-            state.pending_requests = 0
-            state.in_progress_requests = 0
-            state.total_requests = 0
-            state.failed_requests = 0
-            state.total_token_chars = 0
-            state.last_request_token_chars = 0
-            state.updated_at_ms = int(time.time() * 1000)
-            result = {"ok": True, "message": "metrics reset"}
-        elif action == "set_max_concurrency":
-            try:
-                new_value = int(value)
-            except Exception as exc:
-                raise HTTPException(status_code=400, detail=f"invalid value: {exc}") from exc
-            if new_value < 1:
-                raise HTTPException(status_code=400, detail="max_concurrency must be >= 1")
-            state.max_concurrency = new_value
-            state.semaphore = asyncio.Semaphore(new_value)
-            state.updated_at_ms = int(time.time() * 1000)
-            result = {"ok": True, "message": f"max_concurrency set to {new_value}"}
-        else:
-            raise HTTPException(status_code=400, detail=f"unsupported action: {action}")
+    if action == "reset_metrics":
+        state.pending_requests = 0
+        state.in_progress_requests = 0
+        state.total_requests = 0
+        state.failed_requests = 0
+        state.cancelled_requests = 0
+        state.total_token_chars = 0
+        state.last_request_token_chars = 0
+        state.total_tokens = 0
+        state.last_request_tokens = 0
+        for histogram in (
+            state.ttft_ms,
+            state.tokens_per_s,
+            state.duration_ms,
+            state.upstream_wait_ms,
+        ):
+            histogram.reset()
+        state.upstream_requests = 0
+        state.upstream_connects = 0
+        result = {"ok": True, "message": "metrics reset"}
+    elif action == "set_max_concurrency":
+        try:
+            new_value = int(value)
+        except Exception as exc:
+            raise HTTPException(status_code=400, detail=f"invalid value: {exc}") from exc
+        if new_value < 1:
+            raise HTTPException(status_code=400, detail="max_concurrency must be >= 1")
+        state.max_concurrency = new_value
+        state.semaphore = asyncio.Semaphore(new_value)
+        result = {"ok": True, "message": f"max_concurrency set to {new_value}"}
+    else:
+        raise HTTPException(status_code=400, detail=f"unsupported action: {action}")
+    state.touch()
 
     await safe_broadcast(state, {"type": "ack", "payload": {"action": action, **result}})
-    await broadcast_metrics(state)
     return result
 
 
-async def request_ollama_stream(
+async def iter_ollama_stream(
     state: RuntimeState,
     prompt: str,
     system: str | None,
     options: dict[str, Any] | None,
-) -> tuple[str, int]:
+    timing: UpstreamTiming | None = None,
+) -> AsyncIterator[tuple[str, dict[str, Any]]]:
     payload: dict[str, Any] = {
         "model": state.model,
         "prompt": prompt,
@@ -163,12 +395,22 @@ async def request_ollama_stream(
     if options:
         payload["options"] = options
 
-    full_text: list[str] = []
-    token_chars = 0
-
-    async with httpx.AsyncClient(timeout=None) as client:
-        url = f"{state.ollama_base_url.rstrip('/')}/api/generate"
-        async with client.stream("POST", url, json=payload) as response:
+    if state.http is None:
+        raise RuntimeError("upstream client is not started")
+    timing = timing or UpstreamTiming()
+    state.upstream_requests += 1
+    state.upstream_in_flight += 1
+    held = False
+    try:
+        timing.requested = time.perf_counter()
+        async with state.http.stream(
+            "POST", "/api/generate", json=payload, extensions={"trace": timing.trace}
+        ) as response:
+            held = True
+            state.upstream_active += 1
+            state.upstream_connects += timing.connects
+            if timing.acquired is not None:
+                state.upstream_wait_ms.observe((timing.acquired - timing.requested) * 1000)
             if response.status_code >= 400:
                 body = await response.aread()
                 raise HTTPException(status_code=502, detail=f"ollama error: {body.decode(errors='ignore')}")
@@ -180,12 +422,102 @@ async def request_ollama_stream(
                     item = json.loads(line)
                 except json.JSONDecodeError:
                     continue
-                token = item.get("response", "")
-                if token:
-                    full_text.append(token)
-                    token_chars += len(token)
+                if not isinstance(item, dict):
+                    continue
+                if "error" in item:
+                    raise HTTPException(status_code=502, detail=f"ollama error: {item['error']}")
+                yield line, item
+    except httpx.TimeoutException as exc:
+        raise HTTPException(status_code=504, detail=f"ollama timeout: {type(exc).__name__}") from exc
+    except httpx.TransportError as exc:
+        raise HTTPException(status_code=502, detail=f"ollama unreachable: {exc}") from exc
+    finally:
+        state.upstream_in_flight -= 1
+        if held:
+            state.upstream_active -= 1
+
+
+async def run_generation(
+    state: RuntimeState,
+    request: GenerateRequest,
+) -> AsyncGenerator[tuple[str, dict[str, Any]], None]:
+    started = time.perf_counter()
+    state.pending_requests += 1
+    state.touch()
+    semaphore = state.semaphore
+    try:
+        await semaphore.acquire()
+    finally:
+        state.pending_requests = max(0, state.pending_requests - 1)
 
-    return "".join(full_text), token_chars
+    first_token: float | None = None
+    token_chars = 0
+    final: dict[str, Any] = {}
+    timing = UpstreamTiming()
+    try:
+        state.in_progress_requests += 1
+        state.touch()
+        async for line, item in iter_ollama_stream(
+            state=state,
+            prompt=request.prompt,
+            system=request.system,
+            options=request.options,
+            timing=timing,
+        ):
+            token = item.get("response", "")
+            if token:
+                if first_token is None:
+                    first_token = time.perf_counter() - started
+                token_chars += len(token)
+            if item.get("done"):
+                final = item
+            yield line, item
+        sent = (timing.sent or started) - started
+        state.record_generation(
+            time.perf_counter() - started, first_token, token_chars, final, sent
+        )
+    except HTTPException:
+        state.failed_requests += 1
+        state.touch()
+        raise
+    except (asyncio.CancelledError, GeneratorExit):
+        state.cancelled_requests += 1
+        state.touch()
+        raise
+    except Exception as exc:
+        state.failed_requests += 1
+        state.touch()
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    finally:
+        state.in_progress_requests = max(0, state.in_progress_requests - 1)
+        state.touch()
+        semaphore.release()
+
+
+def encode_stream_item(line: str, item: dict[str, Any], sse: bool) -> str:
+    if not sse:
+        return line + "\n"
+    event = "done" if item.get("done") else "token"
+    return f"event: {event}\ndata: {line}\n\n"
+
+
+async def stream_generation(
+    first: tuple[str, dict[str, Any]] | None,
+    items: AsyncGenerator[tuple[str, dict[str, Any]], None],
+    sse: bool,
+) -> AsyncIterator[str]:
+    # Close the generation chain on client disconnect so the semaphore, in-progress
+    # count and upstream stream are released now rather than at GC finalisation.
+    async with aclosing(items):
+        if first is None:
+            return
+        yield encode_stream_item(*first, sse)
+        try:
+            async for line, item in items:
+                yield encode_stream_item(line, item, sse)
+        except HTTPException as exc:
+            error = json.dumps({"error": exc.detail, "done": True}, ensure_ascii=False)
+            yield f"event: error\ndata: {error}\n\n" if sse else error + "\n"
 
 
 def create_app(service_name: str) -> FastAPI:
@@ -193,16 +525,53 @@ def create_app(service_name: str) -> FastAPI:
     model = os.getenv("OLLAMA_MODEL", "qwen3:0.6b")
     max_concurrency = int(os.getenv("MAX_CONCURRENCY", "1"))
     cors_allow_origins = os.getenv("CORS_ALLOW_ORIGINS", "*")
+    metrics_interval_ms = int(os.getenv("METRICS_PUBLISH_INTERVAL_MS", "250"))
+    metrics_delta = os.getenv("METRICS_DELTA", "0").lower() in ("1", "true", "yes")
 
     state = RuntimeState(
         service_name=service_name,
         model=model,
         ollama_base_url=ollama_base_url,
         max_concurrency=max(1, max_concurrency),
+        upstream=UpstreamConfig.from_env(),
     )
     state.semaphore = asyncio.Semaphore(state.max_concurrency)
+    publisher = MetricsPublisher(
+        state,
+        interval=max(0, metrics_interval_ms) / 1000,
+        delta=metrics_delta,
+    )
+
+    stop_event = asyncio.Event()
+
+    async def gpu_loop() -> None:
+        while not stop_event.is_set():
+            gpu = await asyncio.to_thread(read_gpu_utilization_sync)
+            if gpu != state.gpu_utilization:
+                state.gpu_utilization = gpu
+                state.touch()
+            await broadcast_heartbeat(state)
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=2)
+            except asyncio.TimeoutError:
+                pass
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        state.http = state.upstream.build_client(state.ollama_base_url)
+        tasks = [
+            asyncio.create_task(gpu_loop()),
+            asyncio.create_task(publisher.run(stop_event)),
+        ]
+        try:
+            yield
+        finally:
+            stop_event.set()
+            await asyncio.gather(*tasks)
+            await state.http.aclose()
+            state.http = None
 
-    app = FastAPI(title=f"AMonitor Ollama Service - {service_name}")
+    app = FastAPI(title=f"AMonitor Ollama Service - {service_name}", lifespan=lifespan)
 
     allow_origins = [origin.strip() for origin in cors_allow_origins.split(",") if origin.strip()]
     if not allow_origins:
@@ -215,98 +584,47 @@ def create_app(service_name: str) -> FastAPI:
         allow_headers=["*"],
     )
 
-    stop_event = asyncio.Event()
-
-    @app.on_event("startup")
-    async def on_startup() -> None:
-        async def gpu_loop() -> None:
-            while not stop_event.is_set():
-                gpu = await asyncio.to_thread(read_gpu_utilization_sync)
-                async with state.lock:
-                    state.gpu_utilization = gpu
-                    state.updated_at_ms = int(time.time() * 1000)
-                await broadcast_metrics(state)
-                await broadcast_heartbeat(state)
-                try:
-                    await asyncio.wait_for(stop_event.wait(), timeout=2)
-                except asyncio.TimeoutError:
-                    pass
-
-        app.state.gpu_task = asyncio.create_task(gpu_loop())
-
-    @app.on_event("shutdown")
-    async def on_shutdown() -> None:
-        stop_event.set()
-        task = getattr(app.state, "gpu_task", None)
-        if task:
-            await task
-
     @app.get("/healthz")
     async def healthz() -> dict[str, str]:
         return {"status": "ok"}
 
     @app.get("/api/metrics")
     async def metrics() -> dict[str, Any]:
-        async with state.lock:
-            return state.snapshot()
+        return state.snapshot()
 
     @app.post("/api/action")
     async def action(request: ActionRequest) -> dict[str, Any]:
         return await apply_action(state, request.action, request.value)
 
-    @app.post("/api/generate")
-    async def generate(request: GenerateRequest) -> dict[str, Any]:
-        async with state.lock:
-            state.pending_requests += 1
-            state.updated_at_ms = int(time.time() * 1000)
-        await broadcast_metrics(state)
-
-        await state.semaphore.acquire()
-        try:
-            async with state.lock:
-                state.pending_requests = max(0, state.pending_requests - 1)
-                state.in_progress_requests += 1
-                state.updated_at_ms = int(time.time() * 1000)
-            await broadcast_metrics(state)
-
-            text, token_chars = await request_ollama_stream(
-                state=state,
-                prompt=request.prompt,
-                system=request.system,
-                options=request.options,
+    @app.post("/api/generate", response_model=None)
+    async def generate(
+        request: GenerateRequest,
+        http_request: Request,
+    ) -> dict[str, Any] | StreamingResponse:
+        items = run_generation(state, request)
+        if request.stream:
+            sse = "text/event-stream" in http_request.headers.get("accept", "")
+            first = await anext(items, None)
+            return StreamingResponse(
+                stream_generation(first, items, sse),
+                media_type="text/event-stream" if sse else "application/x-ndjson",
+                headers={"X-Service-Name": state.service_name, "Cache-Control": "no-cache"},
             )
 
-            async with state.lock:
-                state.total_requests += 1
-                state.total_token_chars += token_chars
-                state.last_request_token_chars = token_chars
-                state.updated_at_ms = int(time.time() * 1000)
-
-            await broadcast_metrics(state)
-            return {
-                "service_name": state.service_name,
-                "model": state.model,
-                "text": text,
-                "token_chars": token_chars,
-            }
-        except HTTPException:
-            async with state.lock:
-                state.failed_requests += 1
-                state.updated_at_ms = int(time.time() * 1000)
-            await broadcast_metrics(state)
-            raise
-        except Exception as exc:
-            async with state.lock:
-                state.failed_requests += 1
-                state.updated_at_ms = int(time.time() * 1000)
-            await broadcast_metrics(state)
-            raise HTTPException(status_code=500, detail=str(exc)) from exc
-        finally:
-            async with state.lock:
-                state.in_progress_requests = max(0, state.in_progress_requests - 1)
-                state.updated_at_ms = int(time.time() * 1000)
-            state.semaphore.release()
-            await broadcast_metrics(state)
+        text: list[str] = []
+        final: dict[str, Any] = {}
+        async for _, item in items:
+            text.append(item.get("response", ""))
+            if item.get("done"):
+                final = item
+        token_chars = sum(len(token) for token in text)
+        return {
+            "service_name": state.service_name,
+            "model": state.model,
+            "text": "".join(text),
+            "token_chars": token_chars,
+            "tokens": final.get("eval_count"),
+        }
 
     @app.websocket("/ws/monitor")
     async def ws_monitor(websocket: WebSocket) -> None:
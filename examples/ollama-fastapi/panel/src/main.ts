@@ -92,6 +92,15 @@ function setStatus(text: string, className: string): void {
   statusEl.className = className;
 }
 
+const latestMetrics = new Map<string, Record<string, unknown>>();
+
+function mergeMetrics(payload: Record<string, unknown>, replace: boolean): Record<string, unknown> {
+  const key = String(payload.service_name ?? "");
+  const merged = replace ? { ...payload } : { ...latestMetrics.get(key), ...payload };
+  latestMetrics.set(key, merged);
+  return merged;
+}
+
 function updateMetrics(payload: Record<string, unknown>): void {
   serviceNameEl.textContent = String(payload.service_name ?? "-");
   modelNameEl.textContent = String(payload.model ?? "-");
@@ -132,7 +141,7 @@ function connect(): void {
         return;
       }
       if (envelope.type === "metrics" || envelope.type === "welcome") {
-        updateMetrics(envelope.payload);
+        updateMetrics(mergeMetrics(envelope.payload, envelope.type === "welcome"));
       }
     } catch {
       appendLog("消息解析失败");
@@ -300,7 +300,7 @@ unset ALL_PROXY all_proxy HTTP_PROXY HTTPS_PROXY http_proxy https_proxy
 export NO_PROXY=127.0.0.1,localhost
 unset VIRTUAL_ENV
 
-UV_PY_RUN=(uv run --project "$ROOT_DIR/python-sdk" --with httpx)
+UV_PY_RUN=(uv run --project "$ROOT_DIR/python-sdk" --extra fastapi)
 
 PIDS=()
 cleanup() {
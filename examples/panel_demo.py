@@ -35,7 +35,7 @@ async def send_initial_actions(
             "payload": {
                 "action": action_name,
                 "params": {"source": "panel-demo", "sdk": target["name"]},
-                "target_url": f"ws://{target['host']}:{target['port']}",
+                "target_url": f"ws://{target['host']}:{target['port']}{target.get('path', '')}",
             },
         }
         await websocket.send(json.dumps(envelope, ensure_ascii=False))
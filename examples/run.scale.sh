@@ -8,7 +8,13 @@ HEARTBEAT_INTERVAL="${SDK_HEARTBEAT_INTERVAL:-5}"
 ACTION_NAME="${ACTION_NAME:-restart}"
 AGENT_LISTEN_ADDR="${AGENT_LISTEN_ADDR:-127.0.0.1:8080}"
 PANEL_WS="${PANEL_WS:-ws://127.0.0.1:8080/ws/panel}"
+SHARED_PROCESS="${SDK_SHARED_PROCESS:-0}"
+FLEET_WORKERS="${SDK_FLEET_WORKERS:-0}"
 TMP_CONFIG="$ROOT_DIR/examples/.generated.scale.config.json"
+SHARED_ARGS=()
+if [ "$SHARED_PROCESS" = "1" ]; then
+  SHARED_ARGS=(--shared-process)
+fi
 
 cd "$ROOT_DIR/python-sdk"
 uv sync
@@ -21,7 +27,8 @@ env -u ALL_PROXY -u all_proxy -u HTTP_PROXY -u HTTPS_PROXY -u http_proxy -u http
     --heartbeat-interval "$HEARTBEAT_INTERVAL" \
     --action-name "$ACTION_NAME" \
     --agent-listen-addr "$AGENT_LISTEN_ADDR" \
-    --panel-ws "$PANEL_WS"
+    --panel-ws "$PANEL_WS" \
+    ${SHARED_ARGS[@]+"${SHARED_ARGS[@]}"}
 
 env -u ALL_PROXY -u all_proxy -u HTTP_PROXY -u HTTPS_PROXY -u http_proxy -u https_proxy NO_PROXY=127.0.0.1,localhost \
-  uv run python ../examples/run_demo.py --config "$TMP_CONFIG"
+  uv run python ../examples/run_demo.py --config "$TMP_CONFIG" --simulate-fleet "$FLEET_WORKERS"
@@ -11,6 +11,13 @@ from pathlib import Path
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="One-click local demo runner")
     parser.add_argument("--config", required=True, help="Path to demo config json")
+    parser.add_argument(
+        "--simulate-fleet",
+        type=int,
+        default=0,
+        metavar="WORKERS",
+        help="host all sdk_instances in fleet_sim.py with this many worker processes",
+    )
     return parser
 
 
@@ -74,8 +81,35 @@ def main() -> None:
 
         time.sleep(1)
 
-        for sdk in sdk_instances:
-            print(f"[demo] starting sdk: {sdk['name']}", flush=True)
+        shared = config.get("sdk_hosting") == "shared"
+        hosted = sdk_instances[:1] if shared else sdk_instances
+        if args.simulate_fleet:
+            hosted = []
+            print(f"[demo] starting simulated fleet for {len(sdk_instances)} targets", flush=True)
+            processes.append(
+                subprocess.Popen(
+                    [
+                        "uv",
+                        "run",
+                        "python",
+                        "../examples/fleet_sim.py",
+                        "--config",
+                        str(config_path),
+                        "--workers",
+                        str(args.simulate_fleet),
+                    ],
+                    cwd=root_dir / "python-sdk",
+                    env=env,
+                )
+            )
+        for sdk in hosted:
+            extra_targets: list[str] = []
+            if shared:
+                for other in sdk_instances[1:]:
+                    extra_targets += ["--extra-target-id", other["target_id"]]
+                print(f"[demo] starting shared sdk for {len(sdk_instances)} targets", flush=True)
+            else:
+                print(f"[demo] starting sdk: {sdk['name']}", flush=True)
             processes.append(
                 subprocess.Popen(
                     [
@@ -93,6 +127,7 @@ def main() -> None:
                         str(sdk["port"]),
                         "--heartbeat-interval",
                         str(sdk.get("heartbeat_interval", 5)),
+                        *extra_targets,
                     ],
                     cwd=root_dir / "python-sdk",
                     env=env,
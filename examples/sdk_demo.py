@@ -1,9 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 from typing import Any
 
-from amonitor_sdk.server import start_server
+from amonitor_sdk.server import SDKServer
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -13,6 +14,12 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--target-id", required=True)
     parser.add_argument("--heartbeat-interval", type=int, default=5)
     parser.add_argument("--name", default="sdk-demo")
+    parser.add_argument(
+        "--extra-target-id",
+        action="append",
+        default=[],
+        help="additional target hosted by the same process, served on /<target_id>",
+    )
     return parser
 
 
@@ -30,13 +37,18 @@ def main() -> None:
         f"[{args.name}] start target_id={args.target_id} on ws://{args.host}:{args.port}",
         flush=True,
     )
-    start_server(
+    server = SDKServer(
         host=args.host,
         port=args.port,
         target_id=args.target_id,
         action_handler=on_action,
         heartbeat_interval=args.heartbeat_interval,
     )
+    for target_id in args.extra_target_id:
+        server.add_target(target_id, on_action)
+    if args.extra_target_id:
+        print(f"[{args.name}] hosting {len(server.targets)} targets", flush=True)
+    asyncio.run(server.run())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import time
+from typing import Any
+
+import websockets
+
+from amonitor_sdk.binary import BINARY_EVENTS_HEADER, BINARY_EVENTS_VERSION, decode_binary_event
+from amonitor_sdk.server import SDKServer
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Compare base64+JSON events with binary event frames over loopback"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4096, 65536, 1048576])
+    parser.add_argument("--events", type=int, default=200, help="events per size/mode")
+    parser.add_argument("--port", type=int, default=18767)
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    return parser
+
+
+async def handler(action: str, params: dict[str, Any]) -> dict[str, Any]:
+    return {"ok": True, "message": action}
+
+
+async def run_mode(mode: str, size: int, args: argparse.Namespace) -> dict[str, Any]:
+    server = SDKServer(
+        "127.0.0.1",
+        args.port,
+        "bench",
+        handler,
+        heartbeat_interval=3600,
+        outbound_max_events=args.events,
+    )
+    task = asyncio.create_task(server.run())
+    await server.started.wait()
+    buffer = os.urandom(size)
+    received_bytes = 0
+    async with websockets.connect(
+        f"ws://127.0.0.1:{args.port}/",
+        additional_headers={BINARY_EVENTS_HEADER: BINARY_EVENTS_VERSION},
+        compression=None,
+        max_size=None,
+    ) as websocket:
+        await websocket.recv()
+        started = time.perf_counter()
+        cpu_started = time.process_time()
+        for _ in range(args.events):
+            if mode == "binary":
+                server.try_emit_binary("blob", buffer)
+            else:
+                server.try_emit("blob", {"b64": base64.b64encode(buffer).decode()})
+        emitted = time.perf_counter() - started
+        for _ in range(args.events):
+            frame = await websocket.recv()
+            received_bytes += len(frame)
+            if mode == "binary":
+                data = decode_binary_event(frame).data
+            else:
+                data = base64.b64decode(json.loads(frame)["payload"]["data"]["b64"])
+            if len(data) != size:
+                raise RuntimeError("payload size mismatch")
+        elapsed = time.perf_counter() - started
+        cpu = time.process_time() - cpu_started
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    return {
+        "mode": mode,
+        "size": size,
+        "emit_us": emitted / args.events * 1e6,
+        "wire_bytes": received_bytes / args.events,
+        "overhead": received_bytes / args.events / size,
+        "cpu_us": cpu / args.events * 1e6,
+        "mb_per_s": size * args.events / elapsed / 1e6,
+    }
+
+
+async def run(args: argparse.Namespace) -> list[dict[str, Any]]:
+    rows = []
+    for size in args.sizes:
+        for mode in ("json_base64", "binary"):
+            rows.append(await run_mode(mode, size, args))
+    return rows
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    rows = asyncio.run(run(args))
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(
+        f"{'size':>9}  {'mode':<12}{'emit_us':>9}{'wire_bytes':>12}{'overhead':>10}"
+        f"{'cpu_us':>9}{'MB/s':>9}"
+    )
+    for row in rows:
+        print(
+            f"{row['size']:>9}  {row['mode']:<12}{row['emit_us']:>9.1f}{row['wire_bytes']:>12.0f}"
+            f"{row['overhead']:>10.3f}{row['cpu_us']:>9.1f}{row['mb_per_s']:>9.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any
+
+from amonitor_sdk.codec import Codec, JsonCodec, MsgpackCodec, ProtobufCodec
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Compare wire codec encode/decode cost and size")
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    return parser
+
+
+def sample_envelopes() -> dict[str, dict[str, Any]]:
+    return {
+        "heartbeat": {
+            "msg_id": "7f1f4b0e-3c1d-4d5e-9a77-2f0b3c4d5e6f",
+            "type": "heartbeat",
+            "target_id": "ollama-svc-a",
+            "timestamp": 1760000000000,
+            "payload": {"target_id": "ollama-svc-a", "status": "up"},
+        },
+        "action_ack": {
+            "msg_id": "0a1b2c3d-4e5f-6071-8293-a4b5c6d7e8f9",
+            "type": "action_ack",
+            "target_id": "ollama-svc-a",
+            "timestamp": 1760000000000,
+            "payload": {
+                "action_msg_id": "m-2001",
+                "success": True,
+                "message": "max_concurrency set to 2",
+            },
+        },
+        "event_small": {
+            "msg_id": "1b2c3d4e-5f60-7182-93a4-b5c6d7e8f90a",
+            "type": "event",
+            "target_id": "ollama-svc-a",
+            "timestamp": 1760000000000,
+            "payload": {
+                "target_id": "ollama-svc-a",
+                "event_name": "request_done",
+                "data": {"latency_ms": 184.2, "status": 200, "route": "/api/generate"},
+            },
+        },
+        "event_snapshot": {
+            "msg_id": "2c3d4e5f-6071-8293-a4b5-c6d7e8f90a1b",
+            "type": "event",
+            "target_id": "ollama-svc-a",
+            "timestamp": 1760000000000,
+            "payload": {
+                "target_id": "ollama-svc-a",
+                "event_name": "metrics",
+                "data": {
+                    "service_name": "ollama-svc-a",
+                    "model": "qwen3:0.6b",
+                    "queue_size": 3,
+                    "in_progress_requests": 2,
+                    "total_requests": 918273,
+                    "failed_requests": 12,
+                    "total_token_chars": 81726354,
+                    "last_request_token_chars": 1532,
+                    "gpu_utilization": 87,
+                    "max_concurrency": 4,
+                    "updated_at_ms": 1760000000000,
+                    "recent_latency_ms": [float(index) * 1.5 for index in range(64)],
+                },
+            },
+        },
+    }
+
+
+def available_codecs() -> list[Codec]:
+    codecs: list[Codec] = [JsonCodec()]
+    for factory in (MsgpackCodec, ProtobufCodec):
+        try:
+            codecs.append(factory())
+        except ImportError as exc:
+            print(f"skip {factory.name}: {exc}")
+    return codecs
+
+
+def measure(codec: Codec, envelope: dict[str, Any], iterations: int) -> dict[str, Any]:
+    frame = codec.encode(envelope)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        codec.encode(envelope)
+    encode_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        codec.decode(frame)
+    decode_s = time.perf_counter() - started
+
+    size = len(frame.encode()) if isinstance(frame, str) else len(frame)
+    return {
+        "encode_us": encode_s / iterations * 1e6,
+        "decode_us": decode_s / iterations * 1e6,
+        "bytes": size,
+    }
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    codecs = available_codecs()
+    results: dict[str, dict[str, Any]] = {}
+    for sample_name, envelope in sample_envelopes().items():
+        results[sample_name] = {
+            codec.name: measure(codec, envelope, args.iterations) for codec in codecs
+        }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'sample':<16}{'codec':<10}{'encode_us':>11}{'decode_us':>11}{'bytes':>8}")
+    for sample_name, by_codec in results.items():
+        for codec_name, row in by_codec.items():
+            print(
+                f"{sample_name:<16}{codec_name:<10}"
+                f"{row['encode_us']:>11.2f}{row['decode_us']:>11.2f}{row['bytes']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from websockets.extensions.permessage_deflate import PerMessageDeflate
+from websockets.frames import Frame, Opcode
+
+from amonitor_sdk.codec import JsonCodec
+from amonitor_sdk.compression import ZLIB, ZSTD, CompressedCodec, make_compressor
+
+LOREM = (
+    "The model streamed a long answer about queueing theory, tail latency and how "
+    "backpressure keeps a control plane responsive under bursty load. "
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Compare bandwidth and CPU of compression modes on representative payloads"
+    )
+    parser.add_argument("--messages", type=int, default=2000, help="messages per payload/mode")
+    parser.add_argument("--threshold", type=int, default=1024)
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    return parser
+
+
+def envelope(msg_type: str, payload: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "msg_id": str(uuid.uuid4()),
+        "type": msg_type,
+        "target_id": "ollama-svc-a",
+        "timestamp": int(time.time() * 1000),
+        "payload": payload,
+    }
+
+
+def heartbeat() -> dict[str, Any]:
+    return envelope(
+        "heartbeat",
+        {
+            "target_id": "ollama-svc-a",
+            "status": "up",
+            "metrics": {"actions": 1204, "events": 88231, "outbound_depth": 3},
+        },
+    )
+
+
+def ollama_snapshot() -> dict[str, Any]:
+    return envelope(
+        "event",
+        {
+            "target_id": "ollama-svc-a",
+            "event_name": "ollama_metrics",
+            "data": {
+                "service_name": "ollama-svc-a",
+                "model": "qwen2.5:7b",
+                "queue_size": 4,
+                "in_progress_requests": 2,
+                "total_requests": 10421,
+                "failed_requests": 12,
+                "total_token_chars": 8812331,
+                "last_request_token_chars": 1822,
+                "gpu_utilization": 87,
+                "max_concurrency": 2,
+                "updated_at_ms": int(time.time() * 1000),
+            },
+        },
+    )
+
+
+def generate_result() -> dict[str, Any]:
+    return envelope(
+        "event",
+        {
+            "target_id": "ollama-svc-a",
+            "event_name": "generate_done",
+            "data": {"prompt": "explain backpressure", "response": LOREM * 30},
+        },
+    )
+
+
+def event_batch() -> dict[str, Any]:
+    events = [
+        {
+            "msg_id": str(uuid.uuid4()),
+            "timestamp": int(time.time() * 1000) + index,
+            "event_name": "request_done",
+            "data": {"status": 200, "latency_ms": 12.5 + index % 7, "path": "/api/generate"},
+        }
+        for index in range(256)
+    ]
+    return envelope("event_batch", {"target_id": "ollama-svc-a", "events": events})
+
+
+PAYLOADS: dict[str, Callable[[], dict[str, Any]]] = {
+    "heartbeat": heartbeat,
+    "ollama_snapshot": ollama_snapshot,
+    "generate_result": generate_result,
+    "event_batch": event_batch,
+}
+
+
+def deflate_pair(context_takeover: bool) -> tuple[PerMessageDeflate, PerMessageDeflate]:
+    settings = {"level": 6, "memLevel": 5}
+    sender = PerMessageDeflate(not context_takeover, not context_takeover, 12, 12, settings)
+    receiver = PerMessageDeflate(not context_takeover, not context_takeover, 12, 12, settings)
+    return sender, receiver
+
+
+def run_deflate(
+    envelopes: list[dict[str, Any]], context_takeover: bool
+) -> tuple[int, float, float]:
+    codec = JsonCodec()
+    sender, receiver = deflate_pair(context_takeover)
+    frames: list[Frame] = []
+    started = time.perf_counter()
+    for item in envelopes:
+        text = codec.encode(item)
+        frames.append(sender.encode(Frame(Opcode.TEXT, text.encode())))
+    encoded = time.perf_counter() - started
+    started = time.perf_counter()
+    for frame in frames:
+        codec.decode(receiver.decode(frame).data)
+    decoded = time.perf_counter() - started
+    return sum(len(frame.data) for frame in frames), encoded, decoded
+
+
+def run_codec(envelopes: list[dict[str, Any]], codec: Any) -> tuple[int, float, float]:
+    started = time.perf_counter()
+    frames = [codec.encode(item) for item in envelopes]
+    encoded = time.perf_counter() - started
+    started = time.perf_counter()
+    for frame in frames:
+        codec.decode(frame)
+    decoded = time.perf_counter() - started
+    size = sum(len(frame.encode()) if isinstance(frame, str) else len(frame) for frame in frames)
+    return size, encoded, decoded
+
+
+def measure(
+    name: str, build: Callable[[], dict[str, Any]], args: argparse.Namespace
+) -> list[dict[str, Any]]:
+    envelopes = [build() for _ in range(args.messages)]
+    modes: dict[str, Callable[[], tuple[int, float, float]]] = {
+        "none": lambda: run_codec(envelopes, JsonCodec()),
+        "deflate": lambda: run_deflate(envelopes, context_takeover=True),
+        "deflate_no_ctx": lambda: run_deflate(envelopes, context_takeover=False),
+    }
+    for algorithm in (ZLIB, ZSTD):
+        try:
+            compressor = make_compressor(algorithm)
+        except ImportError:
+            continue
+        codec = CompressedCodec(JsonCodec(), compressor, threshold=args.threshold)
+        modes[f"{algorithm}>={args.threshold}"] = lambda codec=codec: run_codec(envelopes, codec)
+
+    rows = []
+    raw_size = None
+    for mode, run in modes.items():
+        gc.collect()
+        gc.disable()
+        try:
+            size, encoded, decoded = run()
+        finally:
+            gc.enable()
+        if raw_size is None:
+            raw_size = size
+        rows.append(
+            {
+                "payload": name,
+                "mode": mode,
+                "bytes_per_msg": size / args.messages,
+                "ratio": size / raw_size,
+                "encode_us": encoded / args.messages * 1e6,
+                "decode_us": decoded / args.messages * 1e6,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    rows = [row for name, build in PAYLOADS.items() for row in measure(name, build, args)]
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(f"{'payload':<17}{'mode':<16}{'bytes/msg':>10}{'ratio':>8}{'enc_us':>9}{'dec_us':>9}")
+    for row in rows:
+        print(
+            f"{row['payload']:<17}{row['mode']:<16}{row['bytes_per_msg']:>10.0f}"
+            f"{row['ratio']:>8.3f}{row['encode_us']:>9.1f}{row['decode_us']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
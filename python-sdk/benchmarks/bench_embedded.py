@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+from typing import Any
+
+from websockets.sync.client import connect
+
+from amonitor_sdk.embedded import EmbeddedServer
+from amonitor_sdk.server import SDKServer
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Measure cross-thread emit cost of the embedded SDK server"
+    )
+    parser.add_argument("--events", type=int, default=200000, help="events per producer thread")
+    parser.add_argument("--threads", type=int, default=4, help="producer threads")
+    parser.add_argument("--port", type=int, default=18765)
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    return parser
+
+
+def handler(action: str, params: dict[str, Any]) -> dict[str, Any]:
+    return {"ok": True, "message": action}
+
+
+def batched_emit(embedded: EmbeddedServer) -> Any:
+    return embedded.emit_event
+
+
+def per_event_emit(embedded: EmbeddedServer) -> Any:
+    loop = embedded.loop
+    try_emit = embedded.server.try_emit
+
+    def emit(event_name: str, data: dict[str, Any]) -> bool:
+        loop.call_soon_threadsafe(try_emit, event_name, data)
+        return True
+
+    return emit
+
+
+def count_received(url: str, stop: threading.Event, counter: list[int]) -> None:
+    with connect(url) as websocket:
+        while not stop.is_set():
+            try:
+                message = websocket.recv(timeout=0.2)
+            except TimeoutError:
+                continue
+            if '"type":"event"' in message or '"type": "event"' in message:
+                counter[0] += 1
+
+
+def run_mode(name: str, args: argparse.Namespace) -> dict[str, Any]:
+    server = SDKServer(
+        host="127.0.0.1",
+        port=args.port,
+        target_id="bench",
+        action_handler=handler,
+        outbound_max_events=args.events * args.threads,
+    )
+    embedded = EmbeddedServer(server, max_pending=args.events * args.threads).start()
+    received = [0]
+    stop = threading.Event()
+    reader = threading.Thread(
+        target=count_received,
+        args=(f"ws://127.0.0.1:{args.port}", stop, received),
+    )
+    reader.start()
+    while embedded.stats()["connections"] < 1:
+        time.sleep(0.01)
+
+    emit = batched_emit(embedded) if name == "batched" else per_event_emit(embedded)
+    caller_seconds = [0.0] * args.threads
+    data = {"latency_ms": 12.5, "status": 200}
+
+    def produce(index: int) -> None:
+        started = time.perf_counter()
+        for _ in range(args.events):
+            emit("tick", data)
+        caller_seconds[index] = time.perf_counter() - started
+
+    total = args.events * args.threads
+    started = time.perf_counter()
+    producers = [threading.Thread(target=produce, args=(i,)) for i in range(args.threads)]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+    produced_at = time.perf_counter()
+    deadline = produced_at + 30
+    while received[0] < total and time.perf_counter() < deadline:
+        time.sleep(0.005)
+    delivered_at = time.perf_counter()
+
+    stats = embedded.stats()
+    stop.set()
+    reader.join()
+    embedded.stop()
+    return {
+        "events": total,
+        "received": received[0],
+        "emit_ns": sum(caller_seconds) / total * 1e9,
+        "produce_s": produced_at - started,
+        "deliver_s": delivered_at - started,
+        "events_per_s": received[0] / (delivered_at - started),
+        "handoffs": stats["embedded"]["handoffs"] if name == "batched" else total,
+    }
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    results = {name: run_mode(name, args) for name in ("per_event", "batched")}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(
+        f"{'mode':<11}{'events':>9}{'received':>10}{'emit_ns':>10}{'handoffs':>10}{'events/s':>12}"
+    )
+    for name, row in results.items():
+        print(
+            f"{name:<11}{row['events']:>9}{row['received']:>10}{row['emit_ns']:>10.0f}"
+            f"{row['handoffs']:>10}{row['events_per_s']:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
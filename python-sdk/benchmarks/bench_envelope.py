@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from amonitor_sdk.codec import JsonCodec
+from amonitor_sdk.models import Envelope
+
+DATA = {"status": 200, "latency_ms": 12.5, "path": "/api/generate"}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Measure per-envelope construction and JSON encode cost"
+    )
+    parser.add_argument("--iterations", type=int, default=200000)
+    parser.add_argument("--repeat", type=int, default=5, help="best of N runs")
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    return parser
+
+
+def dict_event() -> dict[str, Any]:
+    return {
+        "msg_id": str(uuid.uuid4()),
+        "type": "event",
+        "target_id": "ollama-svc-a",
+        "timestamp": int(time.time() * 1000),
+        "payload": {"target_id": "ollama-svc-a", "event_name": "request_done", "data": DATA},
+    }
+
+
+def envelope_event() -> Envelope:
+    return Envelope.new(
+        "event",
+        target_id="ollama-svc-a",
+        payload={"target_id": "ollama-svc-a", "event_name": "request_done", "data": DATA},
+    )
+
+
+def dict_heartbeat() -> dict[str, Any]:
+    return {
+        "msg_id": str(uuid.uuid4()),
+        "type": "heartbeat",
+        "target_id": "ollama-svc-a",
+        "timestamp": int(time.time() * 1000),
+        "payload": {"target_id": "ollama-svc-a", "status": "up"},
+    }
+
+
+HEARTBEAT_PAYLOAD = {"target_id": "ollama-svc-a", "status": "up"}
+
+
+def envelope_heartbeat() -> Envelope:
+    return Envelope.new("heartbeat", target_id="ollama-svc-a", payload=HEARTBEAT_PAYLOAD)
+
+
+def legacy_encode(envelope: dict[str, Any]) -> str:
+    return json.dumps(envelope, ensure_ascii=False)
+
+
+def best_ns(run: Callable[[], None], iterations: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter_ns()
+        run()
+        best = min(best, (time.perf_counter_ns() - started) / iterations)
+    return best
+
+
+def measure(
+    name: str,
+    build: Callable[[], Any],
+    encode: Callable[[Any], Any],
+    args: argparse.Namespace,
+) -> dict[str, Any]:
+    rounds = range(args.iterations)
+    built = [build() for _ in rounds]
+
+    def construct() -> None:
+        for _ in rounds:
+            build()
+
+    def encode_all() -> None:
+        for item in built:
+            encode(item)
+
+    return {
+        "case": name,
+        "construct_ns": best_ns(construct, args.iterations, args.repeat),
+        "encode_ns": best_ns(encode_all, args.iterations, args.repeat),
+        "bytes": len(encode(built[0]).encode()),
+    }
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    codec = JsonCodec()
+    rows = [
+        measure("event/before", dict_event, legacy_encode, args),
+        measure("event/after", envelope_event, codec.encode, args),
+        measure("heartbeat/before", dict_heartbeat, legacy_encode, args),
+        measure("heartbeat/after", envelope_heartbeat, codec.encode, args),
+    ]
+    for row in rows:
+        row["total_ns"] = row["construct_ns"] + row["encode_ns"]
+
+    if args.json:
+        print(json.dumps(rows, indent=2))
+        return
+
+    print(f"{'case':<18}{'construct_ns':>14}{'encode_ns':>11}{'total_ns':>10}{'bytes':>7}")
+    for row in rows:
+        print(
+            f"{row['case']:<18}{row['construct_ns']:>14.0f}{row['encode_ns']:>11.0f}"
+            f"{row['total_ns']:>10.0f}{row['bytes']:>7}"
+        )
+
+
+if __name__ == "__main__":
+    main()
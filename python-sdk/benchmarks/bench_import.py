@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from typing import Any
+
+FORBIDDEN_MODULES = (
+    "asyncio",
+    "websockets",
+    "multiprocessing",
+    "msgpack",
+    "google.protobuf",
+    "fastapi",
+    "uvicorn",
+    "httpx",
+    "pydantic",
+    "textual",
+    "python_socks",
+)
+
+PROBE = """
+import json, pathlib, sys, time
+def rss_kb():
+    status = pathlib.Path("/proc/self/status")
+    if not status.exists():
+        return None
+    for line in status.read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1])
+    return None
+forbidden = {forbidden!r}
+before = set(sys.modules)
+rss_before = rss_kb()
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+rss_after = rss_kb()
+loaded = set(sys.modules) - before
+print(json.dumps({{
+    "ms": elapsed * 1000,
+    "rss_kb": None if rss_before is None else rss_after - rss_before,
+    "modules": len(loaded),
+    "forbidden": sorted(m for m in forbidden if m in loaded),
+}}))
+"""
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Measure import time and memory of the SDK in fresh interpreters"
+    )
+    parser.add_argument("--runs", type=int, default=15, help="fresh interpreters per module")
+    parser.add_argument("--budget-ms", type=float, default=20.0)
+    parser.add_argument("--budget-rss-kb", type=int, default=2048)
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    return parser
+
+
+def probe(module: str, runs: int) -> dict[str, Any]:
+    code = PROBE.format(module=module, forbidden=FORBIDDEN_MODULES)
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        samples.append(json.loads(output))
+    rss = [s["rss_kb"] for s in samples if s["rss_kb"] is not None]
+    return {
+        "module": module,
+        "median_ms": statistics.median(s["ms"] for s in samples),
+        "rss_kb": statistics.median(rss) if rss else None,
+        "modules": samples[-1]["modules"],
+        "forbidden": samples[-1]["forbidden"],
+    }
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    package = probe("amonitor_sdk", args.runs)
+    server = probe("amonitor_sdk.server", args.runs)
+
+    failures = []
+    if package["median_ms"] > args.budget_ms:
+        failures.append(f"import time {package['median_ms']:.1f} ms > {args.budget_ms} ms")
+    if package["rss_kb"] is not None and package["rss_kb"] > args.budget_rss_kb:
+        failures.append(f"import rss {package['rss_kb']} KiB > {args.budget_rss_kb} KiB")
+    if package["forbidden"]:
+        failures.append(f"eagerly imported: {', '.join(package['forbidden'])}")
+
+    if args.json:
+        print(json.dumps({"package": package, "server": server, "failures": failures}, indent=2))
+    else:
+        print(f"{'module':<22}{'median_ms':>11}{'rss_kb':>9}{'modules':>9}")
+        for row in (package, server):
+            rss = "-" if row["rss_kb"] is None else f"{row['rss_kb']:.0f}"
+            print(f"{row['module']:<22}{row['median_ms']:>11.2f}{rss:>9}{row['modules']:>9}")
+        for failure in failures:
+            print(f"FAIL: {failure}")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
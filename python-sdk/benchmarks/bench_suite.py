@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import websockets
+
+from amonitor_sdk.server import SDKServer
+
+HIGHER_IS_BETTER = {"events_per_s"}
+LOWER_IS_BETTER = {"p50_ms", "p99_ms", "p999_ms", "emit_us", "queue_us", "send_us"}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Loopback throughput and action round-trip benchmark for the SDK hot path"
+    )
+    parser.add_argument("--connections", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--payload-bytes", type=int, nargs="+", default=[64, 1024, 16384])
+    parser.add_argument("--handler-ms", type=float, nargs="+", default=[0, 5])
+    parser.add_argument("--events", type=int, default=20000, help="events per emit case")
+    parser.add_argument("--actions", type=int, default=2000, help="actions per rtt case")
+    parser.add_argument("--pipeline", type=int, default=1, help="in-flight actions per conn")
+    parser.add_argument("--dispatch-mode", choices=["inline", "concurrent"], default="concurrent")
+    parser.add_argument("--port", type=int, default=18768)
+    parser.add_argument("--output", type=Path, help="write results JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="compare against a previous results JSON")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.15,
+        help="allowed relative regression before failing (default 0.15)",
+    )
+    parser.add_argument(
+        "--gate",
+        nargs="+",
+        default=["events_per_s", "p50_ms", "p99_ms"],
+        choices=sorted(HIGHER_IS_BETTER | LOWER_IS_BETTER),
+        help="metrics that fail the run when they regress (p999 is noisy on short runs)",
+    )
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    return parser
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def make_handler(delay_ms: float) -> Any:
+    delay = delay_ms / 1000
+
+    async def handler(action: str, params: dict[str, Any]) -> dict[str, Any]:
+        if delay:
+            await asyncio.sleep(delay)
+        return {"ok": True, "message": action}
+
+    return handler
+
+
+async def start_server(
+    args: argparse.Namespace,
+    handler_ms: float = 0,
+    max_events: int = 1024,
+) -> tuple[Any, Any]:
+    server = SDKServer(
+        "127.0.0.1",
+        args.port,
+        "bench",
+        make_handler(handler_ms),
+        heartbeat_interval=3600,
+        dispatch_mode=args.dispatch_mode,
+        max_in_flight_actions=max(64, args.pipeline * max(args.connections)),
+        outbound_max_events=max_events,
+    )
+    task = asyncio.create_task(server.run())
+    await server.started.wait()
+    return server, task
+
+
+async def stop_server(task: Any) -> None:
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+async def open_clients(args: argparse.Namespace, count: int) -> list[Any]:
+    clients = [
+        await websockets.connect(f"ws://127.0.0.1:{args.port}/", max_size=None, compression=None)
+        for _ in range(count)
+    ]
+    for client in clients:
+        await client.recv()
+    return clients
+
+
+async def count_events(client: Any, expected: int) -> None:
+    seen = 0
+    while seen < expected:
+        message = await client.recv()
+        if '"type":"event"' in message:
+            seen += 1
+
+
+async def run_emit(args: argparse.Namespace, connections: int, size: int) -> dict[str, Any]:
+    server, task = await start_server(args)
+    clients = await open_clients(args, connections)
+    data = {"blob": "x" * size}
+    readers = [asyncio.create_task(count_events(client, args.events)) for client in clients]
+    started = time.perf_counter()
+    for _ in range(args.events):
+        await server.emit("bench", data)
+    emitted = time.perf_counter() - started
+    await asyncio.gather(*readers)
+    elapsed = time.perf_counter() - started
+    for client in clients:
+        await client.close()
+    await stop_server(task)
+    return {
+        "case": f"emit/c={connections}/payload={size}",
+        "kind": "emit",
+        "connections": connections,
+        "payload_bytes": size,
+        "events": args.events,
+        "emit_us": emitted / args.events * 1e6,
+        "events_per_s": args.events / elapsed,
+        "delivered_per_s": args.events * connections / elapsed,
+    }
+
+
+async def run_try_emit(args: argparse.Namespace, connections: int, size: int) -> dict[str, Any]:
+    server, task = await start_server(args, max_events=args.events)
+    clients = await open_clients(args, connections)
+    data = {"blob": "x" * size}
+    readers = [asyncio.create_task(count_events(client, args.events)) for client in clients]
+    started = time.perf_counter()
+    queued = sum(server.try_emit("bench", data) for _ in range(args.events))
+    enqueued = time.perf_counter() - started
+    await asyncio.gather(*readers)
+    elapsed = time.perf_counter() - started
+    for client in clients:
+        await client.close()
+    await stop_server(task)
+    if queued != args.events:
+        raise RuntimeError(f"try_emit rejected {args.events - queued} events")
+    return {
+        "case": f"try_emit/c={connections}/payload={size}",
+        "kind": "try_emit",
+        "connections": connections,
+        "payload_bytes": size,
+        "events": args.events,
+        "queue_us": enqueued / args.events * 1e6,
+        "send_us": (elapsed - enqueued) / args.events * 1e6,
+        "events_per_s": args.events / elapsed,
+        "delivered_per_s": args.events * connections / elapsed,
+    }
+
+
+async def drive_actions(client: Any, count: int, pipeline: int, latencies: list[float]) -> None:
+    sent_at: dict[str, float] = {}
+    ids = (f"{id(client):x}-{index}" for index in itertools.count())
+    remaining = count
+
+    async def send_one() -> None:
+        nonlocal remaining
+        remaining -= 1
+        msg_id = next(ids)
+        sent_at[msg_id] = time.perf_counter()
+        await client.send(
+            json.dumps(
+                {
+                    "msg_id": msg_id,
+                    "type": "action",
+                    "timestamp": 0,
+                    "payload": {"action": "bench", "params": {}},
+                }
+            )
+        )
+
+    for _ in range(min(pipeline, count)):
+        await send_one()
+    while sent_at:
+        message = json.loads(await client.recv())
+        if message.get("type") != "action_ack":
+            continue
+        started = sent_at.pop(message["payload"]["action_msg_id"], None)
+        if started is None:
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+        if remaining > 0:
+            await send_one()
+
+
+async def run_rtt(args: argparse.Namespace, connections: int, handler_ms: float) -> dict[str, Any]:
+    _, task = await start_server(args, handler_ms)
+    clients = await open_clients(args, connections)
+    per_client = max(1, args.actions // connections)
+    latencies: list[float] = []
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(drive_actions(client, per_client, args.pipeline, latencies) for client in clients)
+    )
+    elapsed = time.perf_counter() - started
+    for client in clients:
+        await client.close()
+    await stop_server(task)
+    latencies.sort()
+    return {
+        "case": f"rtt/c={connections}/handler_ms={handler_ms:g}",
+        "kind": "rtt",
+        "connections": connections,
+        "handler_ms": handler_ms,
+        "actions": len(latencies),
+        "actions_per_s": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.50),
+        "p99_ms": percentile(latencies, 0.99),
+        "p999_ms": percentile(latencies, 0.999),
+        "max_ms": latencies[-1] if latencies else 0.0,
+    }
+
+
+async def run_suite(args: argparse.Namespace) -> list[dict[str, Any]]:
+    rows = []
+    for connections in args.connections:
+        for size in args.payload_bytes:
+            rows.append(await run_emit(args, connections, size))
+            rows.append(await run_try_emit(args, connections, size))
+        for handler_ms in args.handler_ms:
+            rows.append(await run_rtt(args, connections, handler_ms))
+    return rows
+
+
+def compare(
+    rows: list[dict[str, Any]],
+    baseline: dict[str, Any],
+    tolerance: float,
+    gate: set[str],
+) -> list[dict[str, Any]]:
+    previous = {row["case"]: row for row in baseline.get("results", [])}
+    findings = []
+    for row in rows:
+        old = previous.get(row["case"])
+        if old is None:
+            continue
+        for metric in sorted((HIGHER_IS_BETTER | LOWER_IS_BETTER) & row.keys() & old.keys()):
+            if not old[metric]:
+                continue
+            change = row[metric] / old[metric] - 1
+            if metric in HIGHER_IS_BETTER:
+                regressed = change < -tolerance
+            else:
+                regressed = change > tolerance
+            regressed = regressed and metric in gate
+            findings.append(
+                {
+                    "case": row["case"],
+                    "metric": metric,
+                    "baseline": old[metric],
+                    "current": row[metric],
+                    "change": change,
+                    "regressed": regressed,
+                }
+            )
+    return findings
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    rows = asyncio.run(run_suite(args))
+    report: dict[str, Any] = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "websockets": websockets.__version__,
+        "config": {
+            "events": args.events,
+            "actions": args.actions,
+            "pipeline": args.pipeline,
+            "dispatch_mode": args.dispatch_mode,
+        },
+        "results": rows,
+    }
+    findings: list[dict[str, Any]] = []
+    if args.baseline is not None:
+        findings = compare(
+            rows, json.loads(args.baseline.read_text()), args.tolerance, set(args.gate)
+        )
+        report["comparison"] = {
+            "tolerance": args.tolerance,
+            "gate": args.gate,
+            "findings": findings,
+        }
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(
+            f"{'case':<36}{'events/s':>11}{'emit_us':>9}{'queue_us':>9}{'send_us':>9}"
+            f"{'p50_ms':>9}{'p99_ms':>9}{'p999_ms':>9}"
+        )
+        for row in rows:
+            if row["kind"] == "emit":
+                print(f"{row['case']:<36}{row['events_per_s']:>11.0f}{row['emit_us']:>9.1f}")
+            elif row["kind"] == "try_emit":
+                print(
+                    f"{row['case']:<36}{row['events_per_s']:>11.0f}{'':>9}"
+                    f"{row['queue_us']:>9.1f}{row['send_us']:>9.1f}"
+                )
+            else:
+                print(
+                    f"{row['case']:<36}{'':>11}{'':>9}{'':>9}{'':>9}{row['p50_ms']:>9.2f}"
+                    f"{row['p99_ms']:>9.2f}{row['p999_ms']:>9.2f}"
+                )
+        for finding in findings:
+            if finding["regressed"]:
+                print(
+                    f"REGRESSION {finding['case']} {finding['metric']}: "
+                    f"{finding['baseline']:.3f} -> {finding['current']:.3f} "
+                    f"({finding['change']:+.1%})"
+                )
+    if any(finding["regressed"] for finding in findings):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any
+
+import websockets
+
+from amonitor_sdk.server import SDKServer
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Measure per-target cost of hosting many targets in one SDKServer"
+    )
+    parser.add_argument("--targets", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--port", type=int, default=18766)
+    parser.add_argument(
+        "--skip-process-baseline",
+        action="store_true",
+        help="do not start a single-target subprocess for RSS comparison",
+    )
+    parser.add_argument("--json", action="store_true", help="print machine-readable JSON")
+    return parser
+
+
+async def handler(action: str, params: dict[str, Any]) -> dict[str, Any]:
+    return {"ok": True, "message": action}
+
+
+def measure_add(count: int) -> tuple[SDKServer, dict[str, Any]]:
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    started = time.perf_counter()
+    server = SDKServer("127.0.0.1", 0, "target-00000", handler, heartbeat_interval=3600)
+    for index in range(1, count):
+        server.add_target(f"target-{index:05d}", handler)
+    elapsed = time.perf_counter() - started
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return server, {
+        "targets": count,
+        "bytes_per_target": (after - before) / count,
+        "add_us_per_target": elapsed / count * 1e6,
+    }
+
+
+async def measure_first_heartbeats(server: SDKServer, port: int) -> float:
+    server.port = port
+    task = asyncio.create_task(server.run())
+    await server.started.wait()
+    expected = len(server.targets)
+    seen = 0
+    started = time.perf_counter()
+    async with websockets.connect(f"ws://127.0.0.1:{port}/", max_size=None) as websocket:
+        while seen < expected:
+            if '"heartbeat"' in await websocket.recv():
+                seen += 1
+    elapsed = time.perf_counter() - started
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+    return elapsed
+
+
+def single_target_process_rss_kb(port: int) -> int | None:
+    status = Path("/proc/self/status")
+    if not status.exists():
+        return None
+    code = (
+        "import asyncio, pathlib\n"
+        "from amonitor_sdk.server import SDKServer\n"
+        "async def h(a, p):\n"
+        "    return {'ok': True}\n"
+        "async def main():\n"
+        f"    server = SDKServer('127.0.0.1', {port}, 'solo', h)\n"
+        "    task = asyncio.create_task(server.run())\n"
+        "    await server.started.wait()\n"
+        "    for line in pathlib.Path('/proc/self/status').read_text().splitlines():\n"
+        "        if line.startswith('VmRSS:'):\n"
+        "            print(line.split()[1])\n"
+        "    task.cancel()\n"
+        "asyncio.run(main())\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    return int(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    rows: list[dict[str, Any]] = []
+    for count in args.targets:
+        server, row = measure_add(count)
+        row["first_heartbeats_s"] = asyncio.run(measure_first_heartbeats(server, args.port))
+        rows.append(row)
+    baseline_kb = None if args.skip_process_baseline else single_target_process_rss_kb(args.port)
+
+    if args.json:
+        print(json.dumps({"rows": rows, "single_process_rss_kb": baseline_kb}, indent=2))
+        return
+
+    print(f"{'targets':>8}{'bytes/target':>14}{'add_us':>9}{'first_hb_s':>12}")
+    for row in rows:
+        print(
+            f"{row['targets']:>8}{row['bytes_per_target']:>14.0f}"
+            f"{row['add_us_per_target']:>9.1f}{row['first_heartbeats_s']:>12.3f}"
+        )
+    if baseline_kb is not None:
+        print(f"one single-target SDK process: {baseline_kb} KiB RSS")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,53 @@
-from .server import start_server
+from __future__ import annotations
 
-__all__ = ["start_server"]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .compression import CompressionOptions
+    from .embedded import EmbeddedServer, start_embedded
+    from .idempotency import IdempotencyCache
+    from .metrics import MetricsRegistry
+    from .panel import PanelClient
+    from .reverse import Backoff
+    from .sampling import EventPolicy
+    from .server import SDKServer, start_server
+
+_LAZY_ATTRS = {
+    "Backoff": ".reverse",
+    "CompressionOptions": ".compression",
+    "EmbeddedServer": ".embedded",
+    "EventPolicy": ".sampling",
+    "IdempotencyCache": ".idempotency",
+    "MetricsRegistry": ".metrics",
+    "PanelClient": ".panel",
+    "SDKServer": ".server",
+    "start_embedded": ".embedded",
+    "start_server": ".server",
+}
+
+__all__ = [
+    "Backoff",
+    "CompressionOptions",
+    "EmbeddedServer",
+    "EventPolicy",
+    "IdempotencyCache",
+    "MetricsRegistry",
+    "PanelClient",
+    "SDKServer",
+    "start_embedded",
+    "start_server",
+]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
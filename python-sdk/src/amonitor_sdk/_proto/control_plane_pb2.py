@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: control_plane.proto
+# Protobuf Python Version: 5.27.2
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    5,
+    27,
+    2,
+    '',
+    'control_plane.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x13\x63ontrol_plane.proto\x12\x13\x61monitor.control.v1\"\x87\x01\n\x08\x45nvelope\x12\x0e\n\x06msg_id\x18\x01 \x01(\t\x12\x10\n\x08trace_id\x18\x02 \x01(\t\x12\x0c\n\x04type\x18\x03 \x01(\t\x12\x11\n\ttarget_id\x18\x04 \x01(\t\x12\x11\n\ttimestamp\x18\x05 \x01(\x03\x12\x0f\n\x07payload\x18\x06 \x01(\x0c\x12\x14\n\x0cpayload_json\x18\x07 \x01(\x08\"\xac\x01\n\x0fRegisterPayload\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x0f\n\x07sdk_url\x18\x02 \x01(\t\x12\x44\n\x08metadata\x18\x03 \x03(\x0b\x32\x32.amonitor.control.v1.RegisterPayload.MetadataEntry\x1a/\n\rMetadataEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"\xaa\x01\n\x10HeartbeatPayload\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x43\n\x07metrics\x18\x02 \x03(\x0b\x32\x32.amonitor.control.v1.HeartbeatPayload.MetricsEntry\x12\x0e\n\x06status\x18\x03 \x01(\t\x1a.\n\x0cMetricsEntry\x12\x0b\n\x03key\x18\x01 \x01(\t\x12\r\n\x05value\x18\x02 \x01(\t:\x02\x38\x01\"C\n\x0c\x45ventPayload\x12\x11\n\ttarget_id\x18\x01 \x01(\t\x12\x12\n\nevent_name\x18\x02 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x03 \x01(\x0c\"C\n\rActionPayload\x12\x0e\n\x06\x61\x63tion\x18\x01 \x01(\t\x12\x0e\n\x06params\x18\x02 \x01(\x0c\x12\x12\n\ntarget_url\x18\x03 \x01(\t\"K\n\x10\x41\x63tionAckPayload\x12\x15\n\raction_msg_id\x18\x01 \x01(\t\x12\x0f\n\x07success\x18\x02 \x01(\x08\x12\x0f\n\x07message\x18\x03 \x01(\t\"-\n\x0c\x45rrorPayload\x12\x0c\n\x04\x63ode\x18\x01 \x01(\t\x12\x0f\n\x07message\x18\x02 \x01(\tBDZBgithub.com/HsiangNianian/AMonItor/proto/gen/go/controlv1;controlv1b\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'control_plane_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  _globals['DESCRIPTOR']._loaded_options = None
+  _globals['DESCRIPTOR']._serialized_options = b'ZBgithub.com/HsiangNianian/AMonItor/proto/gen/go/controlv1;controlv1'
+  _globals['_REGISTERPAYLOAD_METADATAENTRY']._loaded_options = None
+  _globals['_REGISTERPAYLOAD_METADATAENTRY']._serialized_options = b'8\001'
+  _globals['_HEARTBEATPAYLOAD_METRICSENTRY']._loaded_options = None
+  _globals['_HEARTBEATPAYLOAD_METRICSENTRY']._serialized_options = b'8\001'
+  _globals['_ENVELOPE']._serialized_start=45
+  _globals['_ENVELOPE']._serialized_end=180
+  _globals['_REGISTERPAYLOAD']._serialized_start=183
+  _globals['_REGISTERPAYLOAD']._serialized_end=355
+  _globals['_REGISTERPAYLOAD_METADATAENTRY']._serialized_start=308
+  _globals['_REGISTERPAYLOAD_METADATAENTRY']._serialized_end=355
+  _globals['_HEARTBEATPAYLOAD']._serialized_start=358
+  _globals['_HEARTBEATPAYLOAD']._serialized_end=528
+  _globals['_HEARTBEATPAYLOAD_METRICSENTRY']._serialized_start=482
+  _globals['_HEARTBEATPAYLOAD_METRICSENTRY']._serialized_end=528
+  _globals['_EVENTPAYLOAD']._serialized_start=530
+  _globals['_EVENTPAYLOAD']._serialized_end=597
+  _globals['_ACTIONPAYLOAD']._serialized_start=599
+  _globals['_ACTIONPAYLOAD']._serialized_end=666
+  _globals['_ACTIONACKPAYLOAD']._serialized_start=668
+  _globals['_ACTIONACKPAYLOAD']._serialized_end=743
+  _globals['_ERRORPAYLOAD']._serialized_start=745
+  _globals['_ERRORPAYLOAD']._serialized_end=790
+# @@protoc_insertion_point(module_scope)
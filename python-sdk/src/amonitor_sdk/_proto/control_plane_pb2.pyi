@@ -0,0 +1,96 @@
+from google.protobuf.internal import containers as _containers
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from typing import ClassVar as _ClassVar, Mapping as _Mapping, Optional as _Optional
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class Envelope(_message.Message):
+    __slots__ = ("msg_id", "trace_id", "type", "target_id", "timestamp", "payload", "payload_json")
+    MSG_ID_FIELD_NUMBER: _ClassVar[int]
+    TRACE_ID_FIELD_NUMBER: _ClassVar[int]
+    TYPE_FIELD_NUMBER: _ClassVar[int]
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    TIMESTAMP_FIELD_NUMBER: _ClassVar[int]
+    PAYLOAD_FIELD_NUMBER: _ClassVar[int]
+    PAYLOAD_JSON_FIELD_NUMBER: _ClassVar[int]
+    msg_id: str
+    trace_id: str
+    type: str
+    target_id: str
+    timestamp: int
+    payload: bytes
+    payload_json: bool
+    def __init__(self, msg_id: _Optional[str] = ..., trace_id: _Optional[str] = ..., type: _Optional[str] = ..., target_id: _Optional[str] = ..., timestamp: _Optional[int] = ..., payload: _Optional[bytes] = ..., payload_json: bool = ...) -> None: ...
+
+class RegisterPayload(_message.Message):
+    __slots__ = ("target_id", "sdk_url", "metadata")
+    class MetadataEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    SDK_URL_FIELD_NUMBER: _ClassVar[int]
+    METADATA_FIELD_NUMBER: _ClassVar[int]
+    target_id: str
+    sdk_url: str
+    metadata: _containers.ScalarMap[str, str]
+    def __init__(self, target_id: _Optional[str] = ..., sdk_url: _Optional[str] = ..., metadata: _Optional[_Mapping[str, str]] = ...) -> None: ...
+
+class HeartbeatPayload(_message.Message):
+    __slots__ = ("target_id", "metrics", "status")
+    class MetricsEntry(_message.Message):
+        __slots__ = ("key", "value")
+        KEY_FIELD_NUMBER: _ClassVar[int]
+        VALUE_FIELD_NUMBER: _ClassVar[int]
+        key: str
+        value: str
+        def __init__(self, key: _Optional[str] = ..., value: _Optional[str] = ...) -> None: ...
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    METRICS_FIELD_NUMBER: _ClassVar[int]
+    STATUS_FIELD_NUMBER: _ClassVar[int]
+    target_id: str
+    metrics: _containers.ScalarMap[str, str]
+    status: str
+    def __init__(self, target_id: _Optional[str] = ..., metrics: _Optional[_Mapping[str, str]] = ..., status: _Optional[str] = ...) -> None: ...
+
+class EventPayload(_message.Message):
+    __slots__ = ("target_id", "event_name", "data")
+    TARGET_ID_FIELD_NUMBER: _ClassVar[int]
+    EVENT_NAME_FIELD_NUMBER: _ClassVar[int]
+    DATA_FIELD_NUMBER: _ClassVar[int]
+    target_id: str
+    event_name: str
+    data: bytes
+    def __init__(self, target_id: _Optional[str] = ..., event_name: _Optional[str] = ..., data: _Optional[bytes] = ...) -> None: ...
+
+class ActionPayload(_message.Message):
+    __slots__ = ("action", "params", "target_url")
+    ACTION_FIELD_NUMBER: _ClassVar[int]
+    PARAMS_FIELD_NUMBER: _ClassVar[int]
+    TARGET_URL_FIELD_NUMBER: _ClassVar[int]
+    action: str
+    params: bytes
+    target_url: str
+    def __init__(self, action: _Optional[str] = ..., params: _Optional[bytes] = ..., target_url: _Optional[str] = ...) -> None: ...
+
+class ActionAckPayload(_message.Message):
+    __slots__ = ("action_msg_id", "success", "message")
+    ACTION_MSG_ID_FIELD_NUMBER: _ClassVar[int]
+    SUCCESS_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    action_msg_id: str
+    success: bool
+    message: str
+    def __init__(self, action_msg_id: _Optional[str] = ..., success: bool = ..., message: _Optional[str] = ...) -> None: ...
+
+class ErrorPayload(_message.Message):
+    __slots__ = ("code", "message")
+    CODE_FIELD_NUMBER: _ClassVar[int]
+    MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    code: str
+    message: str
+    def __init__(self, code: _Optional[str] = ..., message: _Optional[str] = ...) -> None: ...
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from .models import Envelope, now_ms
+
+BatchSender = Callable[[Envelope], object]
+
+
+class EventBatcher:
+    def __init__(
+        self,
+        target_id: str,
+        send: BatchSender,
+        max_items: int = 256,
+        max_delay_ms: float = 20,
+    ) -> None:
+        if max_items < 1:
+            raise ValueError("max_items must be >= 1")
+        if max_delay_ms < 0:
+            raise ValueError("max_delay_ms must be >= 0")
+        self.target_id = target_id
+        self.max_items = max_items
+        self.max_delay = max_delay_ms / 1000
+        self._send = send
+        self._pending: list[dict[str, Any]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._batches_sent = 0
+        self._events_sent = 0
+        self._size_flushes = 0
+        self._time_flushes = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def add(self, event_name: str, data: dict[str, Any]) -> None:
+        self._pending.append(
+            {
+                "event_name": event_name,
+                "timestamp": now_ms(),
+                "data": data,
+            }
+        )
+        if len(self._pending) >= self.max_items:
+            self._size_flushes += 1
+            self.flush()
+            return
+        if self._timer is None:
+            loop = asyncio.get_running_loop()
+            self._timer = loop.call_later(self.max_delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        if not self._pending:
+            return
+        self._time_flushes += 1
+        self.flush()
+
+    def flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        events, self._pending = self._pending, []
+        envelope = Envelope.new(
+            "event_batch",
+            target_id=self.target_id,
+            payload={"target_id": self.target_id, "events": events},
+        )
+        self._batches_sent += 1
+        self._events_sent += len(events)
+        self._send(envelope)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "max_items": self.max_items,
+            "max_delay_ms": self.max_delay * 1000,
+            "pending": len(self._pending),
+            "batches_sent": self._batches_sent,
+            "events_sent": self._events_sent,
+            "size_flushes": self._size_flushes,
+            "time_flushes": self._time_flushes,
+        }
+
+
+def decode_event_batch(envelope: dict[str, Any]) -> list[dict[str, Any]]:
+    payload = envelope.get("payload") or {}
+    target_id = payload.get("target_id", envelope.get("target_id", ""))
+    batch_msg_id = envelope.get("msg_id", "")
+    events: list[dict[str, Any]] = []
+    for index, item in enumerate(payload.get("events") or []):
+        event = {
+            "msg_id": f"{batch_msg_id}:{index}",
+            "type": "event",
+            "target_id": envelope.get("target_id", target_id),
+            "timestamp": item.get("timestamp", envelope.get("timestamp", 0)),
+            "payload": {
+                "target_id": target_id,
+                "event_name": item.get("event_name", ""),
+                "data": item.get("data", {}),
+            },
+        }
+        if "trace_id" in envelope:
+            event["trace_id"] = envelope["trace_id"]
+        events.append(event)
+    return events
+
+
+def iter_envelopes(envelope: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    if envelope.get("type") == "event_batch":
+        yield from decode_event_batch(envelope)
+        return
+    yield envelope
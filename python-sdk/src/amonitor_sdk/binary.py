@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import struct
+from dataclasses import dataclass
+from typing import Any
+
+BINARY_EVENTS_HEADER = "X-AMonitor-Binary-Events"
+BINARY_EVENTS_VERSION = "v1"
+
+BINARY_EVENT_MAGIC = 0xB1
+BINARY_EVENT_FORMAT = 1
+
+_HEADER = struct.Struct("!BBBBBQ")
+
+BinaryFrame = tuple[bytes, memoryview]
+
+
+@dataclass(slots=True)
+class BinaryEvent:
+    msg_id: str
+    target_id: str
+    event_name: str
+    timestamp: int
+    data: memoryview
+
+
+def as_byte_view(buffer: Any) -> memoryview:
+    view = buffer if isinstance(buffer, memoryview) else memoryview(buffer)
+    if not view.c_contiguous:
+        raise ValueError("binary event buffer must be C-contiguous")
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+    return view
+
+
+def encode_binary_header(msg_id: str, target_id: str, event_name: str, timestamp: int) -> bytes:
+    fields = (msg_id.encode(), target_id.encode(), event_name.encode())
+    for raw in fields:
+        if len(raw) > 255:
+            raise ValueError("binary event msg_id/target_id/event_name must be <= 255 bytes")
+    head = _HEADER.pack(
+        BINARY_EVENT_MAGIC,
+        BINARY_EVENT_FORMAT,
+        len(fields[0]),
+        len(fields[1]),
+        len(fields[2]),
+        timestamp,
+    )
+    return head + b"".join(fields)
+
+
+def is_binary_event(frame: Any) -> bool:
+    return not isinstance(frame, str) and len(frame) > 0 and frame[0] == BINARY_EVENT_MAGIC
+
+
+def decode_binary_event(frame: bytes | bytearray | memoryview) -> BinaryEvent:
+    view = frame if isinstance(frame, memoryview) else memoryview(frame)
+    if len(view) < _HEADER.size:
+        raise ValueError("binary event frame is truncated")
+    magic, version, id_len, target_len, name_len, timestamp = _HEADER.unpack_from(view)
+    if magic != BINARY_EVENT_MAGIC:
+        raise ValueError(f"not a binary event frame: {magic:#04x}")
+    if version != BINARY_EVENT_FORMAT:
+        raise ValueError(f"unsupported binary event format: {version}")
+    offset = _HEADER.size
+    end = offset + id_len + target_len + name_len
+    if len(view) < end:
+        raise ValueError("binary event frame is truncated")
+    msg_id = str(view[offset : offset + id_len], "utf-8")
+    offset += id_len
+    target_id = str(view[offset : offset + target_len], "utf-8")
+    offset += target_len
+    event_name = str(view[offset:end], "utf-8")
+    return BinaryEvent(
+        msg_id=msg_id,
+        target_id=target_id,
+        event_name=event_name,
+        timestamp=timestamp,
+        data=view[end:],
+    )
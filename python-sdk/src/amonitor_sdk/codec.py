@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from json.encoder import encode_basestring
+from typing import Any, Protocol
+
+from .models import Envelope
+
+Frame = str | bytes
+EnvelopeLike = Envelope | dict[str, Any]
+
+_dumps_compact = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+JSON_SUBPROTOCOL = "amonitor.json.v1"
+MSGPACK_SUBPROTOCOL = "amonitor.msgpack.v1"
+PROTOBUF_SUBPROTOCOL = "amonitor.proto.v1"
+
+
+class Codec(Protocol):
+    name: str
+    subprotocol: str
+
+    def encode(self, envelope: EnvelopeLike) -> Frame: ...
+
+    def decode(self, frame: Frame) -> dict[str, Any]: ...
+
+
+class JsonCodec:
+    name = "json"
+    subprotocol = JSON_SUBPROTOCOL
+
+    def __init__(self) -> None:
+        self._headers: dict[tuple[str, str | None], str] = {}
+
+    def encode(self, envelope: EnvelopeLike) -> Frame:
+        if not isinstance(envelope, Envelope):
+            return _dumps_compact(envelope)
+        if envelope.trace_id is not None:
+            return _dumps_compact(envelope.to_dict())
+        key = (envelope.type, envelope.target_id)
+        header = self._headers.get(key)
+        if header is None:
+            header = self._headers[key] = _envelope_header(*key)
+        return (
+            f'{{"msg_id":{encode_basestring(envelope.msg_id)}{header}{envelope.timestamp}'
+            f',"payload":{_dumps_compact(envelope.payload)}}}'
+        )
+
+    def decode(self, frame: Frame) -> dict[str, Any]:
+        return json.loads(frame)
+
+
+class MsgpackCodec:
+    name = "msgpack"
+    subprotocol = MSGPACK_SUBPROTOCOL
+
+    def __init__(self) -> None:
+        try:
+            import msgpack
+        except ImportError as exc:
+            raise ImportError(
+                "msgpack codec requires: pip install 'amonitor-sdk[msgpack]'"
+            ) from exc
+        self._packer = msgpack.Packer(use_bin_type=True)
+        self._unpackb = msgpack.unpackb
+
+    def encode(self, envelope: EnvelopeLike) -> Frame:
+        if isinstance(envelope, Envelope):
+            envelope = envelope.to_dict()
+        return self._packer.pack(envelope)
+
+    def decode(self, frame: Frame) -> dict[str, Any]:
+        if isinstance(frame, str):
+            return json.loads(frame)
+        return self._unpackb(frame, raw=False)
+
+
+class ProtobufCodec:
+    name = "protobuf"
+    subprotocol = PROTOBUF_SUBPROTOCOL
+
+    def __init__(self) -> None:
+        try:
+            from ._proto import control_plane_pb2
+        except ImportError as exc:
+            raise ImportError(
+                "protobuf codec requires: pip install 'amonitor-sdk[protobuf]'"
+            ) from exc
+        self._pb = control_plane_pb2
+
+    def encode(self, envelope: EnvelopeLike) -> Frame:
+        if isinstance(envelope, Envelope):
+            envelope = envelope.to_dict()
+        message = self._pb.Envelope(
+            msg_id=envelope.get("msg_id", ""),
+            trace_id=envelope.get("trace_id") or "",
+            type=envelope.get("type", ""),
+            target_id=envelope.get("target_id") or "",
+            timestamp=int(envelope.get("timestamp", 0)),
+        )
+        payload = envelope.get("payload")
+        typed = self._encode_payload(message.type, payload)
+        if typed is not None:
+            message.payload = typed
+        elif payload is not None:
+            message.payload = _dumps(payload)
+            message.payload_json = True
+        return message.SerializeToString()
+
+    def decode(self, frame: Frame) -> dict[str, Any]:
+        if isinstance(frame, str):
+            return json.loads(frame)
+        message = self._pb.Envelope.FromString(frame)
+        envelope: dict[str, Any] = {
+            "msg_id": message.msg_id,
+            "type": message.type,
+            "timestamp": message.timestamp,
+        }
+        if message.trace_id:
+            envelope["trace_id"] = message.trace_id
+        if message.target_id:
+            envelope["target_id"] = message.target_id
+        if message.payload_json:
+            envelope["payload"] = json.loads(message.payload)
+        else:
+            envelope["payload"] = self._decode_payload(message.type, message.payload)
+        return envelope
+
+    def _encode_payload(self, msg_type: str, payload: Any) -> bytes | None:
+        if not isinstance(payload, dict):
+            return None
+        pb = self._pb
+        if msg_type == "event" and _fits(payload, _EVENT_FIELDS):
+            return pb.EventPayload(
+                target_id=payload.get("target_id", ""),
+                event_name=payload.get("event_name", ""),
+                data=_dumps(payload.get("data", {})),
+            ).SerializeToString()
+        if msg_type == "action" and _fits(payload, _ACTION_FIELDS):
+            return pb.ActionPayload(
+                action=payload.get("action", ""),
+                params=_dumps(payload.get("params", {})),
+                target_url=payload.get("target_url", ""),
+            ).SerializeToString()
+        if msg_type == "action_ack" and _fits(payload, _ACK_FIELDS):
+            return pb.ActionAckPayload(**payload).SerializeToString()
+        if msg_type == "heartbeat" and _fits(payload, _HEARTBEAT_FIELDS):
+            return pb.HeartbeatPayload(**payload).SerializeToString()
+        if msg_type == "register" and _fits(payload, _REGISTER_FIELDS):
+            return pb.RegisterPayload(**payload).SerializeToString()
+        if msg_type == "error" and _fits(payload, _ERROR_FIELDS):
+            return pb.ErrorPayload(**payload).SerializeToString()
+        return None
+
+    def _decode_payload(self, msg_type: str, raw: bytes) -> dict[str, Any]:
+        pb = self._pb
+        if msg_type == "event":
+            event = pb.EventPayload.FromString(raw)
+            return {
+                "target_id": event.target_id,
+                "event_name": event.event_name,
+                "data": json.loads(event.data) if event.data else {},
+            }
+        if msg_type == "action":
+            action = pb.ActionPayload.FromString(raw)
+            payload = {
+                "action": action.action,
+                "params": json.loads(action.params) if action.params else {},
+            }
+            if action.target_url:
+                payload["target_url"] = action.target_url
+            return payload
+        if msg_type == "action_ack":
+            ack = pb.ActionAckPayload.FromString(raw)
+            return {
+                "action_msg_id": ack.action_msg_id,
+                "success": ack.success,
+                "message": ack.message,
+            }
+        if msg_type == "heartbeat":
+            heartbeat = pb.HeartbeatPayload.FromString(raw)
+            payload = {"target_id": heartbeat.target_id, "status": heartbeat.status}
+            if heartbeat.metrics:
+                payload["metrics"] = dict(heartbeat.metrics)
+            return payload
+        if msg_type == "register":
+            register = pb.RegisterPayload.FromString(raw)
+            payload = {"target_id": register.target_id, "sdk_url": register.sdk_url}
+            if register.metadata:
+                payload["metadata"] = dict(register.metadata)
+            return payload
+        if msg_type == "error":
+            error = pb.ErrorPayload.FromString(raw)
+            return {"code": error.code, "message": error.message}
+        return {}
+
+
+_EVENT_FIELDS = {"target_id": str, "event_name": str, "data": object}
+_ACTION_FIELDS = {"action": str, "params": object, "target_url": str}
+_ACK_FIELDS = {"action_msg_id": str, "success": bool, "message": str}
+_HEARTBEAT_FIELDS = {"target_id": str, "status": str, "metrics": dict}
+_REGISTER_FIELDS = {"target_id": str, "sdk_url": str, "metadata": dict}
+_ERROR_FIELDS = {"code": str, "message": str}
+
+
+def _fits(payload: dict[str, Any], fields: dict[str, type]) -> bool:
+    for key, value in payload.items():
+        expected = fields.get(key)
+        if expected is None or not isinstance(value, expected):
+            return False
+        if expected is dict and not all(
+            isinstance(k, str) and isinstance(v, str) for k, v in value.items()
+        ):
+            return False
+    return True
+
+
+def _envelope_header(msg_type: str, target_id: str | None) -> str:
+    header = f',"type":{encode_basestring(msg_type)}'
+    if target_id is not None:
+        header += f',"target_id":{encode_basestring(target_id)}'
+    return f'{header},"timestamp":'
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+_FACTORIES = {
+    JSON_SUBPROTOCOL: JsonCodec,
+    MSGPACK_SUBPROTOCOL: MsgpackCodec,
+    PROTOBUF_SUBPROTOCOL: ProtobufCodec,
+}
+
+DEFAULT_CODEC = JsonCodec()
+
+
+def codec_for_subprotocol(subprotocol: str | None) -> Codec:
+    if not subprotocol or subprotocol == JSON_SUBPROTOCOL:
+        return DEFAULT_CODEC
+    factory = _FACTORIES.get(subprotocol)
+    if factory is None:
+        raise ValueError(f"unsupported subprotocol: {subprotocol}")
+    return factory()
+
+
+def select_codec(codecs: Sequence[Codec], offered: Sequence[str]) -> Codec:
+    offered_set = set(offered)
+    for codec in codecs:
+        if codec.subprotocol in offered_set:
+            return codec
+    return DEFAULT_CODEC
@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+import zlib
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+from .codec import Codec, EnvelopeLike, Frame
+
+COMPRESSION_HEADER = "X-AMonitor-Compression"
+
+ZLIB = "zlib"
+ZSTD = "zstd"
+
+RAW_MARKER = 0x00
+ZLIB_MARKER = 0x01
+ZSTD_MARKER = 0x02
+
+COMPRESSION_COUNTER_NAMES = ("compressed", "skipped", "bytes_in", "bytes_out")
+
+
+class Compressor(Protocol):
+    name: str
+    marker: int
+
+    def compress(self, data: bytes) -> bytes: ...
+
+    def decompress(self, data: bytes, max_size: int) -> bytes: ...
+
+
+class ZlibCompressor:
+    name = ZLIB
+    marker = ZLIB_MARKER
+
+    def __init__(self, level: int = 6) -> None:
+        self.level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self.level)
+
+    def decompress(self, data: bytes, max_size: int) -> bytes:
+        decompressor = zlib.decompressobj()
+        output = decompressor.decompress(data, max_size)
+        if decompressor.unconsumed_tail:
+            raise ValueError(f"decompressed frame exceeds {max_size} bytes")
+        return output
+
+
+class ZstdCompressor:
+    name = ZSTD
+    marker = ZSTD_MARKER
+
+    def __init__(self, level: int = 3) -> None:
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise ImportError(
+                "zstd compression requires: pip install 'amonitor-sdk[zstd]'"
+            ) from exc
+        self.level = level
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+        self._content_size = zstandard.frame_content_size
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes, max_size: int) -> bytes:
+        if self._content_size(data) > max_size:
+            raise ValueError(f"decompressed frame exceeds {max_size} bytes")
+        return self._decompressor.decompress(data, max_output_size=max_size)
+
+
+_FACTORIES: dict[str, type[ZlibCompressor | ZstdCompressor]] = {
+    ZLIB: ZlibCompressor,
+    ZSTD: ZstdCompressor,
+}
+
+
+def make_compressor(name: str, level: int | None = None) -> Compressor:
+    factory = _FACTORIES.get(name)
+    if factory is None:
+        raise ValueError(f"unsupported compression: {name}")
+    return factory() if level is None else factory(level)
+
+
+class CompressedCodec:
+    def __init__(
+        self,
+        codec: Codec,
+        compressor: Compressor,
+        threshold: int = 1024,
+        max_size: int = 2**20,
+    ) -> None:
+        self.codec = codec
+        self.compressor = compressor
+        self.threshold = threshold
+        self.max_size = max_size
+        self.name = f"{codec.name}+{compressor.name}"
+        self.subprotocol = codec.subprotocol
+        self.counters = dict.fromkeys(COMPRESSION_COUNTER_NAMES, 0)
+        self._marker = bytes([compressor.marker])
+        self._raw = bytes([RAW_MARKER])
+
+    def encode(self, envelope: EnvelopeLike) -> Frame:
+        frame = self.codec.encode(envelope)
+        if len(frame) < self.threshold:
+            return frame if isinstance(frame, str) else self._raw + frame
+        data = frame.encode() if isinstance(frame, str) else frame
+        compressed = self.compressor.compress(data)
+        self.counters["bytes_in"] += len(data)
+        if len(compressed) >= len(data):
+            self.counters["skipped"] += 1
+            self.counters["bytes_out"] += len(data)
+            return frame if isinstance(frame, str) else self._raw + frame
+        self.counters["compressed"] += 1
+        self.counters["bytes_out"] += len(compressed)
+        return self._marker + compressed
+
+    def decode(self, frame: Frame) -> dict[str, Any]:
+        if isinstance(frame, str):
+            return self.codec.decode(frame)
+        return self.codec.decode(decompress_frame(frame, self.compressor, self.max_size))
+
+    def stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = {"threshold": self.threshold, **self.counters}
+        if self.counters["bytes_in"]:
+            stats["ratio"] = round(self.counters["bytes_out"] / self.counters["bytes_in"], 3)
+        return stats
+
+
+def decompress_frame(frame: bytes, compressor: Compressor, max_size: int = 2**20) -> bytes:
+    if not frame:
+        raise ValueError("empty compressed frame")
+    marker = frame[0]
+    if marker == RAW_MARKER:
+        return frame[1:]
+    if marker != compressor.marker:
+        raise ValueError(f"unexpected compression marker: {marker:#04x}")
+    return compressor.decompress(frame[1:], max_size)
+
+
+def parse_offer(value: str | None) -> list[str]:
+    if not value:
+        return []
+    return [item.strip().lower() for item in value.split(",") if item.strip()]
+
+
+def select_compression(preferred: Sequence[str], offered: Iterable[str]) -> str | None:
+    offered_set = set(offered)
+    for name in preferred:
+        if name in offered_set:
+            return name
+    return None
+
+
+def offer_headers(algorithms: Sequence[str]) -> dict[str, str]:
+    return {COMPRESSION_HEADER: ", ".join(algorithms)} if algorithms else {}
+
+
+def negotiated_codec(
+    codec: Codec,
+    algorithm: str | None,
+    threshold: int = 1024,
+    level: int | None = None,
+) -> Codec:
+    if not algorithm:
+        return codec
+    return CompressedCodec(codec, make_compressor(algorithm, level), threshold=threshold)
+
+
+@dataclass(slots=True)
+class CompressionOptions:
+    permessage_deflate: bool = True
+    deflate_level: int = 6
+    deflate_mem_level: int = 5
+    deflate_max_window_bits: int = 12
+    deflate_no_context_takeover: bool = False
+    algorithms: Sequence[str] = ()
+    threshold: int = 1024
+    level: int | None = None
+    max_size: int = 2**20
+
+    def __post_init__(self) -> None:
+        self.algorithms = tuple(name.lower() for name in self.algorithms)
+        for name in self.algorithms:
+            if name not in _FACTORIES:
+                raise ValueError(f"unsupported compression: {name}")
+        if self.threshold < 0:
+            raise ValueError("threshold must be >= 0")
+
+    def server_extensions(self) -> list[Any]:
+        if not self.permessage_deflate:
+            return []
+        from websockets.extensions.permessage_deflate import ServerPerMessageDeflateFactory
+
+        return [
+            ServerPerMessageDeflateFactory(
+                server_no_context_takeover=self.deflate_no_context_takeover,
+                server_max_window_bits=self.deflate_max_window_bits,
+                client_max_window_bits=self.deflate_max_window_bits,
+                compress_settings=self._compress_settings(),
+            )
+        ]
+
+    def client_extensions(self) -> list[Any]:
+        if not self.permessage_deflate:
+            return []
+        from websockets.extensions.permessage_deflate import ClientPerMessageDeflateFactory
+
+        return [
+            ClientPerMessageDeflateFactory(
+                client_no_context_takeover=self.deflate_no_context_takeover,
+                server_max_window_bits=self.deflate_max_window_bits,
+                client_max_window_bits=self.deflate_max_window_bits,
+                compress_settings=self._compress_settings(),
+            )
+        ]
+
+    def _compress_settings(self) -> dict[str, int]:
+        return {"level": self.deflate_level, "memLevel": self.deflate_mem_level}
+
+    def wrap(self, codec: Codec, algorithm: str) -> CompressedCodec:
+        return CompressedCodec(
+            codec,
+            make_compressor(algorithm, self.level),
+            threshold=self.threshold,
+            max_size=self.max_size,
+        )
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+ActionJob = Callable[[], Awaitable[None]]
+OrderingKey = str | Callable[[str, dict[str, Any]], str | None]
+
+
+class ActionDispatcher:
+    def __init__(self, max_in_flight: int = 64, max_pending: int = 1024) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        if max_pending < 0:
+            raise ValueError("max_pending must be >= 0")
+        self.max_in_flight = max_in_flight
+        self.max_pending = max_pending
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._key_tails: dict[str, asyncio.Task[None]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._queued = 0
+        self._in_flight = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queued
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def submit(self, job: ActionJob, key: str | None = None) -> asyncio.Task[None] | None:
+        if len(self._tasks) >= self.max_in_flight + self.max_pending:
+            self._rejected += 1
+            return None
+        previous = self._key_tails.get(key) if key is not None else None
+        self._queued += 1
+        task = asyncio.create_task(self._run(job, previous))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        if key is not None:
+            self._key_tails[key] = task
+            task.add_done_callback(lambda done: self._release_key(key, done))
+        return task
+
+    def _release_key(self, key: str, task: asyncio.Task[None]) -> None:
+        if self._key_tails.get(key) is task:
+            del self._key_tails[key]
+
+    async def _run(self, job: ActionJob, previous: asyncio.Task[None] | None) -> None:
+        started = False
+        try:
+            if previous is not None and not previous.done():
+                await asyncio.wait([previous])
+            async with self._semaphore:
+                self._queued -= 1
+                self._in_flight += 1
+                started = True
+                try:
+                    await job()
+                    self._completed += 1
+                except Exception:  # noqa: BLE001
+                    self._failed += 1
+                finally:
+                    self._in_flight -= 1
+        finally:
+            if not started:
+                self._queued -= 1
+
+    async def drain(self) -> None:
+        while self._tasks:
+            await asyncio.wait(list(self._tasks))
+
+    async def close(self) -> None:
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._key_tails.clear()
+        self._queued = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "max_in_flight": self.max_in_flight,
+            "max_pending": self.max_pending,
+            "queue_depth": self._queued,
+            "in_flight": self._in_flight,
+            "ordering_keys": len(self._key_tails),
+            "completed": self._completed,
+            "failed": self._failed,
+            "rejected": self._rejected,
+        }
+
+
+def resolve_ordering_key(
+    ordering_key: OrderingKey | None,
+    action: str,
+    params: dict[str, Any],
+) -> str | None:
+    if ordering_key is None:
+        return None
+    if callable(ordering_key):
+        return ordering_key(action, params)
+    value = params.get(ordering_key) if isinstance(params, dict) else None
+    return None if value is None else str(value)
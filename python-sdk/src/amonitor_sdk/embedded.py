@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+from collections.abc import Coroutine
+from typing import Any, Self, TypeVar
+
+from .binary import as_byte_view
+from .executor import SyncActionHandler
+from .server import ActionHandler, SDKServer
+
+T = TypeVar("T")
+
+
+class EmbeddedServer:
+    def __init__(
+        self,
+        server: SDKServer,
+        max_pending: int = 65536,
+        max_batch: int = 2048,
+    ) -> None:
+        if max_pending < 1:
+            raise ValueError("max_pending must be >= 1")
+        if max_batch < 1:
+            raise ValueError("max_batch must be >= 1")
+        self.server = server
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pending: list[tuple[str, Any, bool]] = []
+        self._scheduled = False
+        self._closed = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+        self._handoffs = 0
+        self._handed_off = 0
+        self._rejected = 0
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            raise RuntimeError("embedded server is not running")
+        return self._loop
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and not self._closed
+
+    def start(self, timeout: float | None = 10) -> Self:
+        if self._thread is not None:
+            raise RuntimeError("embedded server already started")
+        self._thread = threading.Thread(
+            target=self._thread_main,
+            name=f"amonitor-sdk-{self.server.target_id}",
+            daemon=True,
+        )
+        self._thread.start()
+        if not self._ready.wait(timeout):
+            raise TimeoutError("embedded server did not start in time")
+        if self._error is not None:
+            self._thread.join()
+            raise self._error
+        return self
+
+    def _thread_main(self) -> None:
+        try:
+            asyncio.run(self._main())
+        except BaseException as exc:  # noqa: BLE001
+            self._error = exc
+        finally:
+            self._ready.set()
+
+    async def _main(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._task = asyncio.create_task(self.server.run())
+        started = asyncio.create_task(self.server.started.wait())
+        await asyncio.wait({self._task, started}, return_when=asyncio.FIRST_COMPLETED)
+        started.cancel()
+        if self._task.done():
+            await self._task
+            return
+        self._ready.set()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    def emit_event(self, event_name: str, data: dict[str, Any]) -> bool:
+        return self._enqueue((event_name, data, False))
+
+    def emit_binary(self, event_name: str, buffer: Any) -> bool:
+        return self._enqueue((event_name, bytes(as_byte_view(buffer)), True))
+
+    def _enqueue(self, item: tuple[str, Any, bool]) -> bool:
+        with self._lock:
+            if self._closed or self._loop is None:
+                return False
+            if len(self._pending) >= self.max_pending:
+                self._rejected += 1
+                return False
+            self._pending.append(item)
+            if self._scheduled:
+                return True
+            self._scheduled = True
+        self._loop.call_soon_threadsafe(self._drain_pending)
+        return True
+
+    def _drain_pending(self, drain_all: bool = False) -> None:
+        # Bound the work per callback so a producer burst cannot stall heartbeats and acks;
+        # `_scheduled` stays set while a remainder is queued so producers do not re-schedule.
+        with self._lock:
+            if drain_all or len(self._pending) <= self.max_batch:
+                events, self._pending = self._pending, []
+                self._scheduled = False
+            else:
+                events = self._pending[: self.max_batch]
+                del self._pending[: self.max_batch]
+                asyncio.get_running_loop().call_soon(self._drain_pending)
+        if not events:
+            return
+        self._handoffs += 1
+        self._handed_off += len(events)
+        try_emit = self.server.try_emit
+        try_emit_binary = self.server.try_emit_binary
+        for event_name, data, binary in events:
+            if binary:
+                try_emit_binary(event_name, data)
+            else:
+                try_emit(event_name, data)
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stats(self, timeout: float | None = 5) -> dict[str, Any]:
+        stats = self.submit(self._collect_stats()).result(timeout)
+        with self._lock:
+            stats["embedded"] = {
+                "max_pending": self.max_pending,
+                "pending": len(self._pending),
+                "handoffs": self._handoffs,
+                "handed_off": self._handed_off,
+                "rejected": self._rejected,
+            }
+        return stats
+
+    async def _collect_stats(self) -> dict[str, Any]:
+        return self.server.stats()
+
+    def stop(self, timeout: float | None = 5) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._loop is not None and self._task is not None and not self._loop.is_closed():
+            try:
+                self._loop.call_soon_threadsafe(self._drain_pending, True)
+                self._loop.call_soon_threadsafe(self._task.cancel)
+            except RuntimeError:
+                pass
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def __enter__(self) -> Self:
+        return self if self._thread is not None else self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def start_embedded(
+    host: str,
+    port: int,
+    target_id: str,
+    action_handler: ActionHandler | SyncActionHandler,
+    auth_token: str | None = None,
+    heartbeat_interval: float = 10,
+    max_pending: int = 65536,
+    max_batch: int = 2048,
+    **options: Any,
+) -> EmbeddedServer:
+    server = SDKServer(
+        host=host,
+        port=port,
+        target_id=target_id,
+        action_handler=action_handler,
+        auth_token=auth_token,
+        heartbeat_interval=heartbeat_interval,
+        **options,
+    )
+    return EmbeddedServer(server, max_pending=max_pending, max_batch=max_batch).start()
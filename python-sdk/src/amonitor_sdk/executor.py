@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+SyncActionHandler = Callable[[str, dict[str, Any]], dict[str, Any]]
+AnyActionHandler = Callable[[str, dict[str, Any]], Awaitable[dict[str, Any]] | dict[str, Any]]
+
+POOL_LOOP = "loop"
+POOL_THREAD = "thread"
+POOL_PROCESS = "process"
+_POOLS = (POOL_LOOP, POOL_THREAD, POOL_PROCESS)
+
+
+def is_async_handler(handler: Callable[..., Any]) -> bool:
+    while isinstance(handler, functools.partial):
+        handler = handler.func
+    return inspect.iscoroutinefunction(handler) or inspect.iscoroutinefunction(
+        type(handler).__call__
+    )
+
+
+@dataclass(slots=True)
+class _PoolStats:
+    max_workers: int
+    active: int = 0
+    peak: int = 0
+    submitted: int = 0
+    timeouts: int = 0
+    errors: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        waiting = max(0, self.active - self.max_workers) if self.max_workers else 0
+        saturation = min(1.0, self.active / self.max_workers) if self.max_workers else 0.0
+        return {
+            "max_workers": self.max_workers,
+            "active": self.active,
+            "waiting": waiting,
+            "peak": self.peak,
+            "saturation": round(saturation, 3),
+            "submitted": self.submitted,
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+        }
+
+
+class ActionExecutor:
+    def __init__(
+        self,
+        thread_workers: int = 8,
+        process_workers: int = 0,
+        default_pool: str = POOL_THREAD,
+        routes: dict[str, str] | None = None,
+        timeout: float | None = None,
+        timeouts: dict[str, float] | None = None,
+    ) -> None:
+        if default_pool not in _POOLS:
+            raise ValueError(f"unsupported pool: {default_pool}")
+        for action, pool in (routes or {}).items():
+            if pool not in _POOLS:
+                raise ValueError(f"unsupported pool for action {action}: {pool}")
+        if thread_workers < 1:
+            raise ValueError("thread_workers must be >= 1")
+        if process_workers < 0:
+            raise ValueError("process_workers must be >= 0")
+        uses_process = default_pool == POOL_PROCESS or POOL_PROCESS in (routes or {}).values()
+        if uses_process and process_workers < 1:
+            raise ValueError("process_workers must be >= 1 when routing to the process pool")
+
+        self.default_pool = default_pool
+        self.routes = dict(routes or {})
+        self.timeout = timeout
+        self.timeouts = dict(timeouts or {})
+        self._thread_workers = thread_workers
+        self._process_workers = process_workers
+        self._thread_pool: ThreadPoolExecutor | None = None
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._stats = {
+            POOL_LOOP: _PoolStats(0),
+            POOL_THREAD: _PoolStats(thread_workers),
+            POOL_PROCESS: _PoolStats(process_workers),
+        }
+
+    def pool_for(self, action: str, handler: Callable[..., Any]) -> str:
+        pool = self.routes.get(action)
+        if pool is not None:
+            return pool
+        if is_async_handler(handler):
+            return POOL_LOOP
+        return self.default_pool
+
+    async def run(
+        self,
+        handler: AnyActionHandler,
+        action: str,
+        params: dict[str, Any],
+    ) -> dict[str, Any]:
+        pool = self.pool_for(action, handler)
+        timeout = self.timeouts.get(action, self.timeout)
+        stats = self._stats[pool]
+        stats.submitted += 1
+        stats.active += 1
+        stats.peak = max(stats.peak, stats.active)
+        pooled = False
+        try:
+            if pool == POOL_LOOP:
+                call = handler(action, params)
+                awaitable = call if inspect.isawaitable(call) else _resolved(call)
+            else:
+                awaitable = self._submit(pool, stats, handler, action, params)
+                pooled = True
+            if timeout is None:
+                result = await awaitable
+            else:
+                result = await asyncio.wait_for(awaitable, timeout=timeout)
+            if pooled and inspect.isawaitable(result):
+                # Sync wrappers around coroutine functions (lambdas, functools.wraps
+                # decorators) hand back the coroutine; finish it on the loop.
+                if timeout is None:
+                    result = await result
+                else:
+                    result = await asyncio.wait_for(result, timeout=timeout)
+        except TimeoutError:
+            stats.timeouts += 1
+            return {"ok": False, "message": f"action timed out after {timeout}s"}
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            if not pooled:
+                stats.active -= 1
+        return result
+
+    def _submit(
+        self,
+        pool: str,
+        stats: _PoolStats,
+        handler: AnyActionHandler,
+        action: str,
+        params: dict[str, Any],
+    ) -> asyncio.Future[Any]:
+        # Workers outlive a timed-out await; release the slot only when the worker finishes.
+        loop = asyncio.get_running_loop()
+        try:
+            future = self._executor(pool).submit(handler, action, params)
+        except Exception:
+            stats.active -= 1
+            raise
+
+        def release(_: Future[Any]) -> None:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_release, stats)
+
+        future.add_done_callback(release)
+        return asyncio.wrap_future(future, loop=loop)
+
+    def _executor(self, pool: str) -> Executor:
+        if pool == POOL_PROCESS:
+            if self._process_pool is None:
+                from concurrent.futures import ProcessPoolExecutor
+
+                self._process_pool = ProcessPoolExecutor(max_workers=self._process_workers)
+            return self._process_pool
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self._thread_workers,
+                thread_name_prefix="amonitor-action",
+            )
+        return self._thread_pool
+
+    def shutdown(self, wait: bool = False) -> None:
+        if self._thread_pool is not None:
+            self._thread_pool.shutdown(wait=wait, cancel_futures=True)
+            self._thread_pool = None
+        if self._process_pool is not None:
+            self._process_pool.shutdown(wait=wait, cancel_futures=True)
+            self._process_pool = None
+
+    def stats(self) -> dict[str, Any]:
+        return {pool: stats.as_dict() for pool, stats in self._stats.items()}
+
+
+def _release(stats: _PoolStats) -> None:
+    stats.active -= 1
+
+
+async def _resolved(value: dict[str, Any]) -> dict[str, Any]:
+    return value
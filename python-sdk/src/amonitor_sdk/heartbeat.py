@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import random
+from collections.abc import Callable
+from typing import Any
+
+TickHandler = Callable[[list[Any]], None]
+
+
+class HeartbeatScheduler:
+    def __init__(
+        self,
+        interval: float,
+        on_tick: TickHandler,
+        jitter: float = 0.1,
+        resolution: float | None = None,
+    ) -> None:
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        if not 0 <= jitter < 1:
+            raise ValueError("jitter must be in [0, 1)")
+        self.interval = interval
+        self.jitter = jitter
+        self.resolution = resolution if resolution is not None else min(0.05, interval / 10)
+        self._on_tick = on_tick
+        self._heap: list[tuple[float, int, Any]] = []
+        self._members: dict[Any, int] = {}
+        self._seq = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._ticks = 0
+        self._beats = 0
+        self._errors = 0
+        self._last_drift = 0.0
+        self._max_drift = 0.0
+        self._total_drift = 0.0
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def add(self, member: Any, fire_now: bool = True) -> None:
+        if fire_now:
+            self._tick([member])
+            self._beats += 1
+        if member in self._members:
+            return
+        phase = random.uniform(0, self.jitter * self.interval)
+        due = asyncio.get_running_loop().time() + self.interval + phase
+        self._push(due, member)
+        self._wakeup.set()
+
+    def discard(self, member: Any) -> None:
+        self._members.pop(member, None)
+
+    def _push(self, due: float, member: Any) -> None:
+        seq = self._members[member] = next(self._seq)
+        heapq.heappush(self._heap, (due, seq, member))
+
+    def _is_live(self, seq: int, member: Any) -> bool:
+        return self._members.get(member) == seq
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            while self._heap and not self._is_live(self._heap[0][1], self._heap[0][2]):
+                heapq.heappop(self._heap)
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+            delay = self._heap[0][0] - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except TimeoutError:
+                    pass
+                continue
+            self._fire(loop.time())
+
+    def _fire(self, now: float) -> None:
+        horizon = now + self.resolution
+        members: list[Any] = []
+        earliest = self._heap[0][0]
+        while self._heap and self._heap[0][0] <= horizon:
+            due, seq, member = heapq.heappop(self._heap)
+            if not self._is_live(seq, member):
+                continue
+            members.append(member)
+            next_due = due + self.interval
+            if next_due <= now:
+                next_due = now + self.interval
+            self._push(next_due, member)
+        if not members:
+            return
+        drift = max(0.0, now - earliest)
+        self._ticks += 1
+        self._beats += len(members)
+        self._last_drift = drift
+        self._max_drift = max(self._max_drift, drift)
+        self._total_drift += drift
+        self._tick(members)
+
+    def _tick(self, members: list[Any]) -> None:
+        # One bad encode or snapshot must not stop heartbeats for every connection.
+        try:
+            self._on_tick(members)
+        except Exception:  # noqa: BLE001
+            self._errors += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "interval": self.interval,
+            "jitter": self.jitter,
+            "members": len(self._members),
+            "ticks": self._ticks,
+            "heartbeats": self._beats,
+            "errors": self._errors,
+            "last_drift_ms": round(self._last_drift * 1000, 3),
+            "max_drift_ms": round(self._max_drift * 1000, 3),
+            "avg_drift_ms": round(self._total_drift / self._ticks * 1000, 3)
+            if self._ticks
+            else 0.0,
+        }
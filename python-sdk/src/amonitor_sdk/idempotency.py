@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any, Protocol
+
+from .models import Envelope
+
+Ack = Envelope
+StoredAck = dict[str, Any]
+
+
+class AckStore(Protocol):
+    def load(self, msg_id: str) -> tuple[StoredAck, float] | None: ...
+
+    def save(self, msg_id: str, ack: StoredAck, expires_at: float) -> None: ...
+
+
+class IdempotencyCache:
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        ttl: float = 600,
+        store: AckStore | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.store = store
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[Ack, float]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Future[Ack]] = {}
+        self._counters = dict.fromkeys(
+            ("hits", "joined", "misses", "evicted", "expired", "store_hits", "store_errors"),
+            0,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, msg_id: str) -> Ack | None:
+        now = self._clock()
+        entry = self._entries.get(msg_id)
+        if entry is not None:
+            if entry[1] > now:
+                self._entries.move_to_end(msg_id)
+                return entry[0]
+            del self._entries[msg_id]
+            self._counters["expired"] += 1
+        if self.store is None:
+            return None
+        try:
+            stored = self.store.load(msg_id)
+        except Exception:  # noqa: BLE001
+            self._counters["store_errors"] += 1
+            return None
+        if stored is None or stored[1] <= now:
+            return None
+        self._counters["store_hits"] += 1
+        ack = Envelope.from_dict(stored[0])
+        self._insert(msg_id, ack, stored[1])
+        return ack
+
+    def put(self, msg_id: str, ack: Ack) -> None:
+        expires_at = self._clock() + self.ttl
+        self._insert(msg_id, ack, expires_at)
+        if self.store is None:
+            return
+        try:
+            self.store.save(msg_id, ack.to_dict(), expires_at)
+        except Exception:  # noqa: BLE001
+            self._counters["store_errors"] += 1
+
+    async def run(self, msg_id: str, execute: Callable[[], Awaitable[Ack]]) -> Ack:
+        cached = self.get(msg_id)
+        if cached is not None:
+            self._counters["hits"] += 1
+            return cached
+        pending = self._in_flight.get(msg_id)
+        if pending is not None:
+            self._counters["joined"] += 1
+            return await asyncio.shield(pending)
+
+        self._counters["misses"] += 1
+        future: asyncio.Future[Ack] = asyncio.get_running_loop().create_future()
+        self._in_flight[msg_id] = future
+        try:
+            ack = await execute()
+        except BaseException as exc:
+            if isinstance(exc, Exception):
+                future.set_exception(exc)
+            else:
+                future.set_exception(RuntimeError(f"action {msg_id} was cancelled"))
+            future.exception()
+            raise
+        finally:
+            self._in_flight.pop(msg_id, None)
+        self.put(msg_id, ack)
+        future.set_result(ack)
+        return ack
+
+    def _insert(self, msg_id: str, ack: Ack, expires_at: float) -> None:
+        self._entries[msg_id] = (ack, expires_at)
+        self._entries.move_to_end(msg_id)
+        now = self._clock()
+        while self._entries:
+            oldest_id, (_, oldest_expiry) = next(iter(self._entries.items()))
+            if len(self._entries) > self.max_entries:
+                self._counters["evicted"] += 1
+            elif oldest_expiry <= now:
+                self._counters["expired"] += 1
+            else:
+                break
+            del self._entries[oldest_id]
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "max_entries": self.max_entries,
+            "ttl": self.ttl,
+            "entries": len(self._entries),
+            "in_flight": len(self._in_flight),
+            **self._counters,
+        }
@@ -1,8 +1,34 @@
 from __future__ import annotations
 
+import itertools
+import os
+import time
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import Any
 
+_id_prefix = ""
+_id_counter = itertools.count()
+
+
+def _reset_ids() -> None:
+    global _id_prefix, _id_counter
+    _id_prefix = f"{os.urandom(8).hex()}-"
+    _id_counter = itertools.count()
+
+
+_reset_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_ids)
+
+
+def new_msg_id() -> str:
+    return f"{_id_prefix}{next(_id_counter):x}"
+
+
+def now_ms() -> int:
+    return time.time_ns() // 1_000_000
+
 
 @dataclass(slots=True)
 class Envelope:
@@ -12,3 +38,41 @@ class Envelope:
     trace_id: str | None = None
     target_id: str | None = None
     payload: dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def new(
+        cls,
+        msg_type: str,
+        target_id: str | None = None,
+        payload: dict[str, Any] | None = None,
+        trace_id: str | None = None,
+    ) -> Envelope:
+        return cls(
+            msg_id=new_msg_id(),
+            type=msg_type,
+            timestamp=now_ms(),
+            trace_id=trace_id,
+            target_id=target_id,
+            payload=payload if payload is not None else {},
+        )
+
+    @classmethod
+    def from_dict(cls, value: Mapping[str, Any]) -> Envelope:
+        return cls(
+            msg_id=value.get("msg_id", ""),
+            type=value.get("type", ""),
+            timestamp=int(value.get("timestamp", 0)),
+            trace_id=value.get("trace_id"),
+            target_id=value.get("target_id"),
+            payload=value.get("payload") or {},
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {"msg_id": self.msg_id, "type": self.type}
+        if self.trace_id is not None:
+            data["trace_id"] = self.trace_id
+        if self.target_id is not None:
+            data["target_id"] = self.target_id
+        data["timestamp"] = self.timestamp
+        data["payload"] = self.payload
+        return data
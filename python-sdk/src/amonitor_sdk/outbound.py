@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any
+
+from websockets.exceptions import ConnectionClosed
+
+Frame = str | bytes | tuple[bytes, memoryview]
+
+DROP_OLDEST = "drop_oldest"
+DROP_NEW = "drop_new"
+COALESCE = "coalesce"
+OVERFLOW_POLICIES = (DROP_OLDEST, DROP_NEW, COALESCE)
+
+COUNTER_NAMES = ("sent", "dropped_oldest", "dropped_new", "coalesced", "send_errors")
+
+
+class OutboundQueue:
+    def __init__(
+        self,
+        websocket: Any,
+        max_events: int = 1024,
+        overflow_policy: str = DROP_OLDEST,
+    ) -> None:
+        if max_events < 1:
+            raise ValueError("max_events must be >= 1")
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"unsupported overflow_policy: {overflow_policy}")
+        self.websocket = websocket
+        self.max_events = max_events
+        self.overflow_policy = overflow_policy
+        self._control: deque[Frame] = deque()
+        self._bulk: deque[list[Any]] = deque()
+        self._latest: dict[str, list[Any]] = {}
+        self._wakeup = asyncio.Event()
+        self._space = asyncio.Event()
+        self._space.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._closed = False
+        self._task: asyncio.Task[None] | None = None
+        self.counters = dict.fromkeys(COUNTER_NAMES, 0)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._writer())
+
+    async def close(self) -> None:
+        self._closed = True
+        self._space.set()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    @property
+    def control_depth(self) -> int:
+        return len(self._control)
+
+    @property
+    def bulk_depth(self) -> int:
+        return len(self._bulk)
+
+    def has_space(self) -> bool:
+        return len(self._bulk) < self.max_events
+
+    def put_control(self, frame: Frame) -> None:
+        if self._closed:
+            return
+        self._control.append(frame)
+        self._idle.clear()
+        self._wakeup.set()
+
+    def put_event(self, frame: Frame, key: str | None = None) -> bool:
+        if self._closed:
+            return False
+        if len(self._bulk) >= self.max_events:
+            if self.overflow_policy == COALESCE and key is not None:
+                pending = self._latest.get(key)
+                if pending is not None:
+                    pending[1] = frame
+                    self.counters["coalesced"] += 1
+                    return True
+            if self.overflow_policy == DROP_NEW:
+                self.counters["dropped_new"] += 1
+                return False
+            self._pop_bulk()
+            self.counters["dropped_oldest"] += 1
+        entry = [key, frame]
+        self._bulk.append(entry)
+        if key is not None:
+            self._latest[key] = entry
+        self._update_space()
+        self._idle.clear()
+        self._wakeup.set()
+        return True
+
+    def _pop_bulk(self) -> Frame:
+        key, frame = entry = self._bulk.popleft()
+        if key is not None and self._latest.get(key) is entry:
+            del self._latest[key]
+        return frame
+
+    def _update_space(self) -> None:
+        if len(self._bulk) < self.max_events:
+            self._space.set()
+        else:
+            self._space.clear()
+
+    async def wait_for_space(self) -> None:
+        while not self._closed and not self.has_space():
+            self._space.clear()
+            await self._space.wait()
+
+    async def drain(self) -> None:
+        if self._task is not None and not self._closed:
+            await self._idle.wait()
+
+    async def _writer(self) -> None:
+        while True:
+            if self._control:
+                frame = self._control.popleft()
+            elif self._bulk:
+                frame = self._pop_bulk()
+                self._update_space()
+            else:
+                self._idle.set()
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            try:
+                await self.websocket.send(frame)
+            except ConnectionClosed:
+                self._closed = True
+                self._space.set()
+                self._idle.set()
+                return
+            except Exception:  # noqa: BLE001
+                self.counters["send_errors"] += 1
+                continue
+            self.counters["sent"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "control_depth": len(self._control),
+            "bulk_depth": len(self._bulk),
+            **self.counters,
+        }
@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, Self
+
+import websockets
+from websockets.exceptions import InvalidURI
+
+from .codec import DEFAULT_CODEC
+from .models import Envelope, new_msg_id, now_ms
+from .reverse import Backoff
+
+DUPLICATE_ACK_MESSAGE = "duplicate ignored"
+
+SubscriptionKey = tuple[str | None, str | None]
+
+
+@dataclass(slots=True)
+class ActionResult:
+    msg_id: str
+    target_id: str | None
+    success: bool
+    message: str
+    latency_ms: float
+    attempts: int
+    duplicate: bool = False
+    error_code: str | None = None
+
+
+@dataclass(slots=True, eq=False)
+class _PendingAction:
+    msg_id: str
+    target_id: str | None
+    frame: str | bytes
+    future: asyncio.Future[ActionResult]
+    submitted_at: float
+    timer: asyncio.TimerHandle | None = None
+    attempts: int = 0
+
+
+class Subscription:
+    def __init__(self, client: PanelClient, key: SubscriptionKey, maxsize: int) -> None:
+        self.key = key
+        self.maxsize = maxsize
+        self.dropped = 0
+        self._client = client
+        self._items: deque[Envelope] = deque()
+        self._wakeup = asyncio.Event()
+        self._closed = False
+
+    def _deliver(self, envelope: Envelope) -> None:
+        if len(self._items) >= self.maxsize:
+            self._items.popleft()
+            self.dropped += 1
+        self._items.append(envelope)
+        self._wakeup.set()
+
+    async def get(self) -> Envelope:
+        while not self._items:
+            if self._closed:
+                raise StopAsyncIteration
+            self._wakeup.clear()
+            await self._wakeup.wait()
+        return self._items.popleft()
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> Envelope:
+        return await self.get()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._wakeup.set()
+        self._client._unsubscribe(self)
+
+
+class PanelClient:
+    def __init__(
+        self,
+        url: str,
+        auth_token: str | None = None,
+        action_timeout: float | None = 30,
+        backoff: Backoff | None = None,
+        open_timeout: float = 10,
+        resend_on_reconnect: bool = True,
+        connect_options: Mapping[str, Any] | None = None,
+    ) -> None:
+        if action_timeout is not None and action_timeout <= 0:
+            raise ValueError("action_timeout must be > 0")
+        self.url = url
+        self.auth_token = auth_token
+        self.action_timeout = action_timeout
+        self.backoff = backoff or Backoff()
+        self.open_timeout = open_timeout
+        self.resend_on_reconnect = resend_on_reconnect
+        self.connect_options = dict(connect_options or {})
+        self.codec = DEFAULT_CODEC
+        self.connected = asyncio.Event()
+        self._pending: dict[str, _PendingAction] = {}
+        self._outgoing: deque[str] = deque()
+        self._wakeup = asyncio.Event()
+        self._subscriptions: dict[SubscriptionKey, list[Subscription]] = {}
+        self._task: asyncio.Task[None] | None = None
+        self._websocket: Any = None
+        self._last_error = ""
+        self._counters = dict.fromkeys(
+            (
+                "connects",
+                "failures",
+                "sent",
+                "resent",
+                "acked",
+                "failed",
+                "duplicates",
+                "timeouts",
+                "unmatched_acks",
+                "late_acks",
+                "invalid_frames",
+            ),
+            0,
+        )
+
+    async def __aenter__(self) -> Self:
+        self.start()
+        await self.wait_connected(self.open_timeout)
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def wait_connected(self, timeout: float | None = None) -> None:
+        if self._task is None:
+            raise RuntimeError("panel client is not started")
+        waiter = asyncio.ensure_future(self.connected.wait())
+        done, _ = await asyncio.wait(
+            {waiter, self._task}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+        if waiter not in done:
+            waiter.cancel()
+            if self._task in done:
+                raise ConnectionError(f"panel client stopped: {self._last_error}")
+            raise TimeoutError(f"not connected to {self.url}: {self._last_error}")
+
+    async def close(self) -> None:
+        if self._websocket is not None:
+            await self._websocket.close()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._fail_pending(ConnectionError("panel client closed"))
+        for subscriptions in list(self._subscriptions.values()):
+            for subscription in list(subscriptions):
+                subscription.close()
+
+    def send_action(
+        self,
+        action: str,
+        params: Mapping[str, Any] | None = None,
+        target_id: str | None = None,
+        target_url: str | None = None,
+        msg_id: str | None = None,
+        trace_id: str | None = None,
+        timeout: float | None = None,
+    ) -> asyncio.Future[ActionResult]:
+        loop = asyncio.get_running_loop()
+        msg_id = msg_id or new_msg_id()
+        if msg_id in self._pending:
+            raise ValueError(f"action already pending: {msg_id}")
+        payload: dict[str, Any] = {"action": action, "params": dict(params or {})}
+        if target_url:
+            payload["target_url"] = target_url
+        envelope = Envelope(
+            msg_id=msg_id,
+            type="action",
+            timestamp=now_ms(),
+            trace_id=trace_id or new_msg_id(),
+            target_id=target_id,
+            payload=payload,
+        )
+        future: asyncio.Future[ActionResult] = loop.create_future()
+        pending = self._pending[msg_id] = _PendingAction(
+            msg_id=msg_id,
+            target_id=target_id,
+            frame=self.codec.encode(envelope),
+            future=future,
+            submitted_at=loop.time(),
+        )
+        timeout = timeout if timeout is not None else self.action_timeout
+        if timeout is not None:
+            pending.timer = loop.call_later(timeout, self._expire, pending)
+        future.add_done_callback(lambda _: self._forget(pending))
+        self._outgoing.append(msg_id)
+        self._wakeup.set()
+        return future
+
+    def subscribe(
+        self,
+        msg_type: str | None = None,
+        target_id: str | None = None,
+        maxsize: int = 1024,
+    ) -> Subscription:
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        subscription = Subscription(self, (msg_type, target_id), maxsize)
+        self._subscriptions.setdefault(subscription.key, []).append(subscription)
+        return subscription
+
+    def _unsubscribe(self, subscription: Subscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.key)
+        if subscriptions is None or subscription not in subscriptions:
+            return
+        subscriptions.remove(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.key]
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def stats(self) -> dict[str, Any]:
+        subscriptions = [sub for subs in self._subscriptions.values() for sub in subs]
+        return {
+            "url": self.url,
+            "connected": self.connected.is_set(),
+            "pending": len(self._pending),
+            "queued": len(self._outgoing),
+            **self._counters,
+            "subscriptions": len(subscriptions),
+            "subscription_backlog": sum(len(sub) for sub in subscriptions),
+            "subscription_dropped": sum(sub.dropped for sub in subscriptions),
+            "last_error": self._last_error,
+        }
+
+    async def _run(self) -> None:
+        headers = {"Authorization": f"Bearer {self.auth_token}"} if self.auth_token else None
+        attempt = 0
+        while True:
+            try:
+                async with websockets.connect(
+                    self.url,
+                    additional_headers=headers,
+                    open_timeout=self.open_timeout,
+                    **self.connect_options,
+                ) as websocket:
+                    self._counters["connects"] += 1
+                    started = time.monotonic()
+                    self._requeue()
+                    self.connected.set()
+                    await self._serve(websocket)
+                    self._last_error = ""
+                    if time.monotonic() - started >= self.backoff.maximum:
+                        attempt = 0
+            except InvalidURI as exc:
+                self._last_error = str(exc)
+                self._fail_pending(ConnectionError(self._last_error))
+                return
+            except Exception as exc:  # noqa: BLE001
+                self._counters["failures"] += 1
+                self._last_error = f"{type(exc).__name__}: {exc}"
+            finally:
+                self.connected.clear()
+            if not self.resend_on_reconnect:
+                self._fail_pending(ConnectionError(f"panel connection lost: {self._last_error}"))
+            await asyncio.sleep(self.backoff.delay(attempt))
+            attempt += 1
+
+    def _requeue(self) -> None:
+        self._outgoing = deque(self._pending)
+        self._counters["resent"] += sum(1 for p in self._pending.values() if p.attempts)
+
+    async def _serve(self, websocket: Any) -> None:
+        self._websocket = websocket
+        writer = asyncio.create_task(self._write(websocket))
+        try:
+            async for message in websocket:
+                try:
+                    decoded = self.codec.decode(message)
+                except ValueError:
+                    self._counters["invalid_frames"] += 1
+                    continue
+                if not isinstance(decoded, dict):
+                    self._counters["invalid_frames"] += 1
+                    continue
+                self._dispatch(decoded)
+        finally:
+            self._websocket = None
+            writer.cancel()
+            await asyncio.gather(writer, return_exceptions=True)
+
+    async def _write(self, websocket: Any) -> None:
+        while True:
+            while self._outgoing:
+                pending = self._pending.get(self._outgoing.popleft())
+                if pending is None:
+                    continue
+                pending.attempts += 1
+                await websocket.send(pending.frame)
+                self._counters["sent"] += 1
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+    def _dispatch(self, message: dict[str, Any]) -> None:
+        msg_type = message.get("type")
+        if msg_type == "action_ack":
+            payload = message.get("payload") or {}
+            self._resolve(
+                payload.get("action_msg_id", ""),
+                bool(payload.get("success")),
+                str(payload.get("message", "")),
+                duplicate=payload.get("message") == DUPLICATE_ACK_MESSAGE,
+            )
+        elif msg_type == "error" and message.get("msg_id") in self._pending:
+            payload = message.get("payload") or {}
+            self._resolve(
+                message["msg_id"],
+                False,
+                str(payload.get("message", "")),
+                error_code=payload.get("code"),
+            )
+        if not self._subscriptions:
+            return
+        target_id = message.get("target_id")
+        keys = dict.fromkeys(
+            ((msg_type, target_id), (msg_type, None), (None, target_id), (None, None))
+        )
+        matched = [
+            subscription for key in keys for subscription in self._subscriptions.get(key, ())
+        ]
+        if not matched:
+            return
+        envelope = Envelope.from_dict(message)
+        for subscription in matched:
+            subscription._deliver(envelope)
+
+    def _resolve(
+        self,
+        msg_id: str,
+        success: bool,
+        message: str,
+        duplicate: bool = False,
+        error_code: str | None = None,
+    ) -> None:
+        pending = self._pending.get(msg_id)
+        if pending is None:
+            self._counters["unmatched_acks"] += 1
+            return
+        if pending.future.done():
+            # Cancelled, timed out or expired before the done-callback dropped the entry.
+            self._counters["late_acks"] += 1
+            return
+        self._counters["acked" if success else "failed"] += 1
+        self._counters["duplicates"] += duplicate
+        pending.future.set_result(
+            ActionResult(
+                msg_id=msg_id,
+                target_id=pending.target_id,
+                success=success,
+                message=message,
+                latency_ms=(asyncio.get_running_loop().time() - pending.submitted_at) * 1000,
+                attempts=pending.attempts,
+                duplicate=duplicate,
+                error_code=error_code,
+            )
+        )
+
+    def _expire(self, pending: _PendingAction) -> None:
+        if not pending.future.done():
+            self._counters["timeouts"] += 1
+            pending.future.set_exception(TimeoutError(f"action {pending.msg_id} timed out"))
+
+    def _forget(self, pending: _PendingAction) -> None:
+        if self._pending.get(pending.msg_id) is pending:
+            del self._pending[pending.msg_id]
+        if pending.timer is not None:
+            pending.timer.cancel()
+
+    def _fail_pending(self, exc: BaseException) -> None:
+        for pending in list(self._pending.values()):
+            if not pending.future.done():
+                pending.future.set_exception(exc)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import websockets
+from websockets.exceptions import InvalidURI
+
+from .models import Envelope
+
+ConnectionHandler = Callable[[Any], Awaitable[None]]
+
+
+@dataclass(slots=True)
+class Backoff:
+    initial: float = 0.5
+    maximum: float = 30
+    multiplier: float = 2
+    jitter: float = 0.5
+
+    def __post_init__(self) -> None:
+        if self.initial <= 0 or self.maximum < self.initial:
+            raise ValueError("backoff needs 0 < initial <= maximum")
+        if self.multiplier < 1:
+            raise ValueError("multiplier must be >= 1")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError("jitter must be in [0, 1]")
+
+    def delay(self, attempt: int) -> float:
+        base = min(self.maximum, self.initial * self.multiplier ** min(attempt, 64))
+        return base * (1 - self.jitter * random.random())
+
+
+@dataclass(slots=True)
+class _LinkState:
+    url: str
+    connected: bool = False
+    attempt: int = 0
+    connects: int = 0
+    failures: int = 0
+    next_retry_in: float = 0.0
+    last_error: str = ""
+
+
+class AgentConnector:
+    def __init__(
+        self,
+        urls: Sequence[str],
+        on_connect: ConnectionHandler,
+        auth_token: str | None = None,
+        subprotocols: Sequence[str] = (),
+        backoff: Backoff | None = None,
+        open_timeout: float = 10,
+        headers: Mapping[str, str] | None = None,
+        connect_options: Mapping[str, Any] | None = None,
+    ) -> None:
+        if not urls:
+            raise ValueError("at least one agent url is required")
+        self.urls = tuple(urls)
+        self.on_connect = on_connect
+        self.auth_token = auth_token
+        self.subprotocols = tuple(subprotocols)
+        self.backoff = backoff or Backoff()
+        self.open_timeout = open_timeout
+        self.headers = dict(headers or {})
+        self.connect_options = dict(connect_options or {})
+        self._links = [_LinkState(url=url) for url in self.urls]
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [asyncio.create_task(self._run_link(link)) for link in self._links]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run_link(self, link: _LinkState) -> None:
+        headers = dict(self.headers)
+        if self.auth_token:
+            headers["Authorization"] = f"Bearer {self.auth_token}"
+        while True:
+            try:
+                async with websockets.connect(
+                    link.url,
+                    additional_headers=headers or None,
+                    subprotocols=list(self.subprotocols) or None,
+                    open_timeout=self.open_timeout,
+                    **self.connect_options,
+                ) as websocket:
+                    link.connected = True
+                    link.connects += 1
+                    started = time.monotonic()
+                    await self.on_connect(websocket)
+                    link.last_error = ""
+                    if time.monotonic() - started >= self.backoff.maximum:
+                        link.attempt = 0
+            except InvalidURI as exc:
+                link.last_error = str(exc)
+                return
+            except Exception as exc:  # noqa: BLE001
+                link.failures += 1
+                link.last_error = f"{type(exc).__name__}: {exc}"
+            finally:
+                link.connected = False
+            link.next_retry_in = self.backoff.delay(link.attempt)
+            link.attempt += 1
+            await asyncio.sleep(link.next_retry_in)
+
+    def stats(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "url": link.url,
+                "connected": link.connected,
+                "connects": link.connects,
+                "failures": link.failures,
+                "attempt": link.attempt,
+                "next_retry_in": round(link.next_retry_in, 3),
+                "last_error": link.last_error,
+            }
+            for link in self._links
+        ]
+
+
+def build_register(
+    target_id: str,
+    sdk_url: str = "",
+    metadata: Mapping[str, Any] | None = None,
+) -> Envelope:
+    payload: dict[str, Any] = {"target_id": target_id, "sdk_url": sdk_url}
+    if metadata:
+        payload["metadata"] = {str(key): str(value) for key, value in metadata.items()}
+    return Envelope.new("register", target_id=target_id, payload=payload)
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass, field
+from typing import Any
+
+EVENT_POLICY_ACTION = "amonitor.event_policy"
+SUPPRESSED_EVENT = "events_suppressed"
+DEFAULT_POLICY_KEY = "*"
+
+Event = tuple[str, Any]
+
+
+@dataclass(slots=True)
+class EventPolicy:
+    rate: float | None = None
+    burst: float | None = None
+    sample: float = 1.0
+    reservoir: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.rate is not None and self.rate < 0:
+            raise ValueError("rate must be >= 0")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError("burst must be >= 1")
+        if not 0 <= self.sample <= 1:
+            raise ValueError("sample must be in [0, 1]")
+        if self.reservoir is not None and self.reservoir < 0:
+            raise ValueError("reservoir must be >= 0")
+
+    @classmethod
+    def from_dict(cls, value: Mapping[str, Any]) -> EventPolicy:
+        unknown = set(value) - {"rate", "burst", "sample", "reservoir"}
+        if unknown:
+            raise ValueError(f"unknown policy fields: {', '.join(sorted(unknown))}")
+        return cls(**value)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {key: value for key, value in asdict(self).items() if value is not None}
+
+
+@dataclass(slots=True)
+class _EventState:
+    policy: EventPolicy
+    tokens: float
+    refilled_at: float
+    seen: int = 0
+    passed: int = 0
+    suppressed: int = 0
+    window_seen: int = 0
+    window_suppressed: int = 0
+    window_candidates: int = 0
+    held: list[Event] = field(default_factory=list)
+
+
+class EventLimiter:
+    def __init__(
+        self,
+        policies: Mapping[str, EventPolicy] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._policies: dict[str, EventPolicy] = dict(policies or {})
+        self._states: dict[str, _EventState] = {}
+
+    @property
+    def policies(self) -> Mapping[str, EventPolicy]:
+        return self._policies
+
+    def set_policy(self, event_name: str, policy: EventPolicy | None) -> None:
+        if policy is None:
+            self._policies.pop(event_name, None)
+        else:
+            self._policies[event_name] = policy
+        default = self._policies.get(DEFAULT_POLICY_KEY)
+        now = self._clock()
+        for name, state in self._states.items():
+            resolved = self._policies.get(name) or default or EventPolicy()
+            if resolved is not state.policy:
+                state.policy = resolved
+                state.tokens = _burst(resolved)
+                state.refilled_at = now
+
+    def admit(self, event_name: str, data: Any) -> bool:
+        if not self._policies:
+            return True
+        state = self._states.get(event_name)
+        if state is None:
+            policy = self._policies.get(event_name) or self._policies.get(DEFAULT_POLICY_KEY)
+            if policy is None:
+                return True
+            state = self._states[event_name] = _EventState(
+                policy=policy,
+                tokens=_burst(policy),
+                refilled_at=self._clock(),
+            )
+        policy = state.policy
+        state.seen += 1
+        state.window_seen += 1
+        if policy.rate is not None:
+            now = self._clock()
+            state.tokens = min(
+                _burst(policy), state.tokens + (now - state.refilled_at) * policy.rate
+            )
+            state.refilled_at = now
+            if state.tokens < 1:
+                return self._suppress(state)
+            state.tokens -= 1
+        if policy.sample < 1 and self._rng.random() >= policy.sample:
+            return self._suppress(state)
+        if policy.reservoir is not None:
+            return self._hold(state, (event_name, data))
+        state.passed += 1
+        return True
+
+    def _suppress(self, state: _EventState) -> bool:
+        state.suppressed += 1
+        state.window_suppressed += 1
+        return False
+
+    def _hold(self, state: _EventState, event: Event) -> bool:
+        size = state.policy.reservoir or 0
+        held = state.held
+        state.window_candidates += 1
+        if len(held) < size:
+            held.append(event)
+            return False
+        state.suppressed += 1
+        state.window_suppressed += 1
+        slot = self._rng.randrange(state.window_candidates)
+        if slot < size:
+            held[slot] = event
+        return False
+
+    def flush(self, window: float) -> list[Event]:
+        events: list[Event] = []
+        for event_name, state in self._states.items():
+            if state.held:
+                state.passed += len(state.held)
+                events.extend(state.held)
+                state.held = []
+            if state.window_suppressed:
+                events.append(
+                    (
+                        SUPPRESSED_EVENT,
+                        {
+                            "event_name": event_name,
+                            "suppressed": state.window_suppressed,
+                            "seen": state.window_seen,
+                            "window_s": window,
+                            "policy": state.policy.to_dict(),
+                        },
+                    )
+                )
+            state.window_seen = 0
+            state.window_suppressed = 0
+            state.window_candidates = 0
+        return events
+
+    def totals(self) -> dict[str, int]:
+        totals = {"seen": 0, "passed": 0, "suppressed": 0, "held": 0}
+        for state in self._states.values():
+            totals["seen"] += state.seen
+            totals["passed"] += state.passed
+            totals["suppressed"] += state.suppressed
+            totals["held"] += len(state.held)
+        return totals
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "policies": {name: policy.to_dict() for name, policy in self._policies.items()},
+            "events": {
+                name: {
+                    "seen": state.seen,
+                    "passed": state.passed,
+                    "suppressed": state.suppressed,
+                    "held": len(state.held),
+                }
+                for name, state in self._states.items()
+            },
+        }
+
+
+def _burst(policy: EventPolicy) -> float:
+    if policy.burst is not None:
+        return policy.burst
+    if policy.rate == 0:
+        return 0.0
+    return max(1.0, policy.rate or 0.0)
@@ -1,16 +1,46 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
-import time
-import uuid
-from collections.abc import Awaitable, Callable
-from typing import Any
+from collections.abc import Awaitable, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 import websockets
 from websockets.exceptions import ConnectionClosed
 
-ActionHandler = Callable[[str, dict[str, Any]], Awaitable[dict[str, Any]]]
+from .binary import (
+    BINARY_EVENTS_HEADER,
+    BINARY_EVENTS_VERSION,
+    as_byte_view,
+    encode_binary_header,
+)
+from .codec import DEFAULT_CODEC, Codec, select_codec
+from .dispatch import ActionDispatcher, OrderingKey, resolve_ordering_key
+from .executor import ActionExecutor, SyncActionHandler, is_async_handler
+from .heartbeat import HeartbeatScheduler
+from .models import Envelope, new_msg_id, now_ms
+from .outbound import DROP_OLDEST, OutboundQueue
+from .sampling import EVENT_POLICY_ACTION, EventLimiter, EventPolicy
+from .targets import ActionHandler, Target, default_target_path
+
+if TYPE_CHECKING:
+    from .compression import CompressedCodec, CompressionOptions
+    from .idempotency import IdempotencyCache
+    from .metrics import MetricsRegistry, MetricValue
+    from .reverse import AgentConnector, Backoff
+
+
+@dataclass(slots=True, eq=False)
+class _Connection:
+    websocket: Any
+    codec: Codec
+    outbound: OutboundQueue
+    scope: Target | None = None
+    reverse: bool = False
+    binary_events: bool = False
+    metrics_sent: dict[str, dict[str, MetricValue]] = field(default_factory=dict)
 
 
 class SDKServer:
@@ -19,21 +49,345 @@ class SDKServer:
         host: str,
         port: int,
         target_id: str,
-        action_handler: ActionHandler,
+        action_handler: ActionHandler | SyncActionHandler,
         auth_token: str | None = None,
-        heartbeat_interval: int = 10,
+        heartbeat_interval: float = 10,
+        heartbeat_jitter: float = 0.1,
+        dispatch_mode: str = "inline",
+        max_in_flight_actions: int = 64,
+        max_pending_actions: int = 1024,
+        ordering_key: OrderingKey | None = None,
+        executor: ActionExecutor | None = None,
+        batch_events: bool = False,
+        batch_max_items: int = 256,
+        batch_max_delay_ms: float = 20,
+        codecs: Sequence[Codec] | None = None,
+        outbound_max_events: int = 1024,
+        overflow_policy: str = DROP_OLDEST,
+        metrics: MetricsRegistry | None = None,
+        metrics_delta: bool = False,
+        idempotency: IdempotencyCache | None = None,
+        agent_urls: Sequence[str] = (),
+        agent_auth_token: str | None = None,
+        register_metadata: Mapping[str, Any] | None = None,
+        sdk_url: str = "",
+        reconnect_backoff: Backoff | None = None,
+        listen: bool = True,
+        target_path: str | None = None,
+        compression: CompressionOptions | None = None,
+        event_policies: Mapping[str, EventPolicy] | None = None,
+        suppression_interval: float = 10,
     ) -> None:
+        if dispatch_mode not in ("inline", "concurrent"):
+            raise ValueError(f"unsupported dispatch_mode: {dispatch_mode}")
+        if not listen and not agent_urls:
+            raise ValueError("listen=False requires agent_urls")
+        if suppression_interval <= 0:
+            raise ValueError("suppression_interval must be > 0")
         self.host = host
         self.port = port
         self.target_id = target_id
         self.action_handler = action_handler
         self.auth_token = auth_token
         self.heartbeat_interval = heartbeat_interval
-        self._connections: set[Any] = set()
+        self.metrics = metrics
+        self.metrics_delta = metrics_delta
+        self._heartbeats = HeartbeatScheduler(
+            interval=heartbeat_interval,
+            on_tick=self._send_heartbeats,
+            jitter=heartbeat_jitter,
+        )
+        self.dispatch_mode = dispatch_mode
+        self.ordering_key = ordering_key
+        self.codecs: tuple[Codec, ...] = tuple(codecs) if codecs else (DEFAULT_CODEC,)
+        self._codec_by_subprotocol = {codec.subprotocol: codec for codec in self.codecs}
+        self.compression = compression
+        self._compressed_codecs: dict[tuple[str, str], CompressedCodec] = {}
+        self.outbound_max_events = outbound_max_events
+        self.overflow_policy = overflow_policy
+        self.idempotency = idempotency
+        self.listen = listen
+        self.started = asyncio.Event()
+        self.sdk_url = sdk_url
+        self.register_metadata = dict(register_metadata or {})
+        self._connector: AgentConnector | None = None
+        if agent_urls:
+            from .reverse import AgentConnector
+
+            self._connector = AgentConnector(
+                urls=agent_urls,
+                on_connect=self._serve_agent,
+                auth_token=agent_auth_token,
+                subprotocols=[codec.subprotocol for codec in self.codecs],
+                backoff=reconnect_backoff,
+                **self._agent_connect_options(),
+            )
+        self._connections: dict[Any, _Connection] = {}
+        self._closed_outbound: dict[str, int] = {}
+        self._bad_frames = 0
+        self._dispatcher: ActionDispatcher | None = None
+        if dispatch_mode == "concurrent":
+            self._dispatcher = ActionDispatcher(
+                max_in_flight=max_in_flight_actions,
+                max_pending=max_pending_actions,
+            )
+        self._owns_executor = False
+        self._executor = executor
+        self._batching: tuple[int, float] | None = None
+        if batch_events:
+            self._batching = (batch_max_items, batch_max_delay_ms)
+        self.event_policies = dict(event_policies or {})
+        self.suppression_interval = suppression_interval
+        self._targets: dict[str, Target] = {}
+        self._targets_by_path: dict[str, Target] = {}
+        self._default = self.add_target(
+            target_id,
+            action_handler,
+            path=target_path,
+            metrics=metrics,
+        )
+        # A lone default target keeps serving any path; routing turns strict once paths matter.
+        self._strict_paths = target_path is not None
+
+    @property
+    def targets(self) -> Mapping[str, Target]:
+        return self._targets
+
+    def add_target(
+        self,
+        target_id: str,
+        action_handler: ActionHandler | SyncActionHandler,
+        path: str | None = None,
+        metrics: MetricsRegistry | None = None,
+    ) -> Target:
+        if not target_id:
+            raise ValueError("target_id is required")
+        if target_id in self._targets:
+            raise ValueError(f"target already exists: {target_id}")
+        path = (path or default_target_path(target_id)).rstrip("/")
+        if not path:
+            raise ValueError("target path must not be the root path")
+        if path in self._targets_by_path:
+            raise ValueError(f"path already in use: {path}")
+        target = Target(
+            target_id=target_id,
+            action_handler=action_handler,
+            path=path,
+            metrics=metrics,
+        )
+        if self._batching is not None:
+            from .batching import EventBatcher
+
+            target.batcher = EventBatcher(
+                target_id=target_id,
+                send=lambda envelope: self._enqueue_event(envelope, target),
+                max_items=self._batching[0],
+                max_delay_ms=self._batching[1],
+            )
+        if self.event_policies:
+            target.limiter = EventLimiter(self.event_policies)
+        if self._executor is None and not is_async_handler(action_handler):
+            self._executor = ActionExecutor()
+            self._owns_executor = True
+        self._targets[target_id] = target
+        self._targets_by_path[path] = target
+        self._strict_paths = True
+        for conn in self._connections.values():
+            if conn.scope is not None:
+                continue
+            if conn.reverse:
+                from .reverse import build_register
+
+                register = build_register(target_id, self.sdk_url, self.register_metadata)
+                conn.outbound.put_control(conn.codec.encode(register))
+            self._heartbeats.add((conn, target))
+        return target
+
+    async def remove_target(self, target_id: str) -> None:
+        target = self._targets.get(target_id)
+        if target is None:
+            raise KeyError(target_id)
+        if target is self._default:
+            raise ValueError("the default target cannot be removed")
+        if target.batcher is not None:
+            target.batcher.flush()
+        del self._targets[target_id]
+        del self._targets_by_path[target.path]
+        down = Envelope.new(
+            "heartbeat",
+            target_id=target_id,
+            payload={"target_id": target_id, "status": "down"},
+        )
+        bound: list[_Connection] = []
+        for conn in self._target_connections(target):
+            self._heartbeats.discard((conn, target))
+            conn.metrics_sent.pop(target_id, None)
+            conn.outbound.put_control(conn.codec.encode(down))
+            if conn.scope is target:
+                bound.append(conn)
+        for conn in bound:
+            await conn.outbound.drain()
+            await conn.websocket.close(code=4404, reason="target removed")
+
+    def target_stats(self, target_id: str) -> dict[str, Any]:
+        target = self._targets[target_id]
+        stats = target.stats()
+        stats["connections"] = len(self._target_connections(target))
+        return stats
 
     async def run(self) -> None:
-        async with websockets.serve(self._handler, self.host, self.port):
-            await asyncio.Future()
+        self._heartbeats.start()
+        suppression = asyncio.create_task(self._suppression_loop())
+        try:
+            async with contextlib.AsyncExitStack() as stack:
+                if self.listen:
+                    await stack.enter_async_context(
+                        websockets.serve(
+                            self._handler,
+                            self.host,
+                            self.port,
+                            subprotocols=[codec.subprotocol for codec in self.codecs],
+                            select_subprotocol=self._select_subprotocol,
+                            process_response=self._negotiate,
+                            **self._serve_compression_options(),
+                        )
+                    )
+                if self._connector is not None:
+                    self._connector.start()
+                    stack.push_async_callback(self._connector.stop)
+                self.started.set()
+                try:
+                    await asyncio.Future()
+                finally:
+                    self.flush_event_policies()
+                    await self.flush_events()
+                    await self._drain_outbound(timeout=1.0)
+        finally:
+            self.started.clear()
+            suppression.cancel()
+            await asyncio.gather(suppression, return_exceptions=True)
+            await self._heartbeats.stop()
+            if self._dispatcher is not None:
+                await self._dispatcher.close()
+            if self._owns_executor and self._executor is not None:
+                self._executor.shutdown()
+
+    def stats(self) -> dict[str, Any]:
+        dispatch: dict[str, Any] = {"mode": self.dispatch_mode}
+        if self._dispatcher is not None:
+            dispatch.update(self._dispatcher.stats())
+        codecs: dict[str, int] = {}
+        outbound: dict[str, Any] = {
+            "max_events": self.outbound_max_events,
+            "overflow_policy": self.overflow_policy,
+            "control_depth": 0,
+            "bulk_depth": 0,
+            **self._closed_outbound,
+        }
+        binary_connections = 0
+        for conn in self._connections.values():
+            codecs[conn.codec.name] = codecs.get(conn.codec.name, 0) + 1
+            binary_connections += conn.binary_events
+            for name, value in conn.outbound.stats().items():
+                outbound[name] = outbound.get(name, 0) + value
+        stats: dict[str, Any] = {
+            "connections": len(self._connections),
+            "targets": len(self._targets),
+            "codecs": codecs,
+            "binary_connections": binary_connections,
+            "bad_frames": self._bad_frames,
+            "dispatch": dispatch,
+            "outbound": outbound,
+            "heartbeat": self._heartbeats.stats(),
+        }
+        if self._executor is not None:
+            stats["executor"] = self._executor.stats()
+        if self._batching is not None:
+            stats["batching"] = self._batching_stats()
+        if self.idempotency is not None:
+            stats["idempotency"] = self.idempotency.stats()
+        if self._connector is not None:
+            stats["agents"] = self._connector.stats()
+        limiters = [t.limiter for t in self._targets.values() if t.limiter is not None]
+        if limiters:
+            event_policies: dict[str, int] = {"targets": len(limiters)}
+            for limiter in limiters:
+                for name, value in limiter.totals().items():
+                    event_policies[name] = event_policies.get(name, 0) + value
+            stats["event_policies"] = event_policies
+        if self._compressed_codecs:
+            stats["compression"] = {
+                codec.name: codec.stats() for codec in self._compressed_codecs.values()
+            }
+        return stats
+
+    def _batching_stats(self) -> dict[str, Any]:
+        totals: dict[str, Any] = {}
+        for target in self._targets.values():
+            if target.batcher is None:
+                continue
+            for name, value in target.batcher.stats().items():
+                if name in ("max_items", "max_delay_ms"):
+                    totals[name] = value
+                else:
+                    totals[name] = totals.get(name, 0) + value
+        return totals
+
+    def _serve_compression_options(self) -> dict[str, Any]:
+        if self.compression is None:
+            return {}
+        return {
+            "compression": None,
+            "extensions": self.compression.server_extensions(),
+            "max_size": self.compression.max_size,
+        }
+
+    def _agent_connect_options(self) -> dict[str, Any]:
+        if self.compression is None:
+            return {}
+        from .compression import offer_headers
+
+        return {
+            "headers": offer_headers(self.compression.algorithms),
+            "connect_options": {
+                "compression": None,
+                "extensions": self.compression.client_extensions(),
+                "max_size": self.compression.max_size,
+            },
+        }
+
+    def _negotiate(self, connection: Any, request: Any, response: Any) -> None:
+        if request.headers.get(BINARY_EVENTS_HEADER) == BINARY_EVENTS_VERSION:
+            response.headers[BINARY_EVENTS_HEADER] = BINARY_EVENTS_VERSION
+        if self.compression is None or not self.compression.algorithms:
+            return
+        from .compression import COMPRESSION_HEADER, parse_offer, select_compression
+
+        offered = parse_offer(request.headers.get(COMPRESSION_HEADER))
+        algorithm = select_compression(self.compression.algorithms, offered)
+        if algorithm is not None:
+            response.headers[COMPRESSION_HEADER] = algorithm
+
+    def _connection_codec(self, websocket: Any) -> Codec:
+        codec = self._codec_by_subprotocol.get(websocket.subprotocol, DEFAULT_CODEC)
+        if self.compression is None or not self.compression.algorithms:
+            return codec
+        from .compression import COMPRESSION_HEADER
+
+        algorithm = _response_header(websocket, COMPRESSION_HEADER)
+        if algorithm not in self.compression.algorithms:
+            return codec
+        compressed = self._compressed_codecs.get((codec.name, algorithm))
+        if compressed is None:
+            compressed = self.compression.wrap(codec, algorithm)
+            self._compressed_codecs[(codec.name, algorithm)] = compressed
+        return compressed
+
+    def _select_subprotocol(self, connection: Any, subprotocols: Sequence[str]) -> str | None:
+        if not subprotocols:
+            return None
+        codec = select_codec(self.codecs, subprotocols)
+        return codec.subprotocol if codec.subprotocol in subprotocols else None
 
     async def _handler(self, websocket: Any) -> None:
         if self.auth_token:
@@ -41,79 +395,416 @@ class SDKServer:
             if auth != f"Bearer {self.auth_token}":
                 await websocket.close(code=4401, reason="unauthorized")
                 return
+        path = websocket.request.path.split("?", 1)[0].rstrip("/")
+        scope = self._targets_by_path.get(path) if path else None
+        if path and scope is None and self._strict_paths:
+            await websocket.close(code=4404, reason="unknown target")
+            return
+        await self._serve(websocket, scope=scope)
+
+    async def _serve_agent(self, websocket: Any) -> None:
+        await self._serve(websocket, reverse=True)
+
+    async def _serve(
+        self,
+        websocket: Any,
+        scope: Target | None = None,
+        reverse: bool = False,
+    ) -> None:
+        conn = _Connection(
+            websocket=websocket,
+            codec=self._connection_codec(websocket),
+            outbound=OutboundQueue(
+                websocket,
+                max_events=self.outbound_max_events,
+                overflow_policy=self.overflow_policy,
+            ),
+            scope=scope,
+            reverse=reverse,
+            binary_events=_response_header(websocket, BINARY_EVENTS_HEADER)
+            == BINARY_EVENTS_VERSION,
+        )
+        self._connections[websocket] = conn
+        targets = [scope] if scope is not None else list(self._targets.values())
+        if reverse:
+            from .reverse import build_register
 
-        self._connections.add(websocket)
-        hb_task = asyncio.create_task(self._heartbeat_loop(websocket))
+            for target in targets:
+                register = build_register(target.target_id, self.sdk_url, self.register_metadata)
+                conn.outbound.put_control(conn.codec.encode(register))
+        conn.outbound.start()
+        for target in targets:
+            self._heartbeats.add((conn, target))
         try:
             async for message in websocket:
-                await self._on_message(websocket, message)
+                await self._on_message(conn, message)
         except ConnectionClosed:
             return
         finally:
-            hb_task.cancel()
-            self._connections.discard(websocket)
+            for target in [scope] if scope is not None else self._targets.values():
+                self._heartbeats.discard((conn, target))
+            self._connections.pop(websocket, None)
+            await conn.outbound.close()
+            for name, value in conn.outbound.counters.items():
+                self._closed_outbound[name] = self._closed_outbound.get(name, 0) + value
 
-    async def _heartbeat_loop(self, websocket: Any) -> None:
-        while True:
-            envelope = {
-                "msg_id": str(uuid.uuid4()),
-                "type": "heartbeat",
-                "target_id": self.target_id,
-                "timestamp": int(time.time() * 1000),
-                "payload": {"target_id": self.target_id, "status": "up"},
-            }
-            await websocket.send(json.dumps(envelope, ensure_ascii=False))
-            await asyncio.sleep(self.heartbeat_interval)
+    def _target_connections(self, target: Target) -> list[_Connection]:
+        return [
+            conn
+            for conn in self._connections.values()
+            if conn.scope is None or conn.scope is target
+        ]
+
+    def _send_heartbeats(self, members: list[tuple[_Connection, Target]]) -> None:
+        by_target: dict[Target, list[_Connection]] = {}
+        for conn, target in members:
+            by_target.setdefault(target, []).append(conn)
+        for target, conns in by_target.items():
+            self._send_target_heartbeats(target, conns)
+
+    def _send_target_heartbeats(self, target: Target, conns: list[_Connection]) -> None:
+        envelope = Envelope.new(
+            "heartbeat",
+            target_id=target.target_id,
+            payload=target.heartbeat_payload,
+        )
+        target.counters["heartbeats"] += len(conns)
+        if target.metrics is not None:
+            current = target.metrics.snapshot()
+            if self.metrics_delta:
+                self._send_delta_heartbeats(target, conns, envelope, current)
+                return
+            envelope.payload = {**envelope.payload, "metrics": current}
+        frames: dict[Codec, str | bytes] = {}
+        for conn in conns:
+            frame = frames.get(conn.codec)
+            if frame is None:
+                frame = frames[conn.codec] = conn.codec.encode(envelope)
+            conn.outbound.put_control(frame)
+
+    def _send_delta_heartbeats(
+        self,
+        target: Target,
+        conns: list[_Connection],
+        envelope: Envelope,
+        current: dict[str, MetricValue],
+    ) -> None:
+        from .metrics import delta_snapshot
+
+        base_payload = envelope.payload
+        for conn in conns:
+            changed = delta_snapshot(current, conn.metrics_sent.get(target.target_id, {}))
+            conn.metrics_sent[target.target_id] = current
+            envelope.payload = {**base_payload, "metrics": changed, "metrics_mode": "delta"}
+            conn.outbound.put_control(conn.codec.encode(envelope))
 
-    async def _on_message(self, websocket: Any, message: str) -> None:
-        envelope = json.loads(message)
+    async def _on_message(self, conn: _Connection, message: str | bytes) -> None:
+        try:
+            envelope = conn.codec.decode(message)
+        except Exception:  # noqa: BLE001
+            self._bad_frames += 1
+            return
+        if not isinstance(envelope, dict):
+            self._bad_frames += 1
+            return
         msg_type = envelope.get("type")
         if msg_type != "action":
             return
 
         payload = envelope.get("payload", {})
+        if not isinstance(payload, dict):
+            self._bad_frames += 1
+            return
         action = payload.get("action", "")
         params = payload.get("params", {})
 
-        result = await self.action_handler(action, params)
-        ack = {
-            "msg_id": str(uuid.uuid4()),
-            "type": "action_ack",
-            "target_id": self.target_id,
-            "timestamp": int(time.time() * 1000),
-            "payload": {
-                "action_msg_id": envelope.get("msg_id", ""),
+        target = conn.scope
+        if target is None:
+            target_id = envelope.get("target_id") or self.target_id
+            target = self._targets.get(target_id)
+            if target is None and len(self._targets) == 1:
+                target = self._default
+            if target is None:
+                ack = self._build_ack(
+                    target_id,
+                    envelope.get("msg_id", ""),
+                    {"ok": False, "message": f"unknown target: {target_id}"},
+                )
+                conn.outbound.put_control(conn.codec.encode(ack))
+                return
+
+        if self._dispatcher is None:
+            await self._handle_action(conn, target, envelope, action, params)
+            return
+
+        try:
+            key = resolve_ordering_key(self.ordering_key, action, params)
+        except Exception as exc:  # noqa: BLE001
+            self._reject_action(conn, target, envelope, f"ordering_key failed: {exc}")
+            return
+        task = self._dispatcher.submit(
+            lambda: self._handle_action(conn, target, envelope, action, params),
+            key=key,
+        )
+        if task is None:
+            self._reject_action(conn, target, envelope, "action queue full")
+
+    def _reject_action(
+        self,
+        conn: _Connection,
+        target: Target,
+        envelope: dict[str, Any],
+        message: str,
+    ) -> None:
+        target.counters["actions"] += 1
+        target.counters["action_failures"] += 1
+        ack = self._build_ack(
+            target.target_id, envelope.get("msg_id", ""), {"ok": False, "message": message}
+        )
+        conn.outbound.put_control(conn.codec.encode(ack))
+
+    async def _handle_action(
+        self,
+        conn: _Connection,
+        target: Target,
+        envelope: dict[str, Any],
+        action: str,
+        params: dict[str, Any],
+    ) -> None:
+        action_msg_id = envelope.get("msg_id", "")
+        if self.idempotency is not None and action_msg_id:
+            ack = await self.idempotency.run(
+                action_msg_id,
+                lambda: self._execute_action(target, action_msg_id, action, params),
+            )
+        else:
+            ack = await self._execute_action(target, action_msg_id, action, params)
+        conn.outbound.put_control(conn.codec.encode(ack))
+
+    async def _execute_action(
+        self,
+        target: Target,
+        action_msg_id: str,
+        action: str,
+        params: dict[str, Any],
+    ) -> Envelope:
+        target.counters["actions"] += 1
+        try:
+            if action == EVENT_POLICY_ACTION:
+                result = self._apply_event_policy(target, params)
+            elif self._executor is not None:
+                result = await self._executor.run(target.action_handler, action, params)
+            else:
+                result = await target.action_handler(action, params)
+        except Exception as exc:  # noqa: BLE001
+            result = {"ok": False, "message": f"action failed: {exc}"}
+        if not result.get("ok", False):
+            target.counters["action_failures"] += 1
+        return self._build_ack(target.target_id, action_msg_id, result)
+
+    def _apply_event_policy(self, target: Target, params: dict[str, Any]) -> dict[str, Any]:
+        event_name = params.get("event_name")
+        if event_name is not None:
+            if not isinstance(event_name, str) or not event_name:
+                return {"ok": False, "message": "event_name must be a non-empty string"}
+            raw = params.get("policy")
+            try:
+                policy = None if raw is None else EventPolicy.from_dict(raw)
+            except (TypeError, ValueError) as exc:
+                return {"ok": False, "message": f"invalid event policy: {exc}"}
+            if target.limiter is None:
+                target.limiter = EventLimiter()
+            target.limiter.set_policy(event_name, policy)
+        policies = target.limiter.stats()["policies"] if target.limiter is not None else {}
+        return {"ok": True, "message": json.dumps(policies, separators=(",", ":"))}
+
+    def _build_ack(
+        self,
+        target_id: str,
+        action_msg_id: str,
+        result: dict[str, Any],
+    ) -> Envelope:
+        return Envelope.new(
+            "action_ack",
+            target_id=target_id,
+            payload={
+                "action_msg_id": action_msg_id,
                 "success": bool(result.get("ok", False)),
                 "message": str(result.get("message", "")),
             },
-        }
-        await websocket.send(json.dumps(ack, ensure_ascii=False))
+        )
+
+    async def emit_event(
+        self,
+        event_name: str,
+        data: dict[str, Any],
+        target_id: str | None = None,
+    ) -> None:
+        self.try_emit(event_name, data, target_id=target_id)
 
-    async def emit_event(self, event_name: str, data: dict[str, Any]) -> None:
+    def try_emit(
+        self,
+        event_name: str,
+        data: dict[str, Any],
+        target_id: str | None = None,
+    ) -> bool:
+        target = self._targets[target_id] if target_id else self._default
         if not self._connections:
-            return
-        envelope = {
-            "msg_id": str(uuid.uuid4()),
-            "type": "event",
-            "target_id": self.target_id,
-            "timestamp": int(time.time() * 1000),
-            "payload": {
-                "target_id": self.target_id,
+            return False
+        if target.limiter is not None and not target.limiter.admit(event_name, data):
+            return False
+        return self._emit(target, event_name, data)
+
+    def _emit(self, target: Target, event_name: str, data: dict[str, Any]) -> bool:
+        target.counters["events"] += 1
+        if target.batcher is not None:
+            target.batcher.add(event_name, data)
+            return True
+        envelope = Envelope.new(
+            "event",
+            target_id=target.target_id,
+            payload={
+                "target_id": target.target_id,
                 "event_name": event_name,
                 "data": data,
             },
-        }
-        raw = json.dumps(envelope, ensure_ascii=False)
-        await asyncio.gather(*(ws.send(raw) for ws in self._connections), return_exceptions=True)
+        )
+        return self._enqueue_event(envelope, target, key=event_name)
+
+    async def emit_binary(
+        self,
+        event_name: str,
+        buffer: Any,
+        target_id: str | None = None,
+    ) -> None:
+        self.try_emit_binary(event_name, buffer, target_id=target_id)
+
+    def try_emit_binary(
+        self,
+        event_name: str,
+        buffer: Any,
+        target_id: str | None = None,
+    ) -> bool:
+        target = self._targets[target_id] if target_id else self._default
+        view = as_byte_view(buffer)
+        if not any(conn.binary_events for conn in self._connections.values()):
+            return False
+        if target.limiter is not None and not target.limiter.admit(event_name, view):
+            return False
+        return self._emit_binary(target, event_name, view)
+
+    def _emit_binary(self, target: Target, event_name: str, view: memoryview) -> bool:
+        conns = [
+            conn
+            for conn in self._connections.values()
+            if conn.binary_events and (conn.scope is None or conn.scope is target)
+        ]
+        if not conns:
+            return False
+        target.counters["binary_events"] += 1
+        target.counters["binary_bytes"] += view.nbytes
+        header = encode_binary_header(
+            new_msg_id(),
+            target.target_id,
+            event_name,
+            now_ms(),
+        )
+        frame = (header, view)
+        accepted = True
+        for conn in conns:
+            accepted = conn.outbound.put_event(frame, key=event_name) and accepted
+        return accepted
+
+    async def emit(
+        self,
+        event_name: str,
+        data: dict[str, Any],
+        timeout: float | None = None,
+        target_id: str | None = None,
+    ) -> bool:
+        target = self._targets[target_id] if target_id else self._default
+        full = [
+            conn.outbound
+            for conn in self._target_connections(target)
+            if not conn.outbound.has_space()
+        ]
+        if len(full) == 1:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(full[0].wait_for_space(), timeout=timeout)
+        elif full:
+            await _wait_all([outbound.wait_for_space() for outbound in full], timeout=timeout)
+        return self.try_emit(event_name, data, target_id=target_id)
+
+    def flush_event_policies(self) -> None:
+        for target in self._targets.values():
+            if target.limiter is None:
+                continue
+            for event_name, data in target.limiter.flush(self.suppression_interval):
+                if not self._connections:
+                    continue
+                if isinstance(data, memoryview):
+                    self._emit_binary(target, event_name, data)
+                else:
+                    self._emit(target, event_name, data)
+
+    async def _suppression_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.suppression_interval)
+            self.flush_event_policies()
+
+    async def flush_events(self) -> None:
+        for target in self._targets.values():
+            if target.batcher is not None:
+                target.batcher.flush()
+
+    def _enqueue_event(
+        self,
+        envelope: Envelope,
+        target: Target,
+        key: str | None = None,
+    ) -> bool:
+        frames: dict[Codec, str | bytes] = {}
+        accepted = True
+        for conn in self._connections.values():
+            if conn.scope is not None and conn.scope is not target:
+                continue
+            frame = frames.get(conn.codec)
+            if frame is None:
+                frame = frames[conn.codec] = conn.codec.encode(envelope)
+            accepted = conn.outbound.put_event(frame, key=key) and accepted
+        return accepted
+
+    async def _drain_outbound(self, timeout: float) -> None:
+        await _wait_all(
+            [conn.outbound.drain() for conn in self._connections.values()],
+            timeout=timeout,
+        )
+
+
+def _response_header(websocket: Any, name: str) -> str | None:
+    response = getattr(websocket, "response", None)
+    return response.headers.get(name) if response is not None else None
+
+
+async def _wait_all(awaitables: list[Awaitable[None]], timeout: float | None) -> None:
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    if not tasks:
+        return
+    try:
+        await asyncio.wait(tasks, timeout=timeout)
+    finally:
+        for task in tasks:
+            task.cancel()
 
 
 def start_server(
     host: str,
     port: int,
     target_id: str,
-    action_handler: ActionHandler,
+    action_handler: ActionHandler | SyncActionHandler,
     auth_token: str | None = None,
-    heartbeat_interval: int = 10,
+    heartbeat_interval: float = 10,
+    **options: Any,
 ) -> None:
     server = SDKServer(
         host=host,
@@ -122,5 +813,6 @@ def start_server(
         action_handler=action_handler,
         auth_token=auth_token,
         heartbeat_interval=heartbeat_interval,
+        **options,
     )
     asyncio.run(server.run())
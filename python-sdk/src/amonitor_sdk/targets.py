@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .batching import EventBatcher
+    from .executor import SyncActionHandler
+    from .metrics import MetricsRegistry
+    from .sampling import EventLimiter
+
+ActionHandler = Callable[[str, dict[str, Any]], Awaitable[dict[str, Any]]]
+
+TARGET_COUNTER_NAMES = (
+    "actions",
+    "action_failures",
+    "events",
+    "binary_events",
+    "binary_bytes",
+    "heartbeats",
+)
+
+
+def default_target_path(target_id: str) -> str:
+    return f"/{target_id}"
+
+
+@dataclass(slots=True, eq=False)
+class Target:
+    target_id: str
+    action_handler: ActionHandler | SyncActionHandler
+    path: str
+    metrics: MetricsRegistry | None = None
+    batcher: EventBatcher | None = None
+    limiter: EventLimiter | None = None
+    heartbeat_payload: dict[str, Any] = field(init=False)
+    counters: dict[str, int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.heartbeat_payload = {"target_id": self.target_id, "status": "up"}
+        self.counters = dict.fromkeys(TARGET_COUNTER_NAMES, 0)
+
+    def stats(self) -> dict[str, Any]:
+        stats: dict[str, Any] = {"target_id": self.target_id, "path": self.path, **self.counters}
+        if self.batcher is not None:
+            stats["batching"] = self.batcher.stats()
+        if self.limiter is not None:
+            stats["event_policies"] = self.limiter.stats()
+        return stats
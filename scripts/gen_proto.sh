@@ -1,5 +1,17 @@
 #!/usr/bin/env bash
 set -euo pipefail
 
-echo "proto generation placeholder"
-echo "Please wire protoc/buf generation here when codegen is required."
+ROOT_DIR="$(cd "$(dirname "$0")/.." && pwd)"
+PY_OUT="$ROOT_DIR/python-sdk/src/amonitor_sdk/_proto"
+
+# Python gencode is checked in; grpcio-tools 1.66.x emits code for protobuf>=5.27.
+echo "[proto] python -> $PY_OUT"
+mkdir -p "$PY_OUT"
+uvx --from "grpcio-tools==1.66.2" python -m grpc_tools.protoc \
+  -I "$ROOT_DIR/proto" \
+  --python_out="$PY_OUT" \
+  --pyi_out="$PY_OUT" \
+  "$ROOT_DIR/proto/control_plane.proto"
+
+echo "[proto] go generation placeholder"
+echo "Please wire protoc/buf generation here when Go codegen is required."
@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import websockets
+from websockets.exceptions import ConnectionClosed
+
+from amonitor_sdk.metrics import Histogram
+
+DUPLICATE_MESSAGE = "duplicate ignored"
+QUANTILES = (("p50", 0.50), ("p90", 0.90), ("p99", 0.99), ("p999", 0.999))
+COUNTER_NAMES = (
+    "sent",
+    "ok",
+    "failed",
+    "timeout",
+    "late",
+    "duplicates_sent",
+    "dedupe_ok",
+    "dedupe_missing",
+    "dedupe_violations",
+)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Open-loop action load generator for the panel")
+    parser.add_argument("--panel-ws", default="ws://127.0.0.1:8080/ws/panel")
+    parser.add_argument("--auth-token", help="panel bearer token (PANEL_AUTH_TOKEN)")
+    parser.add_argument("--config", help="gen_scale_config.py config to take targets from")
+    parser.add_argument(
+        "--target",
+        action="append",
+        default=[],
+        metavar="TARGET_ID=URL",
+        help="target to load; repeatable (default demo-target=ws://127.0.0.1:8765)",
+    )
+    parser.add_argument("--rate", type=float, default=100, help="actions/s across all targets")
+    parser.add_argument("--duration", type=float, default=30, help="seconds of load")
+    parser.add_argument("--arrival", choices=["uniform", "poisson"], default="uniform")
+    parser.add_argument("--timeout", type=float, default=10, help="seconds before an ack is late")
+    parser.add_argument("--connections", type=int, default=1, help="panel connections")
+    parser.add_argument("--action-name", default="restart")
+    parser.add_argument(
+        "--duplicate-ratio",
+        type=float,
+        default=0.0,
+        help="fraction of actions re-sent with the same msg_id",
+    )
+    parser.add_argument("--duplicate-delay-ms", type=float, default=0.0)
+    parser.add_argument("--report-interval", type=float, default=1.0)
+    parser.add_argument("--output", type=Path, help="write timeline and summary JSON")
+    parser.add_argument("--seed", type=int)
+    return parser
+
+
+def latency_histogram(name: str) -> Histogram:
+    # ~1% relative error between 10us and 10min, in the spirit of HdrHistogram
+    bounds = []
+    bound = 0.01
+    while bound < 600_000:
+        bounds.append(round(bound, 6))
+        bound *= 1.01
+    return Histogram(name, bounds)
+
+
+def load_targets(args: argparse.Namespace) -> list[tuple[str, str]]:
+    targets: list[tuple[str, str]] = []
+    if args.config:
+        config = json.loads(Path(args.config).read_text(encoding="utf-8"))
+        for sdk in config["sdk_instances"]:
+            url = f"ws://{sdk['host']}:{sdk['port']}{sdk.get('path', '')}"
+            targets.append((sdk["target_id"], url))
+    for spec in args.target:
+        target_id, sep, url = spec.partition("=")
+        if not sep or not target_id or not url:
+            raise ValueError(f"invalid --target: {spec}")
+        targets.append((target_id, url))
+    return targets or [("demo-target", "ws://127.0.0.1:8765")]
+
+
+@dataclass(slots=True)
+class Pending:
+    intended: float
+    duplicates: int = 0
+    duplicates_acked: int = 0
+    acked: bool = False
+
+
+@dataclass(slots=True)
+class Recorder:
+    cumulative: Histogram = field(default_factory=lambda: latency_histogram("cumulative"))
+    interval: Histogram = field(default_factory=lambda: latency_histogram("interval"))
+    counters: dict[str, int] = field(default_factory=lambda: dict.fromkeys(COUNTER_NAMES, 0))
+    reported: dict[str, int] = field(default_factory=lambda: dict.fromkeys(COUNTER_NAMES, 0))
+    max_ms: float = 0.0
+    interval_max_ms: float = 0.0
+    max_send_lag_ms: float = 0.0
+
+    def observe(self, latency_ms: float) -> None:
+        self.cumulative.observe(latency_ms)
+        self.interval.observe(latency_ms)
+        self.max_ms = max(self.max_ms, latency_ms)
+        self.interval_max_ms = max(self.interval_max_ms, latency_ms)
+
+    def roll(self, elapsed: float, in_flight: int) -> dict[str, Any]:
+        row: dict[str, Any] = {"t": round(elapsed, 3), "in_flight": in_flight}
+        for name in COUNTER_NAMES:
+            row[name] = self.counters[name] - self.reported[name]
+        row.update(quantiles(self.interval))
+        row["max_ms"] = self.interval_max_ms
+        self.reported = dict(self.counters)
+        self.interval = latency_histogram("interval")
+        self.interval_max_ms = 0.0
+        return row
+
+
+def quantiles(histogram: Histogram) -> dict[str, float]:
+    return {
+        f"{name}_ms": histogram.quantile(q) if histogram.count else 0.0 for name, q in QUANTILES
+    }
+
+
+class PanelLoad:
+    def __init__(self, websocket: Any, recorder: Recorder, args: argparse.Namespace) -> None:
+        self.websocket = websocket
+        self.recorder = recorder
+        self.args = args
+        self.pending: dict[str, Pending] = {}
+        self._deadlines: deque[tuple[float, str]] = deque()
+        self._expired: set[str] = set()
+        self._duplicates: set[asyncio.Task[None]] = set()
+
+    async def send(self, target_id: str, url: str, intended: float, duplicate: bool) -> None:
+        loop = asyncio.get_running_loop()
+        msg_id = str(uuid.uuid4())
+        envelope = {
+            "msg_id": msg_id,
+            "trace_id": str(uuid.uuid4()),
+            "type": "action",
+            "target_id": target_id,
+            "timestamp": int(time.time() * 1000),
+            "payload": {
+                "action": self.args.action_name,
+                "params": {"from": "load-actions"},
+                "target_url": url,
+            },
+        }
+        deadline = intended + self.args.timeout
+        entry = self.pending[msg_id] = Pending(intended=intended)
+        self._deadlines.append((deadline, msg_id))
+        frame = json.dumps(envelope, ensure_ascii=False)
+        await self.websocket.send(frame)
+        self.recorder.counters["sent"] += 1
+        self.recorder.max_send_lag_ms = max(
+            self.recorder.max_send_lag_ms, (loop.time() - intended) * 1000
+        )
+        if duplicate:
+            entry.duplicates += 1
+            task = asyncio.create_task(self._send_duplicate(frame))
+            self._duplicates.add(task)
+            task.add_done_callback(self._duplicates.discard)
+
+    async def _send_duplicate(self, frame: str) -> None:
+        if self.args.duplicate_delay_ms > 0:
+            await asyncio.sleep(self.args.duplicate_delay_ms / 1000)
+        await self.websocket.send(frame)
+        self.recorder.counters["duplicates_sent"] += 1
+
+    async def receive(self) -> None:
+        loop = asyncio.get_running_loop()
+        async for message in self.websocket:
+            envelope = json.loads(message)
+            msg_type = envelope.get("type")
+            if msg_type == "action_ack":
+                payload = envelope.get("payload") or {}
+                self._on_ack(
+                    payload.get("action_msg_id", ""),
+                    bool(payload.get("success")),
+                    payload.get("message") == DUPLICATE_MESSAGE,
+                    loop.time(),
+                )
+            elif msg_type == "error":
+                self._on_ack(envelope.get("msg_id", ""), False, False, loop.time())
+
+    def _on_ack(self, msg_id: str, success: bool, duplicate: bool, now: float) -> None:
+        counters = self.recorder.counters
+        entry = self.pending.get(msg_id)
+        if entry is None:
+            # acks are broadcast to every panel; only count our own expired actions
+            if msg_id in self._expired and not duplicate:
+                self._expired.discard(msg_id)
+                counters["late"] += 1
+            return
+        if duplicate:
+            if entry.duplicates_acked < entry.duplicates:
+                entry.duplicates_acked += 1
+                counters["dedupe_ok"] += 1
+            else:
+                counters["dedupe_violations"] += 1
+        elif entry.acked:
+            counters["dedupe_violations"] += 1
+        else:
+            entry.acked = True
+            counters["ok" if success else "failed"] += 1
+            self.recorder.observe((now - entry.intended) * 1000)
+        if entry.acked and entry.duplicates_acked >= entry.duplicates:
+            del self.pending[msg_id]
+
+    def expire(self, now: float) -> None:
+        counters = self.recorder.counters
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, msg_id = self._deadlines.popleft()
+            entry = self.pending.pop(msg_id, None)
+            if entry is None:
+                continue
+            if not entry.acked:
+                counters["timeout"] += 1
+                self._expired.add(msg_id)
+            counters["dedupe_missing"] += entry.duplicates - entry.duplicates_acked
+
+    async def close(self) -> None:
+        for task in self._duplicates:
+            task.cancel()
+        await asyncio.gather(*self._duplicates, return_exceptions=True)
+        await self.websocket.close()
+
+
+async def generate(
+    panels: list[PanelLoad],
+    targets: list[tuple[str, str]],
+    args: argparse.Namespace,
+    rng: random.Random,
+) -> None:
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    end = started + args.duration
+    intended = started
+    rotation = itertools.cycle(targets)
+    senders = itertools.cycle(panels)
+    while intended < end:
+        delay = intended - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        target_id, url = next(rotation)
+        duplicate = args.duplicate_ratio > 0 and rng.random() < args.duplicate_ratio
+        await next(senders).send(target_id, url, intended, duplicate)
+        if args.arrival == "poisson":
+            intended += rng.expovariate(args.rate)
+        else:
+            intended += 1 / args.rate
+
+
+def format_row(row: dict[str, Any]) -> str:
+    return (
+        f"[load] t={row['t']:>7.1f}s sent={row['sent']:<6} ok={row['ok']:<6} "
+        f"failed={row['failed']:<4} timeout={row['timeout']:<4} in_flight={row['in_flight']:<5} "
+        f"p50={row['p50_ms']:.2f} p90={row['p90_ms']:.2f} p99={row['p99_ms']:.2f} "
+        f"p999={row['p999_ms']:.2f} max={row['max_ms']:.2f}ms"
+        + (
+            f" dup_sent={row['duplicates_sent']} dedupe_ok={row['dedupe_ok']}"
+            f" violations={row['dedupe_violations']}"
+            if row["duplicates_sent"] or row["dedupe_violations"]
+            else ""
+        )
+    )
+
+
+async def report_loop(
+    panels: list[PanelLoad],
+    recorder: Recorder,
+    timeline: list[dict[str, Any]],
+    interval: float,
+) -> None:
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    next_report = started + interval
+    while True:
+        await asyncio.sleep(min(0.05, interval))
+        now = loop.time()
+        for panel in panels:
+            panel.expire(now)
+        if now >= next_report:
+            next_report += interval
+            row = recorder.roll(now - started, sum(len(panel.pending) for panel in panels))
+            timeline.append(row)
+            print(format_row(row), flush=True)
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    targets = load_targets(args)
+    rng = random.Random(args.seed)
+    recorder = Recorder()
+    headers = {"Authorization": f"Bearer {args.auth_token}"} if args.auth_token else None
+    panels = [
+        PanelLoad(
+            await websockets.connect(args.panel_ws, additional_headers=headers, max_size=None),
+            recorder,
+            args,
+        )
+        for _ in range(args.connections)
+    ]
+    print(
+        f"[load] {args.rate:g} actions/s ({args.arrival}) for {args.duration:g}s "
+        f"across {len(targets)} targets on {len(panels)} panel connection(s)",
+        flush=True,
+    )
+    timeline: list[dict[str, Any]] = []
+    receivers = [asyncio.create_task(panel.receive()) for panel in panels]
+    reporter = asyncio.create_task(report_loop(panels, recorder, timeline, args.report_interval))
+    try:
+        await generate(panels, targets, args, rng)
+        loop = asyncio.get_running_loop()
+        drain_until = loop.time() + args.timeout
+        while any(panel.pending for panel in panels) and loop.time() < drain_until:
+            if any(receiver.done() for receiver in receivers):
+                break
+            await asyncio.sleep(0.05)
+        for panel in panels:
+            panel.expire(float("inf"))
+    except ConnectionClosed as exc:
+        print(f"[load] panel connection closed: {exc}", flush=True)
+    finally:
+        reporter.cancel()
+        for panel in panels:
+            await panel.close()
+        await asyncio.gather(reporter, *receivers, return_exceptions=True)
+
+    summary: dict[str, Any] = dict(recorder.counters)
+    summary.update(quantiles(recorder.cumulative))
+    summary["max_ms"] = recorder.max_ms
+    summary["max_send_lag_ms"] = recorder.max_send_lag_ms
+    summary["achieved_rate"] = recorder.counters["sent"] / args.duration
+    return {
+        "config": {
+            "panel_ws": args.panel_ws,
+            "rate": args.rate,
+            "arrival": args.arrival,
+            "duration": args.duration,
+            "timeout": args.timeout,
+            "connections": args.connections,
+            "targets": len(targets),
+            "duplicate_ratio": args.duplicate_ratio,
+        },
+        "timeline": timeline,
+        "summary": summary,
+    }
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+    if args.rate <= 0:
+        raise ValueError("rate must be > 0")
+    if args.connections < 1:
+        raise ValueError("connections must be >= 1")
+    report = asyncio.run(run(args))
+    summary = report["summary"]
+    print(
+        f"[load] total sent={summary['sent']} ok={summary['ok']} failed={summary['failed']} "
+        f"timeout={summary['timeout']} late={summary['late']} "
+        f"p50={summary['p50_ms']:.2f} p90={summary['p90_ms']:.2f} p99={summary['p99_ms']:.2f} "
+        f"p999={summary['p999_ms']:.2f} max={summary['max_ms']:.2f}ms "
+        f"max_send_lag={summary['max_send_lag_ms']:.2f}ms",
+        flush=True,
+    )
+    if summary["duplicates_sent"]:
+        print(
+            f"[load] dedupe duplicates_sent={summary['duplicates_sent']} "
+            f"dedupe_ok={summary['dedupe_ok']} missing={summary['dedupe_missing']} "
+            f"violations={summary['dedupe_violations']}",
+            flush=True,
+        )
+    if args.output is not None:
+        args.output.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
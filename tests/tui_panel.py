@@ -1,18 +1,35 @@
 from __future__ import annotations
 
+import argparse
 import asyncio
+import itertools
 import json
 import time
 import uuid
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
 
+from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Vertical
-from textual.widgets import Footer, Header, Input, RichLog
+from textual.widgets import DataTable, Footer, Header, Input, RichLog, Static
 from websockets.asyncio.client import connect as ws_connect
 from websockets.exceptions import ConnectionClosed
 
+RECV_YIELD_EVERY = 256
+SPARK_BLOCKS = "▁▂▃▄▅▆▇█"
+DASHBOARD_COLUMNS = (
+    ("target", "目标", 24),
+    ("health", "状态", 8),
+    ("heartbeat", "心跳", 8),
+    ("events", "事件/s", 8),
+    ("latency", "ack 延迟", 10),
+    ("failures", "失败率", 12),
+    ("metric", "指标", 36),
+)
+
 
 @dataclass
 class ConnectionState:
@@ -20,33 +37,467 @@ class ConnectionState:
     connected: bool = False
 
 
+@dataclass(slots=True, eq=False)
+class LogLine:
+    seq: int
+    clock: str
+    kind: str
+    body: str
+    msg_type: str | None = None
+    target_id: str | None = None
+    payload: Any = None
+    count: int = 1
+
+    def render(self) -> str:
+        text = f"[{self.clock}] [{self.kind}] {self.body}"
+        return text if self.count == 1 else f"{text}  (x{self.count})"
+
+
+@dataclass(slots=True)
+class LineFilter:
+    msg_type: str | None = None
+    target_id: str | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.msg_type is not None or self.target_id is not None
+
+    def matches(self, line: LogLine) -> bool:
+        if line.kind != "RECV":
+            return True
+        if self.msg_type is not None and line.msg_type != self.msg_type:
+            return False
+        return self.target_id is None or line.target_id == self.target_id
+
+    def describe(self) -> str:
+        parts = []
+        if self.msg_type is not None:
+            parts.append(f"type={self.msg_type}")
+        if self.target_id is not None:
+            parts.append(f"target={self.target_id}")
+        return " ".join(parts) or "无"
+
+
+class LineBuffer:
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self.lines: deque[LogLine] = deque(maxlen=capacity)
+        self.pending: list[LogLine] = []
+        self.received = 0
+        self.collapsed = 0
+        self._seq = itertools.count()
+        self._by_type: dict[str, deque[LogLine]] = {}
+        self._by_target: dict[str, deque[LogLine]] = {}
+        self._open: dict[tuple[str, str | None, str | None], LogLine] = {}
+        self._since_prune = 0
+
+    def add(
+        self,
+        kind: str,
+        body: str,
+        msg_type: str | None = None,
+        target_id: str | None = None,
+        payload: Any = None,
+    ) -> None:
+        clock = time.strftime("%H:%M:%S")
+        key = (kind, msg_type, target_id)
+        if kind == "RECV":
+            self.received += 1
+            line = self._open.get(key)
+            if line is not None and line.payload == payload:
+                line.count += 1
+                line.clock = clock
+                line.body = body
+                self.collapsed += 1
+                return
+        line = LogLine(
+            seq=next(self._seq),
+            clock=clock,
+            kind=kind,
+            body=body,
+            msg_type=msg_type,
+            target_id=target_id,
+            payload=payload,
+        )
+        self.lines.append(line)
+        self.pending.append(line)
+        if kind == "RECV":
+            self._open[key] = line
+        if msg_type is not None:
+            self._index(self._by_type, msg_type, line)
+        if target_id is not None:
+            self._index(self._by_target, target_id, line)
+        self._since_prune += 1
+        if self._since_prune >= self.capacity:
+            self._prune()
+
+    def _index(self, index: dict[str, deque[LogLine]], key: str, line: LogLine) -> None:
+        lines = index.get(key)
+        if lines is None:
+            lines = index[key] = deque(maxlen=self.capacity)
+        lines.append(line)
+
+    def _prune(self) -> None:
+        self._since_prune = 0
+        oldest = self.lines[0].seq
+        for index in (self._by_type, self._by_target):
+            for key in list(index):
+                lines = index[key]
+                while lines and lines[0].seq < oldest:
+                    lines.popleft()
+                if not lines:
+                    del index[key]
+
+    def take_frame(self) -> list[LogLine]:
+        pending, self.pending = self.pending, []
+        self._open.clear()
+        return pending
+
+    def tail(self, line_filter: LineFilter, limit: int) -> list[LogLine]:
+        source: deque[LogLine] = self.lines
+        if line_filter.active:
+            candidates = []
+            if line_filter.msg_type is not None:
+                candidates.append(self._by_type.get(line_filter.msg_type, deque()))
+            if line_filter.target_id is not None:
+                candidates.append(self._by_target.get(line_filter.target_id, deque()))
+            source = min(candidates, key=len)
+        oldest = self.lines[0].seq if self.lines else 0
+        selected: list[LogLine] = []
+        for line in reversed(source):
+            if line.seq < oldest or len(selected) >= limit:
+                break
+            if line_filter.matches(line):
+                selected.append(line)
+        selected.reverse()
+        return selected
+
+    def clear(self) -> None:
+        self.lines.clear()
+        self.pending = []
+        self._by_type.clear()
+        self._by_target.clear()
+        self._open.clear()
+
+
+class RollingCounter:
+    __slots__ = ("counts", "stamps")
+
+    def __init__(self, buckets: int) -> None:
+        self.counts = [0.0] * buckets
+        self.stamps = [-1] * buckets
+
+    def add(self, now: float, amount: float = 1) -> None:
+        second = int(now)
+        index = second % len(self.stamps)
+        if self.stamps[index] != second:
+            self.stamps[index] = second
+            self.counts[index] = 0.0
+        self.counts[index] += amount
+
+    def total(self, now: float) -> float:
+        oldest = int(now) - len(self.stamps)
+        return sum(
+            count for count, stamp in zip(self.counts, self.stamps, strict=True) if stamp > oldest
+        )
+
+
+@dataclass(slots=True, eq=False)
+class TargetState:
+    target_id: str
+    events: RollingCounter
+    acks: RollingCounter
+    failures: RollingCounter
+    latency_total: RollingCounter
+    latency_count: RollingCounter
+    spark: deque[float]
+    status: str = "?"
+    last_heartbeat: float | None = None
+    heartbeat_gap: float | None = None
+    metrics: dict[str, Any] = field(default_factory=dict)
+    metric_name: str | None = None
+    rendered: tuple[str, ...] | None = None
+
+
+def metric_number(value: Any) -> float | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int | float):
+        return float(value)
+    if isinstance(value, dict) and isinstance(value.get("count"), int | float):
+        count = value["count"]
+        return float(value.get("sum", 0)) / count if count else 0.0
+    return None
+
+
+def sparkline(values: deque[float]) -> str:
+    if not values:
+        return ""
+    low = min(values)
+    span = max(values) - low
+    if span <= 0:
+        return SPARK_BLOCKS[0] * len(values)
+    top = len(SPARK_BLOCKS) - 1
+    return "".join(SPARK_BLOCKS[round((value - low) / span * top)] for value in values)
+
+
+class Dashboard:
+    def __init__(
+        self,
+        window: int = 10,
+        spark_points: int = 24,
+        spark_metric: str | None = None,
+        stale_after: float = 30.0,
+        failure_alert: float = 0.2,
+        max_pending_actions: int = 10000,
+    ) -> None:
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        self.window = window
+        self.spark_points = spark_points
+        self.spark_metric = spark_metric
+        self.stale_after = stale_after
+        self.failure_alert = failure_alert
+        self.max_pending_actions = max_pending_actions
+        self.targets: dict[str, TargetState] = {}
+        self.dirty: dict[str, None] = {}
+        self._sent: dict[str, tuple[str | None, float]] = {}
+
+    def _state(self, target_id: str) -> TargetState:
+        state = self.targets.get(target_id)
+        if state is None:
+            state = self.targets[target_id] = TargetState(
+                target_id=target_id,
+                events=RollingCounter(self.window),
+                acks=RollingCounter(self.window),
+                failures=RollingCounter(self.window),
+                latency_total=RollingCounter(self.window),
+                latency_count=RollingCounter(self.window),
+                spark=deque(maxlen=self.spark_points),
+            )
+        return state
+
+    def action_sent(self, msg_id: str, target_id: str | None, now: float) -> None:
+        if len(self._sent) >= self.max_pending_actions:
+            del self._sent[next(iter(self._sent))]
+        self._sent[msg_id] = (target_id, now)
+
+    def observe(
+        self,
+        msg_type: Any,
+        target_id: Any,
+        payload: Any,
+        msg_id: Any,
+        now: float,
+    ) -> None:
+        if not isinstance(payload, dict):
+            payload = {}
+        if msg_type == "error":
+            sent = self._sent.pop(msg_id, None) if isinstance(msg_id, str) else None
+            if sent is None or sent[0] is None:
+                return
+            target_id = sent[0]
+            msg_type = "action_failed"
+        if not isinstance(target_id, str) or not target_id:
+            return
+        state = self._state(target_id)
+        if msg_type == "heartbeat":
+            self._heartbeat(state, payload, now)
+        elif msg_type == "event":
+            state.events.add(now)
+        elif msg_type == "event_batch":
+            events = payload.get("events")
+            state.events.add(now, len(events) if isinstance(events, list) else 1)
+        elif msg_type == "action_ack":
+            state.acks.add(now)
+            if not payload.get("success"):
+                state.failures.add(now)
+            sent = self._sent.pop(payload.get("action_msg_id"), None)
+            if sent is not None:
+                state.latency_total.add(now, (now - sent[1]) * 1000)
+                state.latency_count.add(now)
+        elif msg_type == "action_failed":
+            state.acks.add(now)
+            state.failures.add(now)
+        else:
+            return
+        self.dirty[target_id] = None
+
+    def _heartbeat(self, state: TargetState, payload: dict[str, Any], now: float) -> None:
+        if state.last_heartbeat is not None:
+            gap = now - state.last_heartbeat
+            previous = state.heartbeat_gap
+            state.heartbeat_gap = gap if previous is None else previous * 0.8 + gap * 0.2
+        state.last_heartbeat = now
+        state.status = str(payload.get("status", state.status))
+        metrics = payload.get("metrics")
+        if not isinstance(metrics, dict):
+            return
+        if payload.get("metrics_mode") == "delta":
+            state.metrics.update(metrics)
+        else:
+            state.metrics = metrics
+        if state.metric_name is None:
+            state.metric_name = self.spark_metric or next(
+                (name for name in sorted(metrics) if metric_number(metrics[name]) is not None),
+                None,
+            )
+        value = metric_number(state.metrics.get(state.metric_name))
+        if value is not None:
+            state.spark.append(value)
+
+    def take_dirty(self, limit: int) -> list[str]:
+        taken = list(itertools.islice(self.dirty, limit))
+        for target_id in taken:
+            del self.dirty[target_id]
+        return taken
+
+    def health(self, state: TargetState, now: float) -> str:
+        if state.status == "down":
+            return "down"
+        if state.last_heartbeat is None:
+            return "?"
+        stale_after = self.stale_after
+        if state.heartbeat_gap is not None:
+            stale_after = max(state.heartbeat_gap * 3, 1.0)
+        if now - state.last_heartbeat > stale_after:
+            return "stale"
+        acks = state.acks.total(now)
+        if acks and state.failures.total(now) / acks >= self.failure_alert:
+            return "failing"
+        return state.status
+
+    def row(self, state: TargetState, now: float) -> tuple[str, ...]:
+        heartbeat = "-"
+        if state.last_heartbeat is not None:
+            heartbeat = f"{now - state.last_heartbeat:.0f}s"
+        acks = state.acks.total(now)
+        failures = f"{state.failures.total(now) / acks:.0%} ({acks:.0f})" if acks else "-"
+        timed = state.latency_count.total(now)
+        latency = f"{state.latency_total.total(now) / timed:.1f}ms" if timed else "-"
+        metric = ""
+        if state.metric_name is not None and state.spark:
+            metric = f"{state.metric_name} {state.spark[-1]:g} {sparkline(state.spark)}"
+        return (
+            state.target_id,
+            self.health(state, now),
+            heartbeat,
+            f"{state.events.total(now) / self.window:.1f}",
+            latency,
+            failures,
+            metric,
+        )
+
+    def summary(self, now: float) -> dict[str, int]:
+        counts = {"targets": len(self.targets), "down": 0, "stale": 0, "failing": 0}
+        for state in self.targets.values():
+            health = self.health(state, now)
+            if health in counts:
+                counts[health] += 1
+        return counts
+
+    def clear(self) -> None:
+        self.targets.clear()
+        self.dirty.clear()
+        self._sent.clear()
+
+
+@dataclass(slots=True)
+class FrameStats:
+    recv_rate: float = 0.0
+    loop_lag_ms: float = 0.0
+    max_age_ms: float = 0.0
+    skipped: int = 0
+    window_received: int = 0
+    window_started: float = field(default_factory=time.monotonic)
+
+
 class AgentTUIPanel(App[None]):
     TITLE = "AMonitor TUI Panel"
     SUB_TITLE = "Textual WebSocket Panel"
 
+    CSS = """
+    #dashboard {
+        display: none;
+    }
+
+    #status {
+        height: 1;
+        padding: 0 1;
+        background: $boost;
+    }
+    """
+
     BINDINGS = [
         Binding("ctrl+c", "quit", "Quit"),
         Binding("ctrl+l", "clear_log", "Clear Log"),
+        Binding("ctrl+d", "toggle_dashboard", "Dashboard"),
     ]
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        url: str | None = None,
+        history: int = 10000,
+        fps: float = 10,
+        max_frame_lines: int = 200,
+        max_rendered: int = 2000,
+        dashboard: Dashboard | None = None,
+        max_row_updates: int = 500,
+        max_new_rows: int = 100,
+    ) -> None:
         super().__init__()
         self._ws = None
         self._recv_task: asyncio.Task[None] | None = None
         self._state = ConnectionState()
+        self._initial_url = url
+        self._buffer = LineBuffer(history)
+        self._filter = LineFilter()
+        self._frame_interval = 1 / fps
+        self._max_frame_lines = max_frame_lines
+        self._max_rendered = max_rendered
+        self._frame = FrameStats()
+        self._last_frame = 0.0
+        self._log: RichLog | None = None
+        self._status: Static | None = None
+        self._dashboard = dashboard or Dashboard()
+        self._max_row_updates = max_row_updates
+        self._max_new_rows = max_new_rows
+        self._table: DataTable | None = None
+        self._rows: list[str] = []
+        self._summary: dict[str, int] = {}
+        self._summary_at = 0.0
 
     def compose(self) -> ComposeResult:
         yield Header()
         with Vertical():
-            yield RichLog(id="log", wrap=True, markup=False, highlight=True)
+            yield RichLog(
+                id="log",
+                wrap=True,
+                markup=False,
+                highlight=True,
+                max_lines=self._max_rendered,
+            )
+            yield DataTable(id="dashboard", cursor_type="row")
             yield Input(
-                placeholder="输入命令：/connect ws://127.0.0.1:8080/ws/panel | /disconnect | /chat 你好 | /send {\"type\":\"ping\"}",
+                placeholder="输入命令：/connect ws://127.0.0.1:8080/ws/panel | /disconnect | /chat 你好 | /send {\"type\":\"ping\"} | /filter type=heartbeat target=demo-target-01 | /dashboard",
                 id="command",
             )
+            yield Static(id="status")
         yield Footer()
 
     def on_mount(self) -> None:
-        self._log_info("TUI 已启动。可用命令：/connect /disconnect /chat /send")
+        self._log = self.query_one("#log", RichLog)
+        self._status = self.query_one("#status", Static)
+        self._table = self.query_one("#dashboard", DataTable)
+        for key, label, width in DASHBOARD_COLUMNS:
+            self._table.add_column(label, key=key, width=width)
+        self._last_frame = time.monotonic()
+        self.set_interval(self._frame_interval, self._render_frame)
+        self._log_info("TUI 已启动。可用命令：/connect /disconnect /chat /send /filter /dashboard")
+        if self._initial_url:
+            self.run_worker(self._connect(self._initial_url), exclusive=False)
 
     async def on_input_submitted(self, event: Input.Submitted) -> None:
         raw = event.value.strip()
@@ -57,8 +508,29 @@ class AgentTUIPanel(App[None]):
         await self._handle_command(raw)
 
     def action_clear_log(self) -> None:
-        log = self.query_one("#log", RichLog)
-        log.clear()
+        self._buffer.clear()
+        if self._log is not None:
+            self._log.clear()
+
+    def action_toggle_dashboard(self) -> None:
+        if self._log is None or self._table is None:
+            return
+        showing = not self._table.display
+        self._table.display = showing
+        self._log.display = not showing
+        if showing:
+            self._summary_at = 0.0
+            self._render_dashboard(time.monotonic())
+            self._table.focus()
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+        target_id = event.row_key.value
+        if target_id is None:
+            return
+        self.action_toggle_dashboard()
+        self._filter = LineFilter(target_id=target_id)
+        self._redraw()
+        self._log_info(f"过滤条件: {self._filter.describe()}")
 
     async def on_unmount(self) -> None:
         await self._disconnect()
@@ -80,6 +552,14 @@ class AgentTUIPanel(App[None]):
             await self._cmd_send(raw)
             return
 
+        if raw.startswith("/filter"):
+            self._cmd_filter(raw)
+            return
+
+        if raw == "/dashboard":
+            self.action_toggle_dashboard()
+            return
+
         self._log_error(f"未知命令: {raw}")
 
     async def _cmd_connect(self, raw: str) -> None:
@@ -121,12 +601,38 @@ class AgentTUIPanel(App[None]):
             return
 
         compact = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
-        await self._send_text(compact)
+        if not await self._send_text(compact) or not isinstance(payload, dict):
+            return
+        if payload.get("type") == "action" and isinstance(payload.get("msg_id"), str):
+            self._dashboard.action_sent(payload["msg_id"], payload.get("target_id"), time.monotonic())
+
+    def _cmd_filter(self, raw: str) -> None:
+        line_filter = LineFilter()
+        for part in raw[len("/filter") :].split():
+            name, sep, value = part.partition("=")
+            if not sep or not value or name not in ("type", "target"):
+                self._log_error("用法: /filter [type=heartbeat] [target=demo-target-01]（不带参数清除过滤）")
+                return
+            if name == "type":
+                line_filter.msg_type = value
+            else:
+                line_filter.target_id = value
+        self._filter = line_filter
+        self._redraw()
+        self._log_info(f"过滤条件: {line_filter.describe()}")
+
+    def _redraw(self) -> None:
+        if self._log is None:
+            return
+        self._buffer.take_frame()
+        self._log.clear()
+        for line in self._buffer.tail(self._filter, self._max_rendered):
+            self._log.write(line.render())
 
     async def _connect(self, url: str) -> None:
         await self._disconnect()
         try:
-            self._ws = await ws_connect(url)
+            self._ws = await ws_connect(url, max_size=None)
         except Exception as exc:
             self._log_error(f"连接失败: {url} ({exc})")
             return
@@ -137,13 +643,13 @@ class AgentTUIPanel(App[None]):
         self._recv_task = asyncio.create_task(self._recv_loop())
 
     async def _disconnect(self) -> None:
-        if self._recv_task:
+        if self._recv_task and self._recv_task is not asyncio.current_task():
             self._recv_task.cancel()
             try:
                 await self._recv_task
             except asyncio.CancelledError:
                 pass
-            self._recv_task = None
+        self._recv_task = None
 
         if self._ws is not None:
             try:
@@ -158,56 +664,180 @@ class AgentTUIPanel(App[None]):
         self._state = ConnectionState()
 
     async def _recv_loop(self) -> None:
+        received = 0
         try:
             while self._ws is not None:
                 message = await self._ws.recv()
                 self._log_recv(message)
+                received += 1
+                if received % RECV_YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
         except ConnectionClosed as exc:
             self._log_warn(f"连接关闭: code={exc.code} reason={exc.reason}")
         except asyncio.CancelledError:
             return
         except Exception as exc:
             self._log_error(f"接收异常: {exc}")
-        finally:
-            await self._disconnect()
+        await self._disconnect()
 
     async def _send_json(self, payload: dict) -> None:
         compact = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
         await self._send_text(compact)
 
-    async def _send_text(self, body: str) -> None:
+    async def _send_text(self, body: str) -> bool:
         if self._ws is None or not self._state.connected:
             self._log_error("尚未连接，请先执行 /connect")
-            return
+            return False
 
         try:
             await self._ws.send(body)
             self._log_send(body)
         except Exception as exc:
             self._log_error(f"发送失败: {exc}")
+            return False
+        return True
+
+    def _render_frame(self) -> None:
+        now = time.monotonic()
+        frame = self._frame
+        frame.loop_lag_ms = max(0.0, (now - self._last_frame - self._frame_interval) * 1000)
+        self._last_frame = now
+        lines = [line for line in self._buffer.take_frame() if self._filter.matches(line)]
+        if len(lines) > self._max_frame_lines:
+            frame.skipped += len(lines) - self._max_frame_lines
+            lines = lines[-self._max_frame_lines :]
+        if self._log is not None:
+            for line in lines:
+                self._log.write(line.render())
+        if self._table is not None and self._table.display:
+            self._render_dashboard(now)
+        elapsed = now - frame.window_started
+        if elapsed >= 1:
+            frame.recv_rate = (self._buffer.received - frame.window_received) / elapsed
+            frame.window_received = self._buffer.received
+            frame.window_started = now
+        self._update_status()
+
+    def _render_dashboard(self, now: float) -> None:
+        table = self._table
+        if table is None:
+            return
+        dashboard = self._dashboard
+        top = int(table.scroll_offset.y)
+        visible = self._rows[top : top + max(table.size.height, 1)]
+        added = 0
+        for target_id in itertools.chain(visible, dashboard.take_dirty(self._max_row_updates)):
+            state = dashboard.targets.get(target_id)
+            if state is None:
+                continue
+            cells = dashboard.row(state, now)
+            rendered = state.rendered
+            if rendered is None:
+                if added >= self._max_new_rows:
+                    dashboard.dirty[target_id] = None
+                    continue
+                table.add_row(*map(Text, cells), key=target_id)
+                self._rows.append(target_id)
+                added += 1
+            else:
+                for (key, _, _), old, new in zip(DASHBOARD_COLUMNS, rendered, cells, strict=True):
+                    if old != new:
+                        table.update_cell(target_id, key, Text(new))
+            state.rendered = cells
+        if now - self._summary_at >= 1:
+            self._summary = dashboard.summary(now)
+            self._summary_at = now
+
+    def _update_status(self) -> None:
+        if self._status is None:
+            return
+        frame = self._frame
+        buffer = self._buffer
+        state = self._state.url if self._state.connected else "未连接"
+        self._status.update(
+            f"{state} | recv {frame.recv_rate:.0f}/s | 延迟 {frame.max_age_ms:.0f}ms"
+            f" | 循环滞后 {frame.loop_lag_ms:.0f}ms | 缓冲 {len(buffer.lines)}/{buffer.capacity}"
+            f" | 合并 {buffer.collapsed} | 跳过 {frame.skipped} | 过滤 {self._filter.describe()}"
+            + self._describe_summary()
+        )
+        frame.max_age_ms = 0.0
+
+    def _describe_summary(self) -> str:
+        if self._table is None or not self._table.display or not self._summary:
+            return ""
+        summary = self._summary
+        return (
+            f" | 目标 {summary['targets']} | 下线 {summary['down']} | 失联 {summary['stale']}"
+            f" | 失败 {summary['failing']} | 待刷新 {len(self._dashboard.dirty)}"
+        )
 
     def _log_info(self, message: str) -> None:
-        self.query_one("#log", RichLog).write(f"[{self._now()}] [INFO] {message}")
+        self._buffer.add("INFO", message)
 
     def _log_warn(self, message: str) -> None:
-        self.query_one("#log", RichLog).write(f"[{self._now()}] [WARN] {message}")
+        self._buffer.add("WARN", message)
 
     def _log_error(self, message: str) -> None:
-        self.query_one("#log", RichLog).write(f"[{self._now()}] [ERROR] {message}")
+        self._buffer.add("ERROR", message)
 
     def _log_send(self, body: str) -> None:
-        self.query_one("#log", RichLog).write(f"[{self._now()}] [SEND] {body}")
+        self._buffer.add("SEND", body)
 
-    def _log_recv(self, body: str) -> None:
-        self.query_one("#log", RichLog).write(f"[{self._now()}] [RECV] {body}")
-
-    @staticmethod
-    def _now() -> str:
-        return time.strftime("%H:%M:%S")
+    def _log_recv(self, body: str | bytes) -> None:
+        if isinstance(body, bytes):
+            self._buffer.add("RECV", f"<binary {len(body)} bytes>")
+            return
+        try:
+            envelope = json.loads(body)
+        except json.JSONDecodeError:
+            self._buffer.add("RECV", body)
+            return
+        if not isinstance(envelope, dict):
+            self._buffer.add("RECV", body)
+            return
+        payload = envelope.get("payload")
+        target_id = envelope.get("target_id")
+        if target_id is None and isinstance(payload, dict):
+            target_id = payload.get("target_id")
+        timestamp = envelope.get("timestamp")
+        if isinstance(timestamp, int) and timestamp > 0:
+            age = time.time() * 1000 - timestamp
+            self._frame.max_age_ms = max(self._frame.max_age_ms, age)
+        msg_type = envelope.get("type")
+        self._dashboard.observe(
+            msg_type, target_id, payload, envelope.get("msg_id"), time.monotonic()
+        )
+        self._buffer.add("RECV", body, msg_type, target_id, payload)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="AMonitor Textual panel")
+    parser.add_argument("--url", help="connect to this panel websocket on start")
+    parser.add_argument("--history", type=int, default=10000, help="ring buffer size in lines")
+    parser.add_argument("--fps", type=float, default=10, help="log render rate")
+    parser.add_argument("--max-frame-lines", type=int, default=200, help="lines drawn per frame")
+    parser.add_argument("--window", type=int, default=10, help="dashboard rolling window (s)")
+    parser.add_argument("--spark-metric", help="heartbeat metric drawn as a sparkline")
+    parser.add_argument(
+        "--max-row-updates", type=int, default=500, help="dashboard rows refreshed per frame"
+    )
+    parser.add_argument(
+        "--max-new-rows", type=int, default=100, help="dashboard rows added per frame"
+    )
+    return parser
 
 
 def main() -> None:
-    AgentTUIPanel().run()
+    args = build_parser().parse_args()
+    AgentTUIPanel(
+        url=args.url,
+        history=args.history,
+        fps=args.fps,
+        max_frame_lines=args.max_frame_lines,
+        dashboard=Dashboard(window=args.window, spark_metric=args.spark_metric),
+        max_row_updates=args.max_row_updates,
+        max_new_rows=args.max_new_rows,
+    ).run()
 
 
 if __name__ == "__main__":